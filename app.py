@@ -11,9 +11,15 @@ st.set_page_config(
 
 # Importing indicators triggers auto-registration via indicators/__init__.py
 import indicators  # noqa: F401, E402
+from indicators._utils import start_reference_prefetch  # noqa: E402
 
 from ui import page_predict, page_backtest, page_explore  # noqa: E402
 from ui import page_search, page_compare, page_screener  # noqa: E402
+from ui.components import cache_diagnostics  # noqa: E402
+
+# Warm cross-asset reference data in the background so the first
+# prediction doesn't wait on ~15 sequential downloads
+start_reference_prefetch()
 
 # Sidebar navigation
 st.sidebar.title("AutoCapital")
@@ -38,3 +44,7 @@ elif page == "Compare":
     page_compare.render()
 elif page == "Screener":
     page_screener.render()
+
+# Shared-cache health at the bottom of the sidebar, below the page's controls
+with st.sidebar:
+    cache_diagnostics()
@@ -0,0 +1,219 @@
+"""Bootstrap confidence intervals for a backtest's return, Sharpe and drawdown.
+
+A backtest is one draw from many histories that could have happened.
+Two resampling schemes estimate how much its metrics could vary:
+
+- ``bootstrap_trades`` resamples the trade returns with replacement, i.e.
+  the same edge in a different order and mix.
+- ``bootstrap_price_paths`` rebuilds the price history from blocks of its
+  own bar returns (a moving-block bootstrap, which keeps short-range
+  autocorrelation) and replays the strategy's trades on each synthetic
+  path, i.e. the same timing on a market that moved differently.
+
+Resamples are evaluated as (resamples x trades) matrices in batches, so
+thousands of them take a fraction of a second.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from backtesting.report import BacktestReport
+from config.settings import (
+    BOOTSTRAP_BLOCK_BARS,
+    BOOTSTRAP_CONFIDENCE,
+    BOOTSTRAP_RESAMPLES,
+    DEFAULT_COST_PER_TRADE_PCT,
+)
+
+BOOTSTRAP_METRICS = ("cumulative_return", "sharpe_ratio", "max_drawdown")
+
+# Upper bound on matrix elements per batch (~16 MB of float64)
+_BATCH_ELEMENTS = 2_000_000
+
+
+@dataclass
+class BootstrapResult:
+    """Resampled metric distributions of a backtest."""
+
+    method: str  # "trades" or "price_path"
+    n_resamples: int
+    confidence: float
+    observed: dict[str, float]  # metric values of the actual backtest
+    cumulative_return: np.ndarray  # one value per resample
+    sharpe_ratio: np.ndarray
+    max_drawdown: np.ndarray
+
+    def interval(self, metric: str) -> tuple[float, float]:
+        """Central *confidence* interval of a metric (percentile method)."""
+        tail = (1 - self.confidence) / 2 * 100
+        low, high = np.percentile(getattr(self, metric), [tail, 100 - tail])
+        return float(low), float(high)
+
+    @property
+    def probability_of_loss(self) -> float:
+        """Share of resamples that end with a negative cumulative return."""
+        return float(np.mean(self.cumulative_return < 0))
+
+    def summary(self) -> pd.DataFrame:
+        """One row per metric: observed value, median and interval bounds."""
+        rows = []
+        for metric in BOOTSTRAP_METRICS:
+            low, high = self.interval(metric)
+            rows.append({
+                "metric": metric,
+                "observed": self.observed[metric],
+                "median": float(np.median(getattr(self, metric))),
+                "low": low,
+                "high": high,
+            })
+        return pd.DataFrame(rows).set_index("metric")
+
+
+def _path_metrics(
+    returns: np.ndarray, horizon_days: int, is_crypto: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """compute_metrics()' return, Sharpe and drawdown for each row of trade returns."""
+    growth = np.cumprod(1 + returns, axis=1)
+    cumulative_return = growth[:, -1] - 1
+
+    # The equity curve starts at 1 (the initial capital) before the first trade
+    peak = np.maximum(np.maximum.accumulate(growth, axis=1), 1.0)
+    max_drawdown = np.maximum(np.max((peak - growth) / peak, axis=1), 0.0)
+
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1)
+    periods_per_year = (365 if is_crypto else 252) / horizon_days
+    sharpe_ratio = np.zeros(len(returns))
+    if returns.shape[1] > 1:
+        np.divide(mean, std, out=sharpe_ratio, where=std > 0)
+        sharpe_ratio *= np.sqrt(periods_per_year)
+    return cumulative_return, sharpe_ratio, max_drawdown
+
+
+def _observed(report: BacktestReport) -> dict[str, float]:
+    return {metric: float(getattr(report, metric)) for metric in BOOTSTRAP_METRICS}
+
+
+def _trade_pnl(report: BacktestReport) -> np.ndarray:
+    if report.trade_arrays is not None:
+        return report.trade_arrays.pnl_pct
+    return np.array([t.pnl_pct for t in report.trades], dtype=float)
+
+
+def _run_batches(
+    n_resamples: int,
+    width: int,
+    draw_returns,
+    report: BacktestReport,
+    method: str,
+    confidence: float,
+) -> BootstrapResult:
+    """Evaluate ``draw_returns(batch_size)`` batches until n_resamples rows are done."""
+    batch = max(1, _BATCH_ELEMENTS // max(1, width))
+    parts = []
+    for start in range(0, n_resamples, batch):
+        returns = draw_returns(min(batch, n_resamples - start))
+        parts.append(_path_metrics(returns, report.horizon_days, report.is_crypto))
+    cumulative_return, sharpe_ratio, max_drawdown = (np.concatenate(p) for p in zip(*parts))
+    return BootstrapResult(
+        method=method,
+        n_resamples=n_resamples,
+        confidence=confidence,
+        observed=_observed(report),
+        cumulative_return=cumulative_return,
+        sharpe_ratio=sharpe_ratio,
+        max_drawdown=max_drawdown,
+    )
+
+
+def bootstrap_trades(
+    report: BacktestReport,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = BOOTSTRAP_CONFIDENCE,
+    seed: int | None = None,
+) -> BootstrapResult:
+    """Resample a single-ticker backtest's trade returns with replacement.
+
+    Each resample draws as many trades as the backtest made and compounds
+    them in the drawn order, as compute_metrics() does.
+
+    Raises:
+        ValueError: if the report has no trades.
+    """
+    pnl = _trade_pnl(report)
+    if len(pnl) == 0:
+        raise ValueError("Cannot bootstrap a backtest with no trades.")
+    rng = np.random.default_rng(seed)
+
+    def draw(size: int) -> np.ndarray:
+        return pnl[rng.integers(0, len(pnl), size=(size, len(pnl)))]
+
+    return _run_batches(n_resamples, len(pnl), draw, report, "trades", confidence)
+
+
+def bootstrap_price_paths(
+    report: BacktestReport,
+    close: pd.Series,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    block_bars: int = BOOTSTRAP_BLOCK_BARS,
+    cost_per_trade_pct: float = DEFAULT_COST_PER_TRADE_PCT,
+    confidence: float = BOOTSTRAP_CONFIDENCE,
+    seed: int | None = None,
+) -> BootstrapResult:
+    """Replay a backtest's trades on block-bootstrapped price paths.
+
+    The bars from the first entry to the last exit are rebuilt from
+    randomly chosen runs of *block_bars* consecutive bar returns.  Every
+    trade keeps its entry bar, exit bar and direction; only the prices
+    it sees change.
+
+    Args:
+        report: Single-ticker backtest to analyse.
+        close: Close prices the backtest ran on (same index).
+        n_resamples: Number of synthetic price paths.
+        block_bars: Bars per resampled block; longer blocks keep more of
+            the original path's autocorrelation.
+        cost_per_trade_pct: Round-trip cost the backtest charged, in percent.
+        confidence: Width of the reported intervals.
+        seed: Seed for reproducible resamples.
+
+    Raises:
+        ValueError: if the report has no trades or its trade dates are
+            not in *close*'s index.
+    """
+    if report.trade_arrays is not None:
+        arrays = report.trade_arrays
+        entry_dates, exit_dates, direction = arrays.entry_dates, arrays.exit_dates, arrays.direction
+    else:
+        entry_dates = pd.Index([t.entry_date for t in report.trades])
+        exit_dates = pd.Index([t.exit_date for t in report.trades])
+        direction = np.array([1 if t.direction == "BUY" else -1 for t in report.trades])
+    if len(entry_dates) == 0:
+        raise ValueError("Cannot bootstrap a backtest with no trades.")
+    entry_idx = close.index.get_indexer(entry_dates)
+    exit_idx = close.index.get_indexer(exit_dates)
+    if (entry_idx < 0).any() or (exit_idx < 0).any():
+        raise ValueError("Trade dates are missing from the price index.")
+
+    first, last = int(entry_idx.min()), int(exit_idx.max())
+    log_returns = np.diff(np.log(close.to_numpy(dtype=float)[first : last + 1]))
+    n_steps = len(log_returns)
+    block_bars = max(1, min(block_bars, n_steps))
+    n_blocks = -(-n_steps // block_bars)
+    offsets = np.arange(block_bars)
+    entry_col, exit_col = entry_idx - first, exit_idx - first
+    cost = cost_per_trade_pct / 100.0
+    rng = np.random.default_rng(seed)
+
+    def draw(size: int) -> np.ndarray:
+        starts = rng.integers(0, n_steps - block_bars + 1, size=(size, n_blocks))
+        steps = (starts[:, :, None] + offsets).reshape(size, -1)[:, :n_steps]
+        # Log price relative to the first entry, one synthetic path per row
+        path = np.zeros((size, n_steps + 1))
+        np.cumsum(log_returns[steps], axis=1, out=path[:, 1:])
+        gross = np.exp(path[:, exit_col] - path[:, entry_col]) - 1
+        return direction * gross - cost
+
+    return _run_batches(n_resamples, n_steps, draw, report, "price_path", confidence)
@@ -1,14 +1,25 @@
 """Walk-forward backtesting engine."""
 
+from collections.abc import Sequence
+
+import numpy as np
 import pandas as pd
 
-from backtesting.metrics import compute_metrics
-from backtesting.report import BacktestReport, Trade
+from backtesting.metrics import compute_metrics, curve_metrics
+from backtesting.report import BacktestReport, MultiHorizonReport, Trade, TradeArrays, TradeLog
 from config.settings import DEFAULT_COST_PER_TRADE_PCT, WARMUP_BUFFER
 from data.fetcher import is_crypto_ticker
 from indicators.base import BaseIndicator
-from signals.base import SignalDirection
-from signals.combiner import combine_signals
+from indicators.pipeline import compute_indicators
+from signals.base import DIRECTION_CODES, SignalDirection
+from signals.combiner import (
+    combine_signals,
+    combine_signals_matrix,
+    indicator_weights,
+    signal_matrices,
+)
+
+ENGINES = ("loop", "array", "overlap")
 
 
 def run_backtest(
@@ -16,10 +27,12 @@ def run_backtest(
     indicators: dict[str, BaseIndicator],
     ticker: str,
     period: str,
-    horizon_days: int = 5,
+    horizon_days: int | Sequence[int] = 5,
     initial_capital: float = 10_000.0,
     cost_per_trade_pct: float = DEFAULT_COST_PER_TRADE_PCT,
-) -> BacktestReport:
+    engine: str = "loop",
+    precomputed: bool = False,
+) -> BacktestReport | MultiHorizonReport:
     """Run walk-forward backtest.
 
     Args:
@@ -27,42 +40,86 @@ def run_backtest(
         indicators: dict of indicator name -> instance.
         ticker: Ticker symbol for the report.
         period: Data period string for the report.
-        horizon_days: How many days forward to measure outcome.
+        horizon_days: How many days forward to measure outcome.  A list (or
+            array) of horizons backtests each of them, computing indicators (and, for
+            the array engine, per-indicator signals) only once.
         initial_capital: Starting capital.
         cost_per_trade_pct: Round-trip transaction cost as a percentage
             (slippage + commission). Deducted from each trade's PnL.
+        engine: "loop" evaluates bar by bar with combine_signals() (the
+            reference implementation); "array" combines every bar's signals
+            at once and keeps trades as arrays, building Trade objects only
+            when ``report.trades`` is accessed.  Both give the same trades.
+            "overlap" enters on every BUY/SELL bar instead of skipping the
+            bars a trade is open; see overlap_report().
+        precomputed: if True, skip indicator computation (columns already in df).
 
     Returns:
-        BacktestReport with all trades and computed metrics.
+        BacktestReport with all trades and computed metrics, or a
+        MultiHorizonReport with one per horizon when a list was given.
     """
-    report = BacktestReport(
-        ticker=ticker,
-        period=period,
-        horizon_days=horizon_days,
-        initial_capital=initial_capital,
-        is_crypto=is_crypto_ticker(ticker),
-    )
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown backtest engine {engine!r}; expected one of {ENGINES}")
+    # Any non-scalar (list, tuple, NumPy array) lists several horizons
+    multi = np.ndim(horizon_days) > 0
+    horizons = list(dict.fromkeys(int(h) for h in horizon_days)) if multi else [int(horizon_days)]
+    if not horizons:
+        raise ValueError("horizon_days must list at least one horizon.")
 
     # Pre-compute all indicators once over the full dataset.
     # All indicators used here (SMA, EMA, MACD, ADX, RSI, Stochastic, BB,
     # VWAP, OBV) are causal — they use only rolling/cumulative operations,
     # so the value at bar t is identical whether computed on data[:t+1] or
     # on the full series. This lets us compute once and index by position.
-    computed_df = df.copy()
-    for name, indicator in indicators.items():
-        computed_df = indicator.compute(computed_df)
+    computed_df = df if precomputed else compute_indicators(df, indicators)
 
-    # Determine warmup: max lookback + buffer
-    max_lookback = max(ind.lookback for ind in indicators.values())
-    warmup = max_lookback + WARMUP_BUFFER
+    reports = {}
+    matrices = None
+    combined_by_weights = {}
+    for horizon in horizons:
+        report = reports[horizon] = BacktestReport(
+            ticker=ticker,
+            period=period,
+            horizon_days=horizon,
+            initial_capital=initial_capital,
+            is_crypto=is_crypto_ticker(ticker),
+        )
 
-    if warmup >= len(computed_df) - horizon_days:
-        return report  # not enough data
+        test_range = tradable_range(len(computed_df), indicators, horizon)
+        if test_range is None:
+            continue  # not enough data
+
+        if engine == "loop":
+            _loop_report(report, computed_df, indicators, *test_range, cost_per_trade_pct)
+            continue
+
+        # Only the timescale weight adjustment differs between horizons, so
+        # signals are shared and horizons with equal weights share the vote.
+        if matrices is None:
+            matrices = signal_matrices(indicators, computed_df, precomputed=True)
+        weights = indicator_weights(list(indicators), horizon)
+        key = weights.tobytes()
+        if key not in combined_by_weights:
+            combined_by_weights[key] = combine_signals_matrix(*matrices, weights)
+        simulate = overlap_report if engine == "overlap" else array_report
+        simulate(report, computed_df, combined_by_weights[key].direction, *test_range,
+                 cost_per_trade_pct)
+
+    return MultiHorizonReport(reports) if multi else reports[horizons[0]]
 
-    # Walk through test range
-    test_start = warmup
-    test_end = len(computed_df) - horizon_days
 
+def _loop_report(
+    report: BacktestReport,
+    computed_df: pd.DataFrame,
+    indicators: dict[str, BaseIndicator],
+    test_start: int,
+    test_end: int,
+    cost_per_trade_pct: float,
+) -> BacktestReport:
+    """Fill *report* by combining signals bar by bar (the reference engine)."""
+    horizon_days = report.horizon_days
+
+    # Walk through test range
     t = test_start
     while t < test_end:
         # Read pre-computed indicator values at bar t (causal, no look-ahead)
@@ -117,3 +174,156 @@ def run_backtest(
 
     report = compute_metrics(report)
     return report
+
+
+def tradable_range(
+    n_bars: int, indicators: dict[str, BaseIndicator], horizon_days: int
+) -> tuple[int, int] | None:
+    """Bars [start, end) where a backtest may enter trades, or None if too short.
+
+    Entries start after the longest indicator lookback plus a warmup
+    buffer and stop *horizon_days* before the end, so every trade exits
+    inside the data.
+    """
+    # Determine warmup: max lookback + buffer
+    max_lookback = max(ind.lookback for ind in indicators.values())
+    warmup = max_lookback + WARMUP_BUFFER
+
+    if warmup >= n_bars - horizon_days:
+        return None
+    return warmup, n_bars - horizon_days
+
+
+def _simulate_arrays(
+    computed_df: pd.DataFrame,
+    direction: np.ndarray,
+    horizon_days: int,
+    test_start: int,
+    test_end: int,
+    cost_per_trade_pct: float,
+) -> TradeArrays:
+    """Array version of the walk in run_backtest(): same trades, no per-bar loop.
+
+    *direction* holds the combined signal code of every bar.
+    """
+    # Bars with a BUY/SELL call; after each trade, jump to the first call at
+    # or after its exit so trades never overlap.
+    candidates = np.flatnonzero(direction[test_start:test_end]) + test_start
+    entries = []
+    t = test_start
+    while True:
+        pos = np.searchsorted(candidates, t)
+        if pos == len(candidates):
+            break
+        entry = int(candidates[pos])
+        entries.append(entry)
+        t = entry + horizon_days
+
+    return _trade_arrays(computed_df, direction, np.array(entries, dtype=np.intp), horizon_days,
+                         cost_per_trade_pct)
+
+
+def _trade_arrays(
+    computed_df: pd.DataFrame,
+    direction: np.ndarray,
+    entry_idx: np.ndarray,
+    horizon_days: int,
+    cost_per_trade_pct: float,
+) -> TradeArrays:
+    """Trades entered at *entry_idx* and held for *horizon_days* bars."""
+    exit_idx = entry_idx + horizon_days
+    close = computed_df["Close"].to_numpy(dtype=float)
+    entry_price = close[entry_idx]
+    exit_price = close[exit_idx]
+    trade_direction = direction[entry_idx]
+
+    pnl_pct = np.where(
+        trade_direction == DIRECTION_CODES[SignalDirection.BUY],
+        (exit_price - entry_price) / entry_price,
+        (entry_price - exit_price) / entry_price,
+    )
+    pnl_pct -= cost_per_trade_pct / 100.0
+
+    return TradeArrays(
+        entry_idx=entry_idx,
+        exit_idx=exit_idx,
+        entry_dates=computed_df.index[entry_idx],
+        exit_dates=computed_df.index[exit_idx],
+        direction=trade_direction,
+        actual_direction=np.sign(exit_price - entry_price).astype(np.int8),
+        entry_price=entry_price,
+        exit_price=exit_price,
+        pnl_pct=pnl_pct,
+    )
+
+
+def array_report(
+    report: BacktestReport,
+    computed_df: pd.DataFrame,
+    direction: np.ndarray,
+    test_start: int,
+    test_end: int,
+    cost_per_trade_pct: float,
+) -> BacktestReport:
+    """Fill *report* with the trades and metrics of the combined signals.
+
+    *direction* holds the combined signal code of every bar of
+    *computed_df*; trades enter in [test_start, test_end), are held for
+    ``report.horizon_days`` bars and never overlap.
+    """
+    arrays = _simulate_arrays(computed_df, direction, report.horizon_days, test_start, test_end,
+                              cost_per_trade_pct)
+    report.trade_arrays = arrays
+    report.trades = TradeLog(arrays)
+    return compute_metrics(report)
+
+
+def overlap_report(
+    report: BacktestReport,
+    computed_df: pd.DataFrame,
+    direction: np.ndarray,
+    test_start: int,
+    test_end: int,
+    cost_per_trade_pct: float,
+) -> BacktestReport:
+    """Fill *report* with overlapping positions: one entry on every BUY/SELL bar.
+
+    Every signal in the test range opens a cohort sized at 1/horizon of
+    equity and held for *horizon* bars, so up to *horizon* staggered
+    cohorts are open at once and the unused fraction sits in cash.
+    Cohorts are kept at their 1/horizon share each bar (the usual
+    overlapping-portfolio convention), which makes the bar's return the
+    average direction of the last *horizon* signals times the price move.
+    Trades no longer depend on where the test range starts.
+
+    Trade statistics (win rate, accuracy, profit factor) are per cohort;
+    the equity curve, return, drawdown and Sharpe ratio come from the
+    bar-by-bar equity.
+    """
+    horizon_days = report.horizon_days
+    entries = np.zeros(len(direction))
+    entries[test_start:test_end] = direction[test_start:test_end]
+    entry_idx = np.flatnonzero(entries)
+
+    report.trade_arrays = _trade_arrays(computed_df, direction, entry_idx, horizon_days,
+                                        cost_per_trade_pct)
+    report.trades = TradeLog(report.trade_arrays)
+    compute_metrics(report)  # per-trade statistics
+    if len(entry_idx) == 0:
+        return report
+
+    # Net exposure during bar s: signals from bars s-horizon .. s-1 (rolling sum)
+    summed = np.concatenate(([0.0], np.cumsum(entries)))
+    bars = np.arange(test_start, test_end + horizon_days)
+    exposure = (summed[bars] - summed[np.maximum(bars - horizon_days, 0)]) / horizon_days
+
+    close = computed_df["Close"].to_numpy(dtype=float)
+    bar_return = close[bars] / close[bars - 1] - 1
+    # Round-trip cost charged on each new cohort's 1/horizon share at entry
+    cost = np.abs(entries[bars]) / horizon_days * cost_per_trade_pct / 100.0
+    equity = report.initial_capital * np.cumprod(1 + exposure * bar_return - cost)
+    curve = pd.Series(
+        np.concatenate(([report.initial_capital], equity)),
+        index=computed_df.index[test_start - 1 : test_end + horizon_days],
+    )
+    return curve_metrics(report, curve)
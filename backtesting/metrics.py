@@ -3,11 +3,71 @@
 import numpy as np
 import pandas as pd
 
-from backtesting.report import BacktestReport, Trade
+from backtesting.report import BacktestReport, Trade, TradeArrays
+
+
+def _sharpe_ratio(returns: np.ndarray, horizon_days: int, is_crypto: bool) -> float:
+    """Annualized Sharpe ratio, adjusted for trade frequency and asset type."""
+    if len(returns) > 1 and np.std(returns) > 0:
+        trading_days_per_year = 365 if is_crypto else 252
+        periods_per_year = trading_days_per_year / horizon_days
+        return (np.mean(returns) / np.std(returns)) * np.sqrt(periods_per_year)
+    return 0.0
+
+
+def _compute_metrics_arrays(report: BacktestReport, arrays: TradeArrays) -> BacktestReport:
+    """compute_metrics() for the array engine: the same metrics, vectorized."""
+    pnl = arrays.pnl_pct
+    report.total_trades = len(arrays)
+    if report.total_trades == 0:
+        return report
+
+    report.winning_trades = int(np.count_nonzero(pnl > 0))
+    report.losing_trades = report.total_trades - report.winning_trades
+    report.win_rate = report.winning_trades / report.total_trades
+
+    report.correct_predictions = int(np.count_nonzero(arrays.correct))
+    report.prediction_accuracy = report.correct_predictions / report.total_trades
+
+    # Compounded left to right from the initial capital, as the loop does
+    equity = np.cumprod(np.concatenate(([report.initial_capital], 1 + pnl)))
+    dates = arrays.entry_dates[:1].append(arrays.exit_dates)
+    report.equity_curve = pd.Series(equity, index=dates)
+    report.cumulative_return = (equity[-1] / equity[0]) - 1
+
+    peak = np.maximum.accumulate(equity)
+    report.max_drawdown = float(np.max((peak - equity) / peak))
+
+    report.sharpe_ratio = _sharpe_ratio(pnl, report.horizon_days, report.is_crypto)
+
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = abs(pnl[pnl < 0].sum())
+    report.profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
+
+    return report
+
+
+def curve_metrics(report: BacktestReport, curve: pd.Series) -> BacktestReport:
+    """Set the equity curve, return, drawdown and Sharpe from a per-bar equity curve.
+
+    For backtests whose capital is marked to market every bar (portfolios,
+    overlapping positions) rather than compounded trade by trade.  The
+    Sharpe ratio annualizes bar-to-bar returns.
+    """
+    values = curve.to_numpy(dtype=float)
+    report.equity_curve = curve
+    report.cumulative_return = values[-1] / report.initial_capital - 1
+    peak = np.maximum.accumulate(values)
+    report.max_drawdown = float(np.max((peak - values) / peak))
+    report.sharpe_ratio = _sharpe_ratio(np.diff(values) / values[:-1], 1, report.is_crypto)
+    return report
 
 
 def compute_metrics(report: BacktestReport) -> BacktestReport:
     """Compute all metrics from the trade list and fill in the report."""
+    if report.trade_arrays is not None:
+        return _compute_metrics_arrays(report, report.trade_arrays)
+
     trades = report.trades
     report.total_trades = len(trades)
 
@@ -48,12 +108,7 @@ def compute_metrics(report: BacktestReport) -> BacktestReport:
 
     # Sharpe ratio (annualized, adjusted for trade frequency and asset type)
     returns = np.array([t.pnl_pct for t in trades])
-    if len(returns) > 1 and np.std(returns) > 0:
-        trading_days_per_year = 365 if report.is_crypto else 252
-        periods_per_year = trading_days_per_year / report.horizon_days
-        report.sharpe_ratio = (np.mean(returns) / np.std(returns)) * np.sqrt(periods_per_year)
-    else:
-        report.sharpe_ratio = 0.0
+    report.sharpe_ratio = _sharpe_ratio(returns, report.horizon_days, report.is_crypto)
 
     # Profit factor
     gross_profit = sum(t.pnl_pct for t in trades if t.pnl_pct > 0)
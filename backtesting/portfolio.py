@@ -0,0 +1,329 @@
+"""Multi-ticker portfolio backtests.
+
+Each ticker's combined signal is computed on its own bars (in a process
+pool), then mapped onto a shared calendar.  The simulation walks that
+calendar once, with every per-bar step vectorized across tickers:
+positions that reach their horizon are closed, the portfolio is marked
+to market, and free position slots are filled with the most confident
+new BUY/SELL signals.
+
+Trades follow the single-ticker engine's rules: a position is held for
+``horizon_days`` of its ticker's own bars (so an equity held over a
+weekend exits later on the calendar than a crypto position entered the
+same day), a ticker never has two overlapping positions,
+and the round-trip cost is deducted from each trade's return.  Each new
+position is sized at 1/max_positions of current equity, limited by cash.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import tradable_range
+from backtesting.metrics import compute_metrics, curve_metrics
+from backtesting.report import PortfolioReport, TradeArrays, TradeLog
+from backtesting.sweep import current_settings
+from config.overrides import override_settings
+from config.settings import (
+    DEFAULT_COST_PER_TRADE_PCT,
+    DEFAULT_INITIAL_CAPITAL,
+    DEFAULT_INTERVAL,
+    PORTFOLIO_MAX_POSITIONS,
+    PORTFOLIO_WORKERS,
+)
+from data.fetcher import fetch_ohlcv, fetch_ohlcv_many, is_crypto_ticker
+from data.watchlists import get_watchlist
+from indicators.base import BaseIndicator
+from indicators.pipeline import compute_indicators
+from signals.combiner import combine_signals_matrix, indicator_weights, signal_matrices
+
+
+def fetch_portfolio_data(
+    tickers: list[str],
+    period: str,
+    interval: str = DEFAULT_INTERVAL,
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    """Fetch OHLCV frames for many tickers with one bulk download.
+
+    Returns:
+        (frames, skipped): ticker -> frame for tickers that loaded, and
+        ticker -> error message for those that didn't.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    try:
+        fetch_ohlcv_many(tickers, period=period, interval=interval)
+    except Exception:
+        pass  # per-ticker fetches below report individual failures
+    frames, skipped = {}, {}
+    for ticker in tickers:
+        try:
+            frames[ticker] = fetch_ohlcv(ticker, period=period, interval=interval)
+        except Exception as e:
+            skipped[ticker] = str(e)
+    return frames, skipped
+
+
+def _calendar_index(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Timezone-free dates, so exchanges in different timezones line up."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _ticker_signals(
+    df: pd.DataFrame,
+    indicators: dict[str, BaseIndicator],
+    horizon_days: int,
+    settings: dict[str, Any],
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Combined direction and confidence of every bar of one ticker.
+
+    Bars inside the indicator warmup are HOLD.  Returns None if the
+    ticker has too little history to trade.
+    """
+    test_range = tradable_range(len(df), indicators, horizon_days)
+    if test_range is None:
+        return None
+    computed = compute_indicators(df, indicators)
+    with override_settings(**settings):
+        combined = combine_signals_matrix(
+            *signal_matrices(indicators, computed, precomputed=True),
+            indicator_weights(list(indicators), horizon_days),
+        )
+    direction = combined.direction.copy()
+    direction[: test_range[0]] = 0
+    return direction, combined.confidence
+
+
+def _all_signals(
+    frames: dict[str, pd.DataFrame],
+    indicators: dict[str, BaseIndicator],
+    horizon_days: int,
+    workers: int,
+) -> dict[str, tuple[np.ndarray, np.ndarray] | None]:
+    # Read in the caller's thread, where session overrides are visible
+    settings = current_settings()
+    tickers = list(frames)
+    args = ([frames[t] for t in tickers], [indicators] * len(tickers),
+            [horizon_days] * len(tickers), [settings] * len(tickers))
+    if workers > 0 and len(tickers) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tickers))) as pool:
+            results = list(pool.map(_ticker_signals, *args, chunksize=max(1, len(tickers) // (workers * 4))))
+    else:
+        results = list(map(_ticker_signals, *args))
+    return dict(zip(tickers, results))
+
+
+def _simulate_portfolio(
+    raw_close: np.ndarray,
+    direction: np.ndarray,
+    confidence: np.ndarray,
+    exit_bar: np.ndarray,
+    initial_capital: float,
+    cost_per_trade_pct: float,
+    max_positions: int,
+) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    """Walk the shared calendar; returns (equity, exposure, trade arrays by field).
+
+    *raw_close* is (n_bars, n_tickers) with NaN where a ticker has no bar;
+    positions are marked and exited at the last available close.
+    *exit_bar* gives, for a position entered at each bar, the calendar bar
+    it exits at, or -1 where the ticker has no bar that far ahead.
+    """
+    n_bars, n_tickers = raw_close.shape
+    close = pd.DataFrame(raw_close).ffill().to_numpy()
+    cost = cost_per_trade_pct / 100.0
+
+    # A ticker can enter at bar t if it traded at t, has a call, and its
+    # exit bar is inside the calendar.
+    can_enter = (direction != 0) & ~np.isnan(raw_close) & (exit_bar >= 0)
+
+    pos_dir = np.zeros(n_tickers, dtype=np.int8)
+    pos_entry_px = np.ones(n_tickers)
+    pos_alloc = np.zeros(n_tickers)
+    pos_entry_bar = np.full(n_tickers, -1)
+    pos_exit_bar = np.full(n_tickers, -1)
+
+    cash = initial_capital
+    equity = np.empty(n_bars)
+    exposure = np.empty(n_bars)
+    trades: dict[str, list] = {k: [] for k in (
+        "ticker", "entry_idx", "exit_idx", "direction", "entry_price", "exit_price", "pnl_pct")}
+
+    for t in range(n_bars):
+        closing = np.flatnonzero(pos_exit_bar == t)
+        if closing.size:
+            exit_px = close[t, closing]
+            pnl = pos_dir[closing] * (exit_px / pos_entry_px[closing] - 1) - cost
+            cash += float(np.sum(pos_alloc[closing] * (1 + pnl)))
+            trades["ticker"].append(closing)
+            trades["entry_idx"].append(pos_entry_bar[closing])
+            trades["exit_idx"].append(np.full(closing.size, t))
+            trades["direction"].append(pos_dir[closing])
+            trades["entry_price"].append(pos_entry_px[closing])
+            trades["exit_price"].append(exit_px)
+            trades["pnl_pct"].append(pnl)
+            pos_exit_bar[closing] = -1
+
+        is_open = pos_exit_bar >= 0
+        marked = pos_alloc[is_open] * (1 + pos_dir[is_open] * (close[t, is_open] / pos_entry_px[is_open] - 1))
+        value = cash + float(marked.sum())
+
+        free = max_positions - int(is_open.sum())
+        if free > 0 and cash > 0:
+            candidates = np.flatnonzero(can_enter[t] & ~is_open)
+            if candidates.size > free:
+                order = np.argsort(-confidence[t, candidates], kind="stable")
+                candidates = np.sort(candidates[order[:free]])
+            if candidates.size:
+                alloc = min(value / max_positions, cash / candidates.size)
+                pos_dir[candidates] = direction[t, candidates]
+                pos_entry_px[candidates] = raw_close[t, candidates]
+                pos_alloc[candidates] = alloc
+                pos_entry_bar[candidates] = t
+                pos_exit_bar[candidates] = exit_bar[t, candidates]
+                cash -= alloc * candidates.size
+
+        equity[t] = value
+        exposure[t] = (value - cash) / value if value > 0 else 0.0
+
+    arrays = {
+        k: np.concatenate(v) if v else np.empty(0, dtype=float if k.endswith(("price", "pct")) else np.intp)
+        for k, v in trades.items()
+    }
+    # Chronological by entry, then by ticker column
+    order = np.lexsort((arrays["ticker"], arrays["entry_idx"]))
+    return equity, exposure, {k: v[order] for k, v in arrays.items()}
+
+
+def run_portfolio_backtest(
+    frames: dict[str, pd.DataFrame],
+    indicators: dict[str, BaseIndicator],
+    period: str = "",
+    horizon_days: int = 5,
+    initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+    cost_per_trade_pct: float = DEFAULT_COST_PER_TRADE_PCT,
+    max_positions: int = PORTFOLIO_MAX_POSITIONS,
+    workers: int = PORTFOLIO_WORKERS,
+    name: str = "Portfolio",
+) -> PortfolioReport:
+    """Backtest the combined signals of many tickers as one portfolio.
+
+    Args:
+        frames: ticker -> OHLCV DataFrame (each must include warmup).
+        indicators: dict of indicator name -> instance.
+        period: Data period string for the report.
+        horizon_days: Bars of its own ticker each position is held.
+        initial_capital: Starting capital.
+        cost_per_trade_pct: Round-trip transaction cost as a percentage.
+        max_positions: Maximum concurrent positions.
+        workers: Processes computing per-ticker signals.  0 computes in-process.
+        name: Label stored as the report's ticker.
+
+    Returns:
+        PortfolioReport with all trades, per-ticker statistics and
+        portfolio-level metrics.
+    """
+    if max_positions < 1:
+        raise ValueError("max_positions must be at least 1.")
+    report = PortfolioReport(
+        ticker=name,
+        period=period,
+        horizon_days=horizon_days,
+        initial_capital=initial_capital,
+        is_crypto=bool(frames) and all(is_crypto_ticker(t) for t in frames),
+        max_positions=max_positions,
+    )
+    if not frames:
+        return report
+
+    signals = _all_signals(frames, indicators, horizon_days, workers)
+    tickers = [t for t, s in signals.items() if s is not None]
+    report.skipped = {t: "Not enough history" for t, s in signals.items() if s is None}
+    report.tickers = tickers
+    if not tickers:
+        return report
+
+    # Shared calendar: every date any ticker traded
+    own_dates = {t: _calendar_index(frames[t].index) for t in tickers}
+    calendar = own_dates[tickers[0]]
+    for t in tickers[1:]:
+        calendar = calendar.union(own_dates[t])
+
+    n_bars = len(calendar)
+    raw_close = np.full((n_bars, len(tickers)), np.nan)
+    direction = np.zeros((n_bars, len(tickers)), dtype=np.int8)
+    confidence = np.zeros((n_bars, len(tickers)))
+    exit_bar = np.full((n_bars, len(tickers)), -1)
+    for j, t in enumerate(tickers):
+        rows = calendar.get_indexer(own_dates[t])
+        keep = ~own_dates[t].duplicated(keep="last")
+        rows = rows[keep]
+        raw_close[rows, j] = frames[t]["Close"].to_numpy(dtype=float)[keep]
+        direction[rows, j] = signals[t][0][keep]
+        confidence[rows, j] = signals[t][1][keep]
+        # Held for horizon_days of the ticker's own bars, not calendar bars
+        exit_bar[rows[:len(rows) - horizon_days], j] = rows[horizon_days:]
+
+    equity, exposure, trades = _simulate_portfolio(
+        raw_close, direction, confidence, exit_bar, initial_capital,
+        cost_per_trade_pct, max_positions,
+    )
+
+    ticker_names = np.array(tickers, dtype=object)
+    arrays = TradeArrays(
+        entry_idx=trades["entry_idx"],
+        exit_idx=trades["exit_idx"],
+        entry_dates=calendar[trades["entry_idx"]],
+        exit_dates=calendar[trades["exit_idx"]],
+        direction=trades["direction"].astype(np.int8),
+        actual_direction=np.sign(trades["exit_price"] - trades["entry_price"]).astype(np.int8),
+        entry_price=trades["entry_price"],
+        exit_price=trades["exit_price"],
+        pnl_pct=trades["pnl_pct"],
+        ticker=ticker_names[trades["ticker"]],
+    )
+    report.trade_arrays = arrays
+    report.trades = TradeLog(arrays)
+    compute_metrics(report)  # per-trade statistics
+
+    # Portfolio-level curve and risk metrics from daily mark-to-market value,
+    # starting where the first ticker leaves its warmup
+    first_active = int(np.argmax((direction != 0).any(axis=1))) if (direction != 0).any() else 0
+    curve_metrics(report, pd.Series(equity[first_active:], index=calendar[first_active:]))
+    report.exposure = pd.Series(exposure[first_active:], index=calendar[first_active:])
+
+    if len(arrays):
+        by_ticker = pd.DataFrame({"ticker": arrays.ticker, "pnl_pct": arrays.pnl_pct,
+                                  "correct": arrays.correct})
+        report.per_ticker = by_ticker.groupby("ticker", sort=False).agg(
+            trades=("pnl_pct", "size"),
+            win_rate=("pnl_pct", lambda p: float((p > 0).mean())),
+            accuracy=("correct", "mean"),
+            avg_pnl_pct=("pnl_pct", "mean"),
+        ).sort_values("trades", ascending=False, kind="stable")
+    return report
+
+
+def run_watchlist_backtest(
+    watchlist: str | list[str],
+    indicators: dict[str, BaseIndicator],
+    period: str,
+    interval: str = DEFAULT_INTERVAL,
+    **kwargs,
+) -> PortfolioReport:
+    """Fetch a saved watchlist, preset or ticker list and backtest it as a portfolio.
+
+    Keyword arguments are passed to run_portfolio_backtest().
+    """
+    if isinstance(watchlist, str):
+        tickers = get_watchlist(watchlist)
+        kwargs.setdefault("name", watchlist)
+    else:
+        tickers = list(watchlist)
+    frames, skipped = fetch_portfolio_data(tickers, period=period, interval=interval)
+    report = run_portfolio_backtest(frames, indicators, period=period, **kwargs)
+    report.skipped = {**skipped, **report.skipped}
+    return report
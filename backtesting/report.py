@@ -1,9 +1,19 @@
 """Backtest report dataclass."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
+from signals.base import CODE_DIRECTIONS
+
+# Headline metrics used when comparing backtests side by side
+RESULT_METRICS = (
+    "sharpe_ratio", "cumulative_return", "max_drawdown", "win_rate",
+    "prediction_accuracy", "profit_factor", "total_trades",
+)
+
 
 @dataclass
 class Trade:
@@ -18,6 +28,94 @@ class Trade:
     actual_direction: str
     correct: bool
     pnl_pct: float  # percent return
+    ticker: str = ""  # set in portfolio backtests
+
+
+@dataclass
+class TradeArrays:
+    """Trades of a backtest as parallel arrays, one element per trade."""
+
+    entry_idx: np.ndarray  # bar position of each entry
+    exit_idx: np.ndarray  # bar position of each exit
+    entry_dates: pd.Index
+    exit_dates: pd.Index
+    direction: np.ndarray  # int8 predicted direction: 1 = BUY, -1 = SELL
+    actual_direction: np.ndarray  # int8 realized move: 1 up, -1 down, 0 flat
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    pnl_pct: np.ndarray  # percent return after costs
+    ticker: np.ndarray | None = None  # per-trade symbol, for portfolio backtests
+
+    def __len__(self) -> int:
+        return len(self.entry_idx)
+
+    @property
+    def correct(self) -> np.ndarray:
+        return self.direction == self.actual_direction
+
+    def subset(self, mask: np.ndarray) -> "TradeArrays":
+        """The trades selected by a boolean mask (or index array)."""
+        return TradeArrays(
+            entry_idx=self.entry_idx[mask],
+            exit_idx=self.exit_idx[mask],
+            entry_dates=self.entry_dates[mask],
+            exit_dates=self.exit_dates[mask],
+            direction=self.direction[mask],
+            actual_direction=self.actual_direction[mask],
+            entry_price=self.entry_price[mask],
+            exit_price=self.exit_price[mask],
+            pnl_pct=self.pnl_pct[mask],
+            ticker=self.ticker[mask] if self.ticker is not None else None,
+        )
+
+    def to_trades(self) -> list[Trade]:
+        """Materialize Trade objects (for display and export)."""
+        trades = []
+        correct = self.correct
+        for i in range(len(self)):
+            predicted = CODE_DIRECTIONS[int(self.direction[i])].value
+            trades.append(Trade(
+                entry_date=self.entry_dates[i],
+                exit_date=self.exit_dates[i],
+                direction=predicted,
+                entry_price=self.entry_price[i],
+                exit_price=self.exit_price[i],
+                predicted_direction=predicted,
+                actual_direction=CODE_DIRECTIONS[int(self.actual_direction[i])].value,
+                correct=bool(correct[i]),
+                pnl_pct=self.pnl_pct[i],
+                ticker=str(self.ticker[i]) if self.ticker is not None else "",
+            ))
+        return trades
+
+
+class TradeLog(Sequence):
+    """Read-only list of trades backed by TradeArrays.
+
+    Trade objects are only built the first time an element is accessed,
+    so backtests whose trade log is never shown don't pay for them.
+    """
+
+    def __init__(self, arrays: TradeArrays):
+        self.arrays = arrays
+        self._trades: list[Trade] | None = None
+
+    def _materialize(self) -> list[Trade]:
+        if self._trades is None:
+            self._trades = self.arrays.to_trades()
+        return self._trades
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __getitem__(self, i):
+        return self._materialize()[i]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __repr__(self) -> str:
+        return f"TradeLog({len(self)} trades)"
 
 
 @dataclass
@@ -28,8 +126,9 @@ class BacktestReport:
     period: str
     horizon_days: int
     initial_capital: float
-    trades: list[Trade] = field(default_factory=list)
+    trades: list[Trade] = field(default_factory=list)  # a TradeLog for the array engine
     is_crypto: bool = False
+    trade_arrays: TradeArrays | None = None  # set by the array engine
 
     # Computed metrics
     total_trades: int = 0
@@ -46,3 +145,41 @@ class BacktestReport:
 
     # Equity curve
     equity_curve: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+
+
+@dataclass
+class PortfolioReport(BacktestReport):
+    """Results of a multi-ticker portfolio backtest.
+
+    Trade statistics (win rate, accuracy, profit factor) are per trade;
+    the equity curve, return, drawdown and Sharpe ratio are computed
+    from the portfolio's daily mark-to-market value.
+    """
+
+    tickers: list[str] = field(default_factory=list)  # tickers that were traded on
+    skipped: dict[str, str] = field(default_factory=dict)  # ticker -> reason left out
+    max_positions: int = 0
+    exposure: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))  # invested fraction
+    per_ticker: pd.DataFrame = field(default_factory=pd.DataFrame)  # trade stats by ticker
+
+
+@dataclass
+class MultiHorizonReport:
+    """Backtests of the same signals at several horizons, one report each."""
+
+    reports: dict[int, BacktestReport]  # horizon_days -> report, in request order
+
+    def __getitem__(self, horizon_days: int) -> BacktestReport:
+        return self.reports[horizon_days]
+
+    @property
+    def horizons(self) -> list[int]:
+        return list(self.reports)
+
+    def comparison(self) -> pd.DataFrame:
+        """One row per horizon with RESULT_METRICS as columns."""
+        return pd.DataFrame(
+            [{m: getattr(r, m) for m in RESULT_METRICS} for r in self.reports.values()],
+            index=pd.Index(self.horizons, name="horizon_days"),
+            columns=list(RESULT_METRICS),
+        )
@@ -0,0 +1,256 @@
+"""Parameter sweeps: backtest a grid of thresholds, weights and horizons.
+
+Indicator columns don't depend on any sweepable setting, so they are
+computed once.  Configurations that share the same signal thresholds
+share per-indicator signal arrays too; only the weighted vote and the
+trade simulation run per configuration.  Configurations are evaluated
+in a process pool, each worker receiving the computed frame once.
+"""
+
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from backtesting.engine import array_report, tradable_range
+from backtesting.report import RESULT_METRICS, BacktestReport
+from config.overrides import get_setting, override_settings
+from config.settings import (
+    DEFAULT_COST_PER_TRADE_PCT,
+    DEFAULT_INITIAL_CAPITAL,
+    SWEEP_MAX_CONFIGS,
+    SWEEP_WORKERS,
+)
+from data.fetcher import is_crypto_ticker
+from indicators.base import BaseIndicator
+from indicators.pipeline import compute_indicators
+from signals.combiner import combine_signals_matrix, indicator_weights, signal_matrices
+
+# Settings read by indicators' get_signal(): changing them changes signals
+SIGNAL_SETTINGS = ("RSI_OVERSOLD", "RSI_OVERBOUGHT", "STOCH_OVERSOLD", "STOCH_OVERBOUGHT")
+# Settings read only when combining signals
+COMBINER_SETTINGS = ("AMBIGUITY_THRESHOLD", "INDICATOR_WEIGHTS")
+SWEEPABLE = SIGNAL_SETTINGS + COMBINER_SETTINGS + ("horizon_days",)
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict[str, Any]]:
+    """All combinations of a parameter grid, e.g. {"RSI_OVERSOLD": [25, 30]}.
+
+    ``INDICATOR_WEIGHTS`` values are partial dicts merged over the current
+    weights, so ``[{"RSI": 0.5}, {"RSI": 1.5}]`` sweeps a single weight.
+    """
+    unknown = set(grid) - set(SWEEPABLE)
+    if unknown:
+        raise ValueError(f"Cannot sweep {sorted(unknown)}; sweepable: {list(SWEEPABLE)}")
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+@dataclass
+class SweepContext:
+    """Everything a worker needs that is shared by all configurations.
+
+    Also used by walk-forward optimization, which sets ``windows`` to its
+    training folds.
+    """
+
+    computed_df: pd.DataFrame
+    indicators: dict[str, BaseIndicator]
+    baseline: dict[str, Any]  # effective value of every sweepable setting
+    ticker: str
+    period: str
+    horizon_days: int
+    initial_capital: float
+    cost_per_trade_pct: float
+    # Bar ranges [start, end) to evaluate each configuration on separately;
+    # None evaluates the whole backtest range once.
+    windows: list[tuple[int, int]] | None = None
+
+
+_worker_context: SweepContext | None = None
+
+
+def _init_worker(context: SweepContext) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def settings_for(baseline: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+    """Effective setting overrides for one configuration.
+
+    *params* is one configuration from expand_grid(); its weights are
+    merged over the baseline's and ``horizon_days`` (not a setting) is
+    dropped.  Pass the result to override_settings().
+    """
+    values = {**baseline, **params}
+    if "INDICATOR_WEIGHTS" in params:
+        values["INDICATOR_WEIGHTS"] = {**baseline["INDICATOR_WEIGHTS"],
+                                       **params["INDICATOR_WEIGHTS"]}
+    values.pop("horizon_days", None)
+    return values
+
+
+def _entry_ranges(context: SweepContext, horizon_days: int) -> list[tuple[int, int] | None]:
+    """Entry bar range per window, trades exiting inside it (None = too short)."""
+    full = tradable_range(len(context.computed_df), context.indicators, horizon_days)
+    if context.windows is None:
+        return [full]
+    ranges = []
+    for start, end in context.windows:
+        if full is None:
+            ranges.append(None)
+            continue
+        entry_start, entry_end = max(start, full[0]), min(end - horizon_days, full[1])
+        ranges.append((entry_start, entry_end) if entry_start < entry_end else None)
+    return ranges
+
+
+def _evaluate(
+    configs: list[dict[str, Any]], context: SweepContext | None = None
+) -> list[dict[str, Any]]:
+    """Backtest configurations that share the same signal settings."""
+    context = context or _worker_context
+    indicators = context.indicators
+    rows = []
+    matrices = None
+    for params in configs:
+        horizon_days = params.get("horizon_days", context.horizon_days)
+        with override_settings(**settings_for(context.baseline, params)):
+            if matrices is None:
+                matrices = signal_matrices(indicators, context.computed_df, precomputed=True)
+            combined = combine_signals_matrix(
+                *matrices, indicator_weights(list(indicators), horizon_days)
+            )
+        for window, entry_range in enumerate(_entry_ranges(context, horizon_days)):
+            report = BacktestReport(
+                ticker=context.ticker,
+                period=context.period,
+                horizon_days=horizon_days,
+                initial_capital=context.initial_capital,
+                is_crypto=is_crypto_ticker(context.ticker),
+            )
+            if entry_range is not None:
+                array_report(report, context.computed_df, combined.direction, *entry_range,
+                              context.cost_per_trade_pct)
+            row = {**params, **{m: getattr(report, m) for m in RESULT_METRICS}}
+            if context.windows is not None:
+                row["window"] = window
+            rows.append(row)
+    return rows
+
+
+def signal_key(params: dict[str, Any]) -> tuple:
+    """Configurations with equal keys produce the same per-indicator signals."""
+    return tuple(params.get(name) for name in SIGNAL_SETTINGS)
+
+
+def _batches(configs: list[dict[str, Any]], workers: int) -> list[list[dict[str, Any]]]:
+    """Group configurations by signal settings, split so every worker gets work."""
+    groups: dict[tuple, list[dict[str, Any]]] = {}
+    for params in configs:
+        groups.setdefault(signal_key(params), []).append(params)
+    chunk = max(1, math.ceil(len(configs) / max(1, workers * 2)))
+    return [
+        group[i : i + chunk]
+        for group in groups.values()
+        for i in range(0, len(group), chunk)
+    ]
+
+
+def evaluate_all(
+    context: SweepContext, configs: list[dict[str, Any]], workers: int
+) -> list[dict[str, Any]]:
+    """Evaluate configurations, in a process pool when workers > 0.
+
+    Returns one row per configuration (per window when the context has
+    ``windows``): the parameters followed by RESULT_METRICS.
+    """
+    batches = _batches(configs, workers)
+    if workers > 0 and len(batches) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(batches)),
+            initializer=_init_worker,
+            initargs=(context,),
+        ) as pool:
+            results = list(pool.map(_evaluate, batches))
+    else:
+        results = [_evaluate(batch, context) for batch in batches]
+    return [row for rows in results for row in rows]
+
+
+def computed_frame(
+    df: pd.DataFrame, indicators: dict[str, BaseIndicator], precomputed: bool
+) -> pd.DataFrame:
+    """df with the indicator columns, computing them unless precomputed."""
+    return df if precomputed else compute_indicators(df, indicators)
+
+
+def current_settings() -> dict[str, Any]:
+    """Effective value of every setting a sweep can change.
+
+    Call it in the caller's thread, where session overrides are visible,
+    and hand the result to worker processes, which can't see them.
+    """
+    return {name: get_setting(name) for name in SIGNAL_SETTINGS + COMBINER_SETTINGS}
+
+
+def run_sweep(
+    df: pd.DataFrame,
+    indicators: dict[str, BaseIndicator],
+    grid: dict[str, list],
+    ticker: str,
+    period: str,
+    horizon_days: int = 5,
+    initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+    cost_per_trade_pct: float = DEFAULT_COST_PER_TRADE_PCT,
+    workers: int = SWEEP_WORKERS,
+    precomputed: bool = False,
+    rank_by: str = "sharpe_ratio",
+) -> pd.DataFrame:
+    """Backtest every configuration of a parameter grid and rank the results.
+
+    Args:
+        df: Full OHLCV DataFrame (must include warmup period).
+        indicators: dict of indicator name -> instance.
+        grid: Setting name -> candidate values.  Keys must be in SWEEPABLE;
+            ``horizon_days`` sweeps the prediction horizon.
+        ticker: Ticker symbol (for crypto-aware Sharpe annualization).
+        period: Data period string for the reports.
+        horizon_days: Horizon used when the grid doesn't sweep it.
+        initial_capital: Starting capital.
+        cost_per_trade_pct: Round-trip transaction cost as a percentage.
+        workers: Evaluation processes.  0 evaluates in-process.
+        precomputed: if True, skip indicator computation (columns already in df).
+        rank_by: Result column to rank by, best first (lowest for
+            max_drawdown, highest otherwise).
+
+    Returns:
+        DataFrame with one row per configuration: the swept parameters
+        followed by RESULT_METRICS.  Settings not in the grid keep their
+        current effective values, including session overrides.
+    """
+    configs = expand_grid(grid)
+    if len(configs) > SWEEP_MAX_CONFIGS:
+        raise ValueError(
+            f"Grid has {len(configs)} configurations; the limit is {SWEEP_MAX_CONFIGS}."
+        )
+
+    context = SweepContext(
+        computed_df=computed_frame(df, indicators, precomputed),
+        indicators=indicators,
+        baseline=current_settings(),
+        ticker=ticker,
+        period=period,
+        horizon_days=horizon_days,
+        initial_capital=initial_capital,
+        cost_per_trade_pct=cost_per_trade_pct,
+    )
+
+    results = evaluate_all(context, configs, workers)
+    table = pd.DataFrame(results, columns=list(grid) + list(RESULT_METRICS))
+    ranked = table.sort_values(rank_by, ascending=rank_by == "max_drawdown", kind="stable",
+                               na_position="last")
+    return ranked.reset_index(drop=True)
@@ -0,0 +1,232 @@
+"""Walk-forward optimization over rolling in-sample / out-of-sample folds.
+
+History is split into folds: each tunes thresholds and weights on a
+training window, then trades the next, unseen window with the best
+configuration.  The out-of-sample windows are stitched into one trade
+sequence and equity curve, which estimates how re-tuning periodically
+would actually have performed.
+
+Indicators are causal, so they are computed once over the full history
+and every fold reads the same frame.  Each configuration's signals are
+combined once over all bars and then scored on every training window,
+so the cost grows with folds x configurations, not with indicator work.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import array_report, tradable_range
+from backtesting.metrics import compute_metrics
+from backtesting.report import BacktestReport
+from backtesting.sweep import (
+    RESULT_METRICS,
+    SweepContext,
+    computed_frame,
+    current_settings,
+    evaluate_all,
+    expand_grid,
+    settings_for,
+    signal_key,
+)
+from config.overrides import override_settings
+from config.settings import (
+    DEFAULT_COST_PER_TRADE_PCT,
+    DEFAULT_INITIAL_CAPITAL,
+    SWEEP_MAX_CONFIGS,
+    SWEEP_WORKERS,
+    WALK_FORWARD_MIN_TRADES,
+    WALK_FORWARD_TEST_BARS,
+    WALK_FORWARD_TRAIN_BARS,
+)
+from data.fetcher import is_crypto_ticker
+from indicators.base import BaseIndicator
+from signals.combiner import combine_signals_matrix, indicator_weights, signal_matrices
+
+
+@dataclass(frozen=True)
+class Fold:
+    """Bar positions of one walk-forward fold; ranges are [start, end)."""
+
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass
+class WalkForwardResult:
+    """Outcome of a walk-forward optimization."""
+
+    report: BacktestReport  # stitched out-of-sample trades, metrics and equity curve
+    folds: pd.DataFrame = field(default_factory=pd.DataFrame)  # one row per fold
+    in_sample: pd.DataFrame = field(default_factory=pd.DataFrame)  # every config x fold
+
+
+def walk_forward_folds(
+    n_bars: int,
+    first_bar: int,
+    train_bars: int,
+    test_bars: int,
+    anchored: bool = False,
+) -> list[Fold]:
+    """Split bars [first_bar, n_bars) into consecutive train/test folds.
+
+    Test windows tile the history after the first training window.  Rolling
+    folds train on the *train_bars* bars before each test window; anchored
+    folds train on everything from *first_bar*.  The last test window may
+    be shorter than *test_bars*.
+    """
+    folds = []
+    test_start = first_bar + train_bars
+    while test_start < n_bars:
+        train_start = first_bar if anchored else test_start - train_bars
+        test_end = min(test_start + test_bars, n_bars)
+        folds.append(Fold(train_start, test_start, test_start, test_end))
+        test_start = test_end
+    return folds
+
+
+def _pick_best(rows: list[dict[str, Any]], rank_by: str, min_trades: int) -> dict[str, Any] | None:
+    eligible = [r for r in rows if r["total_trades"] >= min_trades and not pd.isna(r[rank_by])]
+    if not eligible:
+        return None
+    if rank_by == "max_drawdown":
+        return min(eligible, key=lambda r: r[rank_by])
+    return max(eligible, key=lambda r: r[rank_by])
+
+
+def walk_forward(
+    df: pd.DataFrame,
+    indicators: dict[str, BaseIndicator],
+    grid: dict[str, list],
+    ticker: str,
+    period: str,
+    horizon_days: int = 5,
+    train_bars: int = WALK_FORWARD_TRAIN_BARS,
+    test_bars: int = WALK_FORWARD_TEST_BARS,
+    anchored: bool = False,
+    initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+    cost_per_trade_pct: float = DEFAULT_COST_PER_TRADE_PCT,
+    rank_by: str = "sharpe_ratio",
+    min_trades: int = WALK_FORWARD_MIN_TRADES,
+    workers: int = SWEEP_WORKERS,
+    precomputed: bool = False,
+) -> WalkForwardResult:
+    """Re-tune settings on each training window and trade them out of sample.
+
+    Args:
+        df: Full OHLCV DataFrame (must include warmup period).
+        indicators: dict of indicator name -> instance.
+        grid: Setting name -> candidate values, as for run_sweep().  The
+            horizon is fixed (``horizon_days``) so folds stitch cleanly.
+        ticker: Ticker symbol for the report.
+        period: Data period string for the report.
+        horizon_days: How many bars forward each trade is held.
+        train_bars: Bars in each (rolling) training window.
+        test_bars: Bars traded out of sample per fold.
+        anchored: Train on all history up to each test window instead of
+            a rolling window.
+        initial_capital: Starting capital.
+        cost_per_trade_pct: Round-trip transaction cost as a percentage.
+        rank_by: In-sample metric used to pick each fold's configuration
+            (lowest wins for max_drawdown, highest otherwise).
+        min_trades: Configurations with fewer in-sample trades are not
+            eligible.  If none qualifies, the fold uses the current settings.
+        workers: Evaluation processes.  0 evaluates in-process.
+        precomputed: if True, skip indicator computation (columns already in df).
+
+    Returns:
+        WalkForwardResult with the stitched out-of-sample BacktestReport,
+        a per-fold summary and the full in-sample results.
+    """
+    if "horizon_days" in grid:
+        raise ValueError("Walk-forward uses a fixed horizon; pass horizon_days instead of sweeping it.")
+    configs = expand_grid(grid)
+    if len(configs) > SWEEP_MAX_CONFIGS:
+        raise ValueError(
+            f"Grid has {len(configs)} configurations; the limit is {SWEEP_MAX_CONFIGS}."
+        )
+
+    report = BacktestReport(
+        ticker=ticker,
+        period=period,
+        horizon_days=horizon_days,
+        initial_capital=initial_capital,
+        is_crypto=is_crypto_ticker(ticker),
+    )
+    computed_df = computed_frame(df, indicators, precomputed)
+    test_range = tradable_range(len(computed_df), indicators, horizon_days)
+    if test_range is None:
+        return WalkForwardResult(report)
+    folds = walk_forward_folds(len(computed_df), test_range[0], train_bars, test_bars, anchored)
+    if not folds:
+        return WalkForwardResult(report)
+
+    context = SweepContext(
+        computed_df=computed_df,
+        indicators=indicators,
+        baseline=current_settings(),
+        ticker=ticker,
+        period=period,
+        horizon_days=horizon_days,
+        initial_capital=initial_capital,
+        cost_per_trade_pct=cost_per_trade_pct,
+        windows=[(f.train_start, f.train_end) for f in folds],
+    )
+    rows = evaluate_all(context, configs, workers)
+
+    by_fold: dict[int, list[dict[str, Any]]] = {}
+    for row in rows:
+        by_fold.setdefault(row["window"], []).append(row)
+    chosen = [_pick_best(by_fold.get(k, []), rank_by, min_trades) for k in range(len(folds))]
+
+    # Stitch the out-of-sample signal: each test window uses its fold's pick
+    direction = np.zeros(len(computed_df), dtype=np.int8)
+    matrices: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+    for fold, best in zip(folds, chosen):
+        params = {name: best[name] for name in grid} if best is not None else {}
+        with override_settings(**settings_for(context.baseline, params)):
+            key = signal_key(params)
+            if key not in matrices:
+                matrices[key] = signal_matrices(indicators, computed_df, precomputed=True)
+            combined = combine_signals_matrix(
+                *matrices[key], indicator_weights(list(indicators), horizon_days)
+            )
+        direction[fold.test_start : fold.test_end] = combined.direction[fold.test_start : fold.test_end]
+
+    array_report(report, computed_df, direction, folds[0].test_start,
+                  min(folds[-1].test_end, test_range[1]), cost_per_trade_pct)
+
+    index = computed_df.index
+    summary = []
+    for k, (fold, best) in enumerate(zip(folds, chosen)):
+        entries = report.trade_arrays.entry_idx
+        fold_report = BacktestReport(
+            ticker=ticker, period=period, horizon_days=horizon_days,
+            initial_capital=initial_capital, is_crypto=report.is_crypto,
+            trade_arrays=report.trade_arrays.subset(
+                (entries >= fold.test_start) & (entries < fold.test_end)
+            ),
+        )
+        compute_metrics(fold_report)
+        summary.append({
+            "fold": k,
+            "train_start": index[fold.train_start],
+            "train_end": index[fold.train_end - 1],
+            "test_start": index[fold.test_start],
+            "test_end": index[fold.test_end - 1],
+            **{name: (best[name] if best is not None else None) for name in grid},
+            f"train_{rank_by}": best[rank_by] if best is not None else float("nan"),
+            **{m: getattr(fold_report, m) for m in RESULT_METRICS},
+        })
+
+    in_sample = pd.DataFrame(rows, columns=list(grid) + list(RESULT_METRICS) + ["window"])
+    in_sample = in_sample.rename(columns={"window": "fold"}).sort_values("fold", kind="stable")
+    return WalkForwardResult(
+        report=report,
+        folds=pd.DataFrame(summary),
+        in_sample=in_sample.reset_index(drop=True),
+    )
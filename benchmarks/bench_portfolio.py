@@ -0,0 +1,56 @@
+"""Benchmark a multi-ticker portfolio backtest.
+
+Backtests a synthetic watchlist of daily data with every registered
+indicator and reports the time spent in per-ticker signal generation
+and in the portfolio simulation.
+
+Usage:
+    python -m benchmarks.bench_portfolio [n_tickers] [n_bars] [workers]
+"""
+
+import sys
+import time
+
+from backtesting import portfolio
+from backtesting.portfolio import run_portfolio_backtest
+from indicators.registry import get_all_indicators
+from tests.conftest import make_ohlcv
+
+
+def main(n_tickers: int, n_bars: int, workers: int) -> None:
+    indicators = get_all_indicators()
+    trends = ("up", "down", "flat", "volatile")
+    frames = {
+        f"T{i:03d}": make_ohlcv(n_bars, trend=trends[i % 4], seed=i, start_price=10 + i)
+        for i in range(n_tickers)
+    }
+
+    timings = {}
+    real_signals, real_simulate = portfolio._all_signals, portfolio._simulate_portfolio
+
+    def timed(label, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            timings[label] = time.perf_counter() - start
+            return result
+        return wrapper
+
+    portfolio._all_signals = timed("signals", real_signals)
+    portfolio._simulate_portfolio = timed("simulation", real_simulate)
+    try:
+        start = time.perf_counter()
+        report = run_portfolio_backtest(frames, indicators, workers=workers)
+        total = time.perf_counter() - start
+    finally:
+        portfolio._all_signals, portfolio._simulate_portfolio = real_signals, real_simulate
+
+    print(f"{n_tickers} tickers x {n_bars} bars, {workers} workers: {total:.2f}s total "
+          f"(signals {timings['signals']:.2f}s, simulation {timings['simulation']:.2f}s), "
+          f"{report.total_trades} trades")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    defaults = [100, 2520, 4]
+    main(*(args + defaults[len(args):]))
@@ -0,0 +1,58 @@
+"""Benchmark incremental indicator updates against full recomputes.
+
+For each indicator that needs no reference data, times ``update`` for
+one new bar after ``init_state`` over the history, and
+``compute_columns`` over the whole history with that bar appended (what
+a refresh did before).  Also times ``IndicatorStream.append`` and
+``signals()`` for all of them together.
+
+Usage:
+    python -m benchmarks.bench_streaming [n_bars ...]
+"""
+
+import sys
+import time
+
+from indicators._streaming import iter_bars
+from indicators.registry import get_all_indicators
+from indicators.streaming import IndicatorStream
+from tests.conftest import make_ohlcv
+
+
+def _per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main(sizes: list[int]) -> None:
+    indicators = {n: i for n, i in get_all_indicators().items() if not i.reference_tickers}
+    for n_bars in sizes:
+        df = make_ohlcv(n_bars + 200, trend="volatile", seed=1)
+        history, new_bars = df.iloc[:n_bars], list(iter_bars(df.iloc[n_bars:]))
+        print(f"{n_bars} bars of history")
+        print(f"  {'':<18} {'update (us)':>12} {'recompute (ms)':>15} {'speedup':>9}")
+        incremental = {}
+        for name, indicator in indicators.items():
+            state = indicator.init_state(history)
+            bars = iter(new_bars)
+            recomputes = "history" in vars(state)  # the default, non-incremental state
+            if not recomputes:
+                incremental[name] = indicator
+            calls = 5 if recomputes else 200
+            update_s = _per_call(lambda: indicator.update(state, next(bars)), calls)
+            recompute_s = _per_call(lambda: indicator.compute_columns(df.iloc[: n_bars + 1]), 5)
+            print(f"  {name:<18} {update_s * 1e6:>12.1f} {recompute_s * 1e3:>15.2f}"
+                  f" {recompute_s / update_s:>8.0f}x")
+
+        stream = IndicatorStream(history, incremental)
+        rows = (df.iloc[i] for i in range(n_bars, n_bars + 200))
+        append_s = _per_call(lambda: stream.append(next(rows)), 200)
+        signals_s = _per_call(stream.signals, 20)
+        print(f"  stream of {len(incremental)} incremental indicators: append {append_s * 1e6:.0f} us,"
+              f" signals {signals_s * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [2_520, 20_000])
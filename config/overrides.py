@@ -4,10 +4,21 @@ Allows the UI to temporarily override config values (indicator weights,
 thresholds) without modifying the on-disk settings.  When running outside
 Streamlit (e.g. in tests), overrides are silently ignored and the default
 values from config.settings are returned.
+
+Code that evaluates many configurations (parameter sweeps, walk-forward
+optimization) uses override_settings() instead: its overrides are scoped
+to a ``with`` block in the current thread/context, take precedence over
+session state, and work in worker processes where there is no session.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
 from config import settings
 
+_scoped_overrides: ContextVar[dict] = ContextVar("scoped_setting_overrides", default={})
+
 
 def _session_key(name: str) -> str:
     return f"setting_override_{name}"
@@ -16,9 +27,12 @@ def _session_key(name: str) -> str:
 def get_setting(name: str):
     """Return the current effective value for *name*.
 
-    Checks st.session_state for an override first; falls back to the
-    corresponding attribute in config.settings.
+    Checks override_settings() blocks first, then st.session_state; falls
+    back to the corresponding attribute in config.settings.
     """
+    scoped = _scoped_overrides.get()
+    if name in scoped:
+        return scoped[name]
     try:
         import streamlit as st
 
@@ -47,3 +61,16 @@ def clear_overrides() -> None:
             del st.session_state[k]
     except Exception:
         pass
+
+
+@contextmanager
+def override_settings(**values) -> Iterator[None]:
+    """Override settings for get_setting() calls inside the ``with`` block.
+
+    Blocks nest; inner values win.  Nothing is written to session state.
+    """
+    token = _scoped_overrides.set({**_scoped_overrides.get(), **values})
+    try:
+        yield
+    finally:
+        _scoped_overrides.reset(token)
@@ -4,9 +4,31 @@
 DEFAULT_PERIOD = "1y"
 DEFAULT_INTERVAL = "1d"
 CACHE_TTL_SECONDS = 300  # 5 minutes
+OHLCV_CACHE_MAX_ENTRIES = 256  # fetched price frames shared by every session, one per (ticker, period, interval)
+OHLCV_STORE_ENABLED = True  # persist history in ~/.capitalisman/ohlcv/ and refresh incrementally
+
+# Cross-asset reference data (copper, gold, VIX, sector ETFs), shared by all sessions
+REFERENCE_CACHE_TTL_SECONDS = 3600  # refetch hourly on long-running servers
+REFERENCE_CACHE_NEGATIVE_TTL_SECONDS = 60  # retry a failed download after a minute
+REFERENCE_CACHE_MAX_ENTRIES = 64
+
+# Computed indicator columns, shared by every page, rerun and session
+INDICATOR_CACHE_TTL_SECONDS = 3600  # cross-asset indicators pick up refreshed reference data
+INDICATOR_CACHE_MAX_ENTRIES = 512  # one entry per (frame, indicator, parameters)
+INDICATOR_THREADS = 0  # threads computing a frame's indicators concurrently (0 = in the calling thread)
+SIGNAL_CACHE_MAX_ENTRIES = 1024  # combined latest-bar signals, one per (frame, indicators, horizon, settings)
+STREAM_HISTORY_BARS = 100  # rows of indicator columns a live stream keeps for reading signals
+
+# Live Predict mode
+LIVE_INTERVALS = {"1m": 15, "5m": 60}  # intraday bar interval -> seconds between polls
+LIVE_HISTORY_PERIOD = {"1m": "5d", "5m": "1mo"}  # history a ticker's live indicators start from
+LIVE_POLL_PERIOD = "5d"  # requested on each poll; only bars closed since the last poll are used
+LIVE_REFRESH_SECONDS = 5  # how often an open Predict page redraws its live signal cards
+LIVE_IDLE_SECONDS = 120  # a ticker's poller stops once no page has read it for this long
 
 # Prediction defaults
 DEFAULT_PREDICTION_HORIZON = 5  # days
+MULTI_TIMEFRAME_HORIZONS = [1, 5, 20]  # days; Predict page cards and horizon comparisons
 
 # Backtesting defaults
 DEFAULT_BACKTEST_PERIOD = "6mo"
@@ -14,6 +36,24 @@ DEFAULT_INITIAL_CAPITAL = 10_000.0
 DEFAULT_COST_PER_TRADE_PCT = 0.1  # round-trip transaction cost as % (slippage + commission)
 WARMUP_BUFFER = 50  # extra bars beyond longest indicator lookback
 
+# Parameter sweeps (grid search over thresholds, weights and horizons)
+SWEEP_WORKERS = 4  # processes evaluating configurations (0 = evaluate in-process)
+SWEEP_MAX_CONFIGS = 2_000  # refuse larger grids
+
+# Walk-forward optimization (rolling in-sample / out-of-sample folds, in bars)
+WALK_FORWARD_TRAIN_BARS = 252  # ~1 trading year to tune on
+WALK_FORWARD_TEST_BARS = 63  # ~1 quarter traded out of sample per fold
+WALK_FORWARD_MIN_TRADES = 5  # configurations with fewer in-sample trades can't be picked
+
+# Portfolio (multi-ticker) backtests
+PORTFOLIO_MAX_POSITIONS = 10  # concurrent positions; each gets 1/N of equity at entry
+PORTFOLIO_WORKERS = 4  # per-ticker signal processes (0 = compute in-process)
+
+# Bootstrap confidence intervals for backtest metrics
+BOOTSTRAP_RESAMPLES = 10_000
+BOOTSTRAP_CONFIDENCE = 0.95  # central interval reported for each metric
+BOOTSTRAP_BLOCK_BARS = 20  # block length when resampling the price path (keeps autocorrelation)
+
 # Indicator parameters
 SMA_SHORT = 20
 SMA_LONG = 50
@@ -33,6 +73,10 @@ STOCH_OVERSOLD = 20
 STOCH_OVERBOUGHT = 80
 BB_PERIOD = 20
 BB_STD = 2
+VPIN_MODE = "time"  # "time": fixed window of bars; "volume": equal-volume buckets from intraday bars
+VPIN_INTRADAY_INTERVAL = "5m"  # intraday bars used by the volume-clock mode
+VPIN_INTRADAY_PERIOD = "1mo"  # Yahoo keeps ~60 days of 5m bars and ~30 days of 1m bars
+VPIN_BUCKETS_PER_DAY = 50  # bucket volume = average daily volume / this
 
 # Indicator weights for signal combination
 INDICATOR_WEIGHTS = {
@@ -194,3 +238,8 @@ WATCHLIST_PRESETS = {
     "Indices": ["^GSPC", "^DJI", "^IXIC", "^RUT"],
     "Custom": [],
 }
+
+# Screener scan engine
+SCREENER_PERIOD = "6mo"
+SCAN_IO_WORKERS = 8  # concurrent fetches (network-bound)
+SCAN_COMPUTE_WORKERS = 4  # indicator compute processes (0 = compute in the fetch thread)
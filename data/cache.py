@@ -0,0 +1,300 @@
+"""Thread-safe in-process cache with expiry, LRU eviction and single-flight loads.
+
+Used for data shared by every session of the app (e.g. cross-asset
+reference prices), where Streamlit's per-function caches don't fit:
+entries can be filled in bulk, failures can be cached briefly, and
+concurrent requests for the same missing key trigger only one load.
+
+Caches created with a ``name`` are listed by ``shared_caches()`` for the
+diagnostics panel.
+"""
+
+import dataclasses
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+import numpy as np
+import pandas as pd
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Caches created with a name, for diagnostics
+_registry: dict[str, "TTLCache"] = {}
+_registry_lock = threading.Lock()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a TTLCache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # lookups that waited on another caller's load
+    loads: int = 0
+    load_errors: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: object
+    expires_at: float
+
+
+class _Pending:
+    """An in-flight load that other callers can wait on."""
+
+    __slots__ = ("event", "done", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.done = False  # False after set() means "not loaded, try yourself"
+        self.value = None
+        self.error: BaseException | None = None
+
+
+class TTLCache(Generic[K, V]):
+    """Size-bounded LRU cache whose entries expire after a time-to-live.
+
+    Args:
+        ttl: Seconds a loaded value stays fresh (None = never expires).
+        negative_ttl: Seconds a None result (a failed lookup) is cached
+            for.  0 disables negative caching; None never expires it.
+        maxsize: Maximum entries kept; least recently used go first.
+        clock: Monotonic time source (injectable for tests).
+        name: Registers the cache under this name in ``shared_caches()``.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None,
+        negative_ttl: float | None = 0.0,
+        maxsize: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+        name: str | None = None,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.name = name
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[K, _Entry]" = OrderedDict()
+        self._inflight: dict[K, _Pending] = {}
+        self._lock = threading.Lock()
+        if name is not None:
+            with _registry_lock:
+                _registry[name] = self
+
+    # -- lookups ------------------------------------------------------------
+
+    def _fresh(self, key: K) -> "_Entry | None":
+        """Return the live entry for key, dropping it if expired.  Hold the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return self._fresh(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def in_flight(self) -> int:
+        """Loads currently running (each may have several callers waiting)."""
+        with self._lock:
+            return len(self._inflight)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the cached values."""
+        with self._lock:
+            values = [entry.value for entry in self._entries.values()]
+        return sum(_sizeof(value) for value in values)
+
+    def get(self, key: K, default: "V | None" = None) -> "V | None":
+        """Return a fresh cached value without loading."""
+        with self._lock:
+            entry = self._fresh(key)
+            if entry is None:
+                return default
+            self.stats.hits += 1
+            return entry.value
+
+    def get_or_load(self, key: K, loader: Callable[[], "V | None"]) -> "V | None":
+        """Return the cached value for key, calling loader() once if missing.
+
+        Concurrent callers asking for the same missing key wait for the
+        first caller's load instead of starting their own.  A None result
+        is cached for ``negative_ttl``; an exception is not cached and is
+        re-raised to every waiting caller.
+        """
+        while True:
+            with self._lock:
+                entry = self._fresh(key)
+                if entry is not None:
+                    self.stats.hits += 1
+                    return entry.value
+                pending = self._inflight.get(key)
+                owner = pending is None
+                if owner:
+                    pending = self._inflight[key] = _Pending()
+                    self.stats.misses += 1
+                else:
+                    self.stats.coalesced += 1
+
+            if not owner:
+                pending.event.wait()
+                if pending.error is not None:
+                    raise pending.error
+                if pending.done:
+                    return pending.value
+                continue  # a bulk load skipped this key; load it ourselves
+
+            try:
+                value = loader()
+            except BaseException as e:
+                with self._lock:
+                    self.stats.load_errors += 1
+                    self._finish(key, pending, error=e)
+                raise
+            with self._lock:
+                self.stats.loads += 1
+                self._store(key, value)
+                self._finish(key, pending, value=value, done=True)
+            return value
+
+    def get_many_or_load(
+        self, keys: Iterable[K], loader: Callable[[list[K]], dict[K, V]]
+    ) -> dict[K, "V | None"]:
+        """Return values for several keys, loading all missing ones in one call.
+
+        ``loader(missing_keys)`` returns a dict of the keys it could load.
+        Keys it leaves out are not cached, so later lookups retry them
+        individually.  Keys already being loaded by another caller are
+        waited on rather than loaded twice.
+        """
+        result: dict[K, V | None] = {}
+        owned: dict[K, _Pending] = {}
+        waiting: dict[K, _Pending] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._fresh(key)
+                if entry is not None:
+                    self.stats.hits += 1
+                    result[key] = entry.value
+                elif key in self._inflight:
+                    self.stats.coalesced += 1
+                    waiting[key] = self._inflight[key]
+                else:
+                    self.stats.misses += 1
+                    owned[key] = self._inflight[key] = _Pending()
+
+        if owned:
+            try:
+                loaded = loader(list(owned))
+            except BaseException as e:
+                with self._lock:
+                    self.stats.load_errors += 1
+                    for key, pending in owned.items():
+                        self._finish(key, pending, error=e)
+                raise
+            with self._lock:
+                self.stats.loads += 1
+                for key, pending in owned.items():
+                    if key in loaded:
+                        self._store(key, loaded[key])
+                        result[key] = loaded[key]
+                        self._finish(key, pending, value=loaded[key], done=True)
+                    else:
+                        self._finish(key, pending)
+
+        for key, pending in waiting.items():
+            pending.event.wait()
+            if pending.done:
+                result[key] = pending.value
+        return result
+
+    # -- updates ------------------------------------------------------------
+
+    def set(self, key: K, value: "V | None") -> None:
+        """Store a value (None counts as a failed lookup for expiry)."""
+        with self._lock:
+            self._store(key, value)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: K, value: "V | None") -> None:
+        """Insert a value, applying its TTL and the size bound.  Hold the lock."""
+        ttl = self.negative_ttl if value is None else self.ttl
+        if ttl is not None and ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        expires_at = float("inf") if ttl is None else self._clock() + ttl
+        self._entries[key] = _Entry(value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _finish(
+        self,
+        key: K,
+        pending: _Pending,
+        value: "V | None" = None,
+        done: bool = False,
+        error: BaseException | None = None,
+    ) -> None:
+        """Publish an in-flight load's outcome to its waiters.  Hold the lock."""
+        if self._inflight.get(key) is pending:
+            del self._inflight[key]
+        pending.value = value
+        pending.done = done
+        pending.error = error
+        pending.event.set()
+
+
+def _sizeof(value: object) -> int:
+    """Approximate size in bytes of a cached value and what it contains."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sys.getsizeof(value) + _sizeof(vars(value))
+    return sys.getsizeof(value)
+
+
+def shared_caches() -> dict[str, TTLCache]:
+    """Every cache created with a name, by name."""
+    with _registry_lock:
+        return dict(_registry)
@@ -10,32 +10,39 @@ from config.settings import (
     CACHE_TTL_SECONDS,
     DEFAULT_INTERVAL,
     DEFAULT_PERIOD,
+    OHLCV_CACHE_MAX_ENTRIES,
+    OHLCV_STORE_ENABLED,
     PERIOD_CALENDAR_DAYS,
     WARMUP_FETCH_PERIOD,
 )
+from data import store
+from data.cache import TTLCache
 
 
-@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
-def _fetch_raw(ticker: str, period: str, interval: str) -> pd.DataFrame:
-    """Fetch and validate OHLCV data (cached by Streamlit)."""
-    try:
-        t = yf.Ticker(ticker)
-        df = t.history(period=period, interval=interval)
-    except Exception as e:
-        raise ValueError(f"Failed to fetch data for '{ticker}': {e}")
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+_DAILY_INTERVALS = ("1d", "5d", "1wk", "1mo", "3mo")
+
+# Validated frames shared by every session.  Concurrent requests for the
+# same (ticker, period, interval) share one download, and bulk downloads
+# fill it directly.
+_ohlcv_cache: TTLCache[tuple[str, str, str], pd.DataFrame] = TTLCache(
+    ttl=CACHE_TTL_SECONDS, maxsize=OHLCV_CACHE_MAX_ENTRIES, name="Price data"
+)
+
 
+def _validate_ohlcv(df: "pd.DataFrame | None", ticker: str) -> pd.DataFrame:
+    """Apply the column/NaN/length rules shared by single and bulk fetches."""
     if df is None or df.empty:
         raise ValueError(
             f"No data returned for '{ticker}'. Check that the ticker symbol is valid."
         )
 
     # Keep only OHLCV columns
-    expected_cols = ["Open", "High", "Low", "Close", "Volume"]
-    missing = [c for c in expected_cols if c not in df.columns]
+    missing = [c for c in _OHLCV_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"Missing expected columns: {missing}")
 
-    df = df[expected_cols].copy()
+    df = df[_OHLCV_COLUMNS].copy()
     df.dropna(inplace=True)
 
     if len(df) < 2:
@@ -44,6 +51,160 @@ def _fetch_raw(ticker: str, period: str, interval: str) -> pd.DataFrame:
     return df
 
 
+def _with_attrs(df: pd.DataFrame, ticker: str, interval: str) -> pd.DataFrame:
+    """Record the ticker and interval in df.attrs (see fetch_ohlcv)."""
+    df.attrs["ticker"] = ticker
+    df.attrs["interval"] = interval
+    return df
+
+
+def _load_ohlcv(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """Fetch and validate OHLCV data (uncached)."""
+
+    def _history(**kwargs) -> pd.DataFrame:
+        try:
+            df = yf.Ticker(ticker).history(interval=interval, **kwargs)
+        except Exception as e:
+            raise ValueError(f"Failed to fetch data for '{ticker}': {e}")
+        return _validate_ohlcv(df, ticker)
+
+    if OHLCV_STORE_ENABLED and store.supports(period, interval):
+        try:
+            return store.fetch_with_store(ticker, period, interval, _history)
+        except OSError:
+            pass  # store unusable (permissions, disk full) — fetch directly
+    return _history(period=period)
+
+
+def _restore_daily_tz(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Undo the batch-wide timezone conversion for daily-or-longer bars.
+
+    A multi-ticker download expresses every index in the batch's most common
+    exchange timezone, which moves e.g. crypto bars (UTC midnight) to the
+    previous evening in New York.  Daily bars always sit at midnight in
+    their native timezone, so fall back to UTC when that is where they do.
+    """
+    idx = df.index
+    if interval not in _DAILY_INTERVALS or not isinstance(idx, pd.DatetimeIndex) or idx.tz is None:
+        return df
+    if (idx == idx.normalize()).all():
+        return df
+    utc = idx.tz_convert("UTC")
+    if (utc == utc.normalize()).all():
+        df.index = utc
+    return df
+
+
+def _split_download(raw: "pd.DataFrame | None", tickers: list[str], interval: str) -> dict[str, pd.DataFrame]:
+    """Split a grouped multi-ticker download into validated per-ticker frames.
+
+    Tickers that are missing from the download or fail validation are
+    omitted from the result.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    if raw is None or raw.empty:
+        return frames
+
+    if not isinstance(raw.columns, pd.MultiIndex):
+        # Older yfinance returns flat columns for a single ticker
+        if len(tickers) == 1:
+            try:
+                frames[tickers[0]] = _restore_daily_tz(_validate_ohlcv(raw, tickers[0]), interval)
+            except ValueError:
+                pass
+        return frames
+
+    available = set(raw.columns.get_level_values(0))
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        try:
+            frames[ticker] = _restore_daily_tz(_validate_ohlcv(raw[ticker], ticker), interval)
+        except ValueError:
+            continue
+    return frames
+
+
+def download_ohlcv(
+    ticker: str,
+    period: str = DEFAULT_PERIOD,
+    interval: str = DEFAULT_INTERVAL,
+) -> pd.DataFrame:
+    """Download one ticker's OHLCV data, bypassing every cache.
+
+    For callers polling for new bars, which a cached frame would hide.
+    The frame follows the same rules as fetch_ohlcv(), attrs included.
+
+    Raises ValueError if ticker is invalid or no data returned.
+    """
+    try:
+        df = yf.Ticker(ticker).history(period=period, interval=interval)
+    except Exception as e:
+        raise ValueError(f"Failed to fetch data for '{ticker}': {e}")
+    return _with_attrs(_validate_ohlcv(df, ticker), ticker, interval)
+
+
+def download_ohlcv_many(
+    tickers: list[str],
+    period: str = DEFAULT_PERIOD,
+    interval: str = DEFAULT_INTERVAL,
+) -> dict[str, pd.DataFrame]:
+    """Download several tickers in one multi-ticker request (uncached).
+
+    Returns a dict of ticker -> validated OHLCV frame.  Tickers that fail
+    are left out rather than raising, so one bad symbol doesn't sink the
+    whole batch.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    try:
+        raw = yf.download(
+            tickers,
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=True,
+            actions=False,
+            ignore_tz=False,
+            threads=True,
+            progress=False,
+        )
+    except Exception:
+        return {}
+    return _split_download(raw, tickers, interval)
+
+
+def fetch_ohlcv_many(
+    tickers: list[str],
+    period: str = DEFAULT_PERIOD,
+    interval: str = DEFAULT_INTERVAL,
+) -> dict[str, pd.DataFrame]:
+    """Fetch OHLCV data for several tickers with a single bulk download.
+
+    Each frame follows the same rules as fetch_ohlcv() and is handed to the
+    per-ticker cache, so subsequent fetch_ohlcv() calls for these tickers are
+    cache hits.  Tickers that fail are omitted from the result; calling
+    fetch_ohlcv() on them raises the usual descriptive ValueError.
+    Concurrent calls wait for each other's downloads instead of repeating
+    them.
+    """
+
+    def _download(keys: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], pd.DataFrame]:
+        frames = download_ohlcv_many([ticker for ticker, _, _ in keys], period, interval)
+        if OHLCV_STORE_ENABLED:
+            for ticker, df in frames.items():
+                try:
+                    store.record_fetch(ticker, period, interval, df)
+                except OSError:
+                    pass
+        return {(ticker, period, interval): df for ticker, df in frames.items()}
+
+    keys = [(ticker, period, interval) for ticker in dict.fromkeys(tickers)]
+    loaded = _ohlcv_cache.get_many_or_load(keys, _download)
+    return {key[0]: _with_attrs(loaded[key].copy(), key[0], interval) for key in keys if key in loaded}
+
+
 def fetch_ohlcv(
     ticker: str,
     period: str = DEFAULT_PERIOD,
@@ -54,9 +215,21 @@ def fetch_ohlcv(
     Returns a DataFrame with columns: Open, High, Low, Close, Volume.
     Index is DatetimeIndex.
 
+    The ticker and interval are recorded in ``df.attrs`` for indicators
+    that need more data for the same symbol (e.g. intraday bars) and for
+    the indicator column cache.
+
     Raises ValueError if ticker is invalid or no data returned.
     """
-    return _fetch_raw(ticker, period, interval).copy()
+    df = _ohlcv_cache.get_or_load(
+        (ticker, period, interval), lambda: _load_ohlcv(ticker, period, interval)
+    )
+    return _with_attrs(df.copy(), ticker, interval)
+
+
+def clear_ohlcv_cache() -> None:
+    """Drop every cached price frame (useful for testing)."""
+    _ohlcv_cache.clear()
 
 
 def fetch_with_warmup(
@@ -0,0 +1,217 @@
+"""Background polling of intraday bars for live signals.
+
+One ``LivePoller`` per (ticker, interval) runs on a daemon thread and is
+shared by every session of the app, so ten browsers watching AAPL on
+1-minute bars cost one download per poll rather than ten.  Each poll
+fetches recent bars, and bars that have closed since the last poll are
+fed through an ``IndicatorStream`` per indicator set that pages have
+asked for, updating the indicators incrementally instead of recomputing
+them over the whole history.
+
+Pages call ``get_poller`` on every rerun, which starts the poller if
+needed and marks it as in use.  Streamlit doesn't report when a browser
+goes away, so a poller nobody has read for ``LIVE_IDLE_SECONDS`` stops
+itself and a later ``get_poller`` starts a fresh one.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import pandas as pd
+
+from config.settings import (
+    LIVE_HISTORY_PERIOD,
+    LIVE_IDLE_SECONDS,
+    LIVE_INTERVALS,
+    LIVE_POLL_PERIOD,
+)
+from data.fetcher import download_ohlcv
+from indicators.base import BaseIndicator
+from indicators.streaming import IndicatorStream
+
+_BAR_LENGTH = {"1m": pd.Timedelta(minutes=1), "5m": pd.Timedelta(minutes=5)}
+
+
+@dataclass
+class LiveSnapshot:
+    """A poller's latest indicator frame for one indicator set."""
+
+    frame: "pd.DataFrame | None"  # recent prices and indicator columns; None before the first load
+    last_bar: "pd.Timestamp | None"  # start of the newest closed bar
+    polled_at: "float | None"  # time.time() of the last successful poll
+    error: "str | None"  # message of the last failed poll, cleared by a successful one
+
+
+class LivePoller:
+    """Polls one ticker's intraday bars and keeps indicator streams up to date.
+
+    Args:
+        ticker: Symbol to poll.
+        interval: Bar interval, one of ``LIVE_INTERVALS``.
+        poll_seconds: Seconds between polls (default: the interval's setting).
+        fetch: ``fetch(ticker, period, interval)`` returning an OHLCV frame;
+            defaults to an uncached yfinance download.
+        now: Current time as a timezone-aware Timestamp, for deciding
+            which bars have closed; injectable for tests.
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        interval: str,
+        poll_seconds: float | None = None,
+        fetch: "Callable[[str, str, str], pd.DataFrame] | None" = None,
+        now: Callable[[], pd.Timestamp] = lambda: pd.Timestamp.now(tz="UTC"),
+    ):
+        if interval not in LIVE_INTERVALS:
+            raise ValueError(f"Live mode supports {list(LIVE_INTERVALS)} bars, not '{interval}'.")
+        self.ticker = ticker
+        self.interval = interval
+        self.poll_seconds = LIVE_INTERVALS[interval] if poll_seconds is None else poll_seconds
+        self.ready = threading.Event()  # set once the first load has succeeded or failed
+        self._fetch = fetch or download_ohlcv
+        self._now = now
+        self._lock = threading.Lock()
+        self._bars: "pd.DataFrame | None" = None  # closed bars streams start from
+        self._streams: dict[tuple[str, ...], IndicatorStream] = {}
+        self._polled_at: "float | None" = None
+        self._error: "str | None" = None
+        self._last_read = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: "threading.Thread | None" = None
+
+    # -- polling ------------------------------------------------------------
+
+    def _closed(self, df: pd.DataFrame) -> pd.DataFrame:
+        """df without its last bar if that bar is still forming."""
+        if len(df) and df.index[-1] + _BAR_LENGTH[self.interval] > self._now():
+            return df.iloc[:-1]
+        return df
+
+    def poll(self) -> int:
+        """Fetch recent bars and feed the newly closed ones to every stream.
+
+        Returns the number of new bars.  Failures are recorded in the
+        snapshot's ``error`` rather than raised, so a transient network
+        error doesn't stop the poller.
+        """
+        # An empty first load (its only bar still forming) counts as no load
+        first = self._bars is None or self._bars.empty
+        try:
+            period = LIVE_HISTORY_PERIOD[self.interval] if first else LIVE_POLL_PERIOD
+            df = self._closed(self._fetch(self.ticker, period, self.interval))
+        except Exception as e:
+            with self._lock:
+                self._error = str(e)
+            self.ready.set()
+            return 0
+
+        with self._lock:
+            self._polled_at = time.time()
+            self._error = None
+            if first:
+                self._bars = df
+                new = df.iloc[:0]
+            else:
+                new = df.loc[df.index > self._bars.index[-1]]
+                if len(new):
+                    # Keep the history streams start from at its initial length
+                    bars = pd.concat([self._bars, new]).iloc[len(new):]
+                    bars.attrs = self._bars.attrs
+                    self._bars = bars
+            for i in range(len(new)):
+                bar = new.iloc[i]
+                for stream in self._streams.values():
+                    stream.append(bar)
+        self.ready.set()
+        return len(new)
+
+    def _run(self) -> None:
+        self.poll()
+        while not self._stop.wait(self.poll_seconds):
+            if _retire_if_idle(self):
+                return
+            self.poll()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name=f"live-{self.ticker}-{self.interval}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    # -- reading ------------------------------------------------------------
+
+    def touch(self) -> None:
+        """Mark the poller as in use, postponing its idle shutdown."""
+        self._last_read = time.monotonic()
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self._last_read
+
+    def snapshot(self, indicators: dict[str, BaseIndicator]) -> LiveSnapshot:
+        """The latest indicator frame for these indicators.
+
+        The first request for an indicator set computes it over the
+        poller's history; later polls update it one bar at a time.
+        """
+        self.touch()
+        with self._lock:
+            if self._bars is None or self._bars.empty:
+                return LiveSnapshot(None, None, self._polled_at, self._error)
+            key = tuple(sorted(indicators))
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = IndicatorStream(self._bars, indicators)
+            frame = stream.frame
+            last_bar = frame.index[-1] if len(frame) else None
+            return LiveSnapshot(frame, last_bar, self._polled_at, self._error)
+
+
+# Pollers shared by every session, by (ticker, interval)
+_pollers: dict[tuple[str, str], LivePoller] = {}
+_pollers_lock = threading.Lock()
+
+
+def get_poller(ticker: str, interval: str) -> LivePoller:
+    """The running poller for ticker's interval bars, started if necessary."""
+    with _pollers_lock:
+        poller = _pollers.get((ticker, interval))
+        if poller is None or not poller.running:
+            poller = _pollers[(ticker, interval)] = LivePoller(ticker, interval)
+            poller.start()
+        poller.touch()
+        return poller
+
+
+def _retire_if_idle(poller: LivePoller) -> bool:
+    """Stop and unregister poller if nobody has read it lately."""
+    # Checked under the registry lock so get_poller can't hand it out meanwhile
+    with _pollers_lock:
+        if poller.idle_seconds() < LIVE_IDLE_SECONDS:
+            return False
+        poller.stop()
+        if _pollers.get((poller.ticker, poller.interval)) is poller:
+            del _pollers[(poller.ticker, poller.interval)]
+        return True
+
+
+def active_pollers() -> list[LivePoller]:
+    """Pollers currently running."""
+    with _pollers_lock:
+        return [p for p in _pollers.values() if p.running]
+
+
+def stop_all_pollers() -> None:
+    with _pollers_lock:
+        for poller in _pollers.values():
+            poller.stop()
+        _pollers.clear()
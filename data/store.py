@@ -0,0 +1,233 @@
+"""Persistent OHLCV store (Parquet files in ~/.capitalisman/ohlcv/).
+
+Keeps the full fetched history per ticker+interval on disk.  A refresh only
+downloads bars from the last stored bar onwards and merges them into the
+tail, so a server restart or cache expiry costs a few-bar delta instead of
+a multi-year download.
+
+Only daily-or-longer intervals with month/year/ytd/max periods are stored.
+Day- and week-based periods are counted in trading days by Yahoo and are
+cheap to fetch anyway, and intraday history is capped by Yahoo.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable
+from urllib.parse import quote
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+_STORE_DIR = Path.home() / ".capitalisman" / "ohlcv"
+
+_STORED_INTERVALS = ("1d", "5d", "1wk", "1mo", "3mo")
+_PERIOD_RE = re.compile(r"^(\d+)(mo|y)$")
+
+# Relative tolerance when checking that the re-downloaded overlap bar still
+# matches the stored one.  A larger difference means Yahoo re-adjusted the
+# history (dividend or split), so the stored bars are stale.
+_ADJUSTMENT_TOLERANCE = 1e-4
+
+_key_locks: dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+# fetch(**history_kwargs) -> validated OHLCV DataFrame, e.g. period=... or start=...
+Fetcher = Callable[..., pd.DataFrame]
+
+
+def is_available() -> bool:
+    return PARQUET_AVAILABLE
+
+
+def supports(period: str, interval: str) -> bool:
+    """Return True if this period/interval combination goes through the store."""
+    if not PARQUET_AVAILABLE or interval not in _STORED_INTERVALS:
+        return False
+    return period in ("max", "ytd") or _PERIOD_RE.match(period) is not None
+
+
+def period_start(period: str, now: pd.Timestamp) -> "pd.Timestamp | None":
+    """Earliest timestamp covered by *period* ending at *now* (None for "max")."""
+    if period == "max":
+        return None
+    if period == "ytd":
+        return now.normalize().replace(month=1, day=1)
+    match = _PERIOD_RE.match(period)
+    if match is None:
+        raise ValueError(f"Unsupported period for the OHLCV store: {period!r}")
+    n, unit = int(match.group(1)), match.group(2)
+    offset = pd.DateOffset(months=n) if unit == "mo" else pd.DateOffset(years=n)
+    return (now - offset).normalize()
+
+
+def _key(ticker: str, interval: str) -> str:
+    return f"{quote(ticker, safe='')}_{interval}"
+
+
+def _data_path(ticker: str, interval: str) -> Path:
+    return _STORE_DIR / f"{_key(ticker, interval)}.parquet"
+
+
+def _meta_path(ticker: str, interval: str) -> Path:
+    return _STORE_DIR / f"{_key(ticker, interval)}.json"
+
+
+def _lock_for(ticker: str, interval: str) -> threading.Lock:
+    key = _key(ticker, interval)
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def load_bars(ticker: str, interval: str) -> "tuple[pd.DataFrame, dict] | None":
+    """Load stored bars and their metadata, or None if nothing usable is stored."""
+    data_path = _data_path(ticker, interval)
+    meta_path = _meta_path(ticker, interval)
+    if not data_path.exists() or not meta_path.exists():
+        return None
+    try:
+        df = pd.read_parquet(data_path)
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if df.empty or not isinstance(meta, dict):
+        return None
+    return df, meta
+
+
+def save_bars(ticker: str, interval: str, df: pd.DataFrame, meta: dict) -> None:
+    """Atomically write bars and metadata for a ticker+interval."""
+    _STORE_DIR.mkdir(parents=True, exist_ok=True)
+    data_path = _data_path(ticker, interval)
+    meta_path = _meta_path(ticker, interval)
+    tmp_data = data_path.with_suffix(".parquet.tmp")
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    df.to_parquet(tmp_data)
+    tmp_meta.write_text(json.dumps(meta))
+    os.replace(tmp_data, data_path)
+    os.replace(tmp_meta, meta_path)
+
+
+def merge_bars(stored: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Merge new bars into stored ones; new bars win on duplicate timestamps."""
+    merged = pd.concat([stored, new])
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def _covers(meta: dict, start: "pd.Timestamp | None") -> bool:
+    complete_from = meta.get("complete_from", "")
+    if complete_from is None:
+        return True  # holds the full ("max") history
+    if start is None or not complete_from:
+        return False
+    return pd.Timestamp(complete_from) <= start
+
+
+def _widest(a: "str | None", b: "pd.Timestamp | None") -> "str | None":
+    if a is None or b is None:
+        return None
+    if not a:
+        return b.isoformat()
+    return min(pd.Timestamp(a), b).isoformat()
+
+
+def _slice(df: pd.DataFrame, start: "pd.Timestamp | None") -> pd.DataFrame:
+    if start is None:
+        return df
+    return df.loc[df.index >= start]
+
+
+def _now_like(df: "pd.DataFrame | None") -> pd.Timestamp:
+    tz = getattr(df.index, "tz", None) if df is not None else None
+    return pd.Timestamp.now(tz=tz)
+
+
+def _tail_matches(stored: pd.DataFrame, delta: pd.DataFrame) -> bool:
+    anchor = stored.index[-2]
+    if anchor not in delta.index:
+        return False
+    old = stored.at[anchor, "Close"]
+    new = delta.at[anchor, "Close"]
+    return abs(new - old) <= _ADJUSTMENT_TOLERANCE * abs(old)
+
+
+def _save_full(
+    ticker: str,
+    interval: str,
+    full: pd.DataFrame,
+    start: "pd.Timestamp | None",
+    loaded: "tuple[pd.DataFrame, dict] | None",
+) -> None:
+    """Store a full-period fetch, merging with existing bars when compatible."""
+    if loaded is not None:
+        stored, meta = loaded
+        if len(stored) < 2 or _tail_matches(stored, full):
+            save_bars(ticker, interval, merge_bars(stored, full),
+                      {"complete_from": _widest(meta.get("complete_from", ""), start)})
+            return
+    # Nothing stored, or the stored history was re-adjusted since: replace it
+    save_bars(ticker, interval, full, {"complete_from": _widest("", start)})
+
+
+def record_fetch(ticker: str, period: str, interval: str, df: pd.DataFrame) -> None:
+    """Persist a full-period fetch made elsewhere (e.g. a bulk download)."""
+    if not supports(period, interval) or df.empty:
+        return
+    with _lock_for(ticker, interval):
+        _save_full(ticker, interval, df, period_start(period, _now_like(df)),
+                   load_bars(ticker, interval))
+
+
+def fetch_with_store(
+    ticker: str, period: str, interval: str, fetch: Fetcher
+) -> pd.DataFrame:
+    """Return bars for *period*, downloading only what the store is missing.
+
+    Args:
+        ticker: Ticker symbol.
+        period: Requested period (must satisfy supports()).
+        interval: Bar interval (must satisfy supports()).
+        fetch: Callable taking yfinance history() keyword arguments
+            (``period=`` or ``start=``) and returning a validated OHLCV frame.
+
+    Falls back to the stored bars if the incremental download fails.
+    """
+    with _lock_for(ticker, interval):
+        loaded = load_bars(ticker, interval)
+        if loaded is not None:
+            stored, meta = loaded
+            start = period_start(period, _now_like(stored))
+            if _covers(meta, start) and len(stored) >= 2:
+                try:
+                    delta = fetch(start=stored.index[-2])
+                except Exception:
+                    return _slice(stored, start)
+                if _tail_matches(stored, delta):
+                    merged = merge_bars(stored, delta)
+                    if len(merged) != len(stored) or not merged.iloc[-1].equals(stored.iloc[-1]):
+                        save_bars(ticker, interval, merged, meta)
+                    return _slice(merged, start)
+                # History was re-adjusted: the stored bars can't be patched
+                loaded = None
+
+        full = fetch(period=period)
+        _save_full(ticker, interval, full, period_start(period, _now_like(full)), loaded)
+        return full
+
+
+def clear_store() -> None:
+    """Delete all stored bars."""
+    if not _STORE_DIR.exists():
+        return
+    for path in _STORE_DIR.iterdir():
+        if path.suffix in (".parquet", ".json", ".tmp"):
+            path.unlink(missing_ok=True)
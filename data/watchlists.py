@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+from config.settings import WATCHLIST_PRESETS
+
 _WATCHLIST_DIR = Path.home() / ".capitalisman"
 _WATCHLIST_FILE = _WATCHLIST_DIR / "watchlists.json"
 
@@ -45,3 +47,17 @@ def delete_watchlist(name: str) -> bool:
     _ensure_dir()
     _WATCHLIST_FILE.write_text(json.dumps(watchlists, indent=2))
     return True
+
+
+def get_watchlist(name: str) -> list[str]:
+    """Return the tickers of a saved watchlist or built-in preset.
+
+    Saved watchlists take precedence over presets with the same name.
+    Raises ValueError if neither exists.
+    """
+    saved = load_watchlists()
+    if name in saved:
+        return list(saved[name])
+    if name in WATCHLIST_PRESETS:
+        return list(WATCHLIST_PRESETS[name])
+    raise ValueError(f"Unknown watchlist '{name}'.")
@@ -0,0 +1,182 @@
+"""Running-window building blocks for incremental indicator updates.
+
+Each helper takes one value per bar and updates its statistic in O(1),
+following the same arithmetic as the pandas operation it replaces
+(compensated rolling sums, Welford variance, pandas' ``ewm`` recursion),
+so streamed values agree with a full recompute to rounding error.
+
+Streamed bars are assumed to have finite prices; NaN values are only
+handled where indicators produce them themselves (e.g. a MACD line
+before its slow EMA is ready).
+"""
+
+import math
+from collections import deque
+from types import SimpleNamespace
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+NAN = float("nan")
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class StreamState(SimpleNamespace):
+    """Incremental state of one indicator: ``bars`` seen plus its running windows."""
+
+
+class Bar(dict):
+    """One bar's OHLCV values, named by its timestamp like a row of a frame."""
+
+    def __init__(self, values, name=None):
+        super().__init__(values)
+        self.name = name
+
+
+def iter_bars(df: pd.DataFrame) -> Iterator[Bar]:
+    """df's rows as bars for ``BaseIndicator.update``, oldest first."""
+    columns = [c for c in OHLCV if c in df.columns]
+    for name, values in zip(df.index, df[columns].to_numpy(dtype=float).tolist()):
+        yield Bar(zip(columns, values), name)
+
+
+def replay(indicator, state: StreamState, df: pd.DataFrame) -> StreamState:
+    """Feed every bar of df through indicator.update(state, bar)."""
+    for bar in iter_bars(df):
+        indicator.update(state, bar)
+    return state
+
+
+def last_value(values) -> float:
+    """The last bar's value of a compute_columns() entry (array, Series or scalar)."""
+    if np.ndim(values) == 0:
+        return float(values)
+    return float(np.asarray(values)[-1])
+
+
+def ratio(numerator: float, denominator: float) -> float:
+    """numerator / denominator with pandas' semantics for a zero denominator."""
+    if denominator == 0 or math.isnan(denominator):
+        if denominator == 0 and numerator != 0 and not math.isnan(numerator):
+            return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+        return NAN
+    return numerator / denominator
+
+
+class RollingWindow:
+    """Sum, mean and standard deviation over the last *size* values.
+
+    NaN values take up a slot in the window but are not counted, as in
+    pandas' rolling aggregations.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque[float] = deque()
+        self.count = 0  # non-NaN values in the window
+        self._sum = 0.0
+        self._compensation = 0.0  # Kahan summation error term
+        self._mean = 0.0  # Welford running mean and sum of squared deviations
+        self._ssqdm = 0.0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.size:
+            old = self.values.popleft()
+            if not math.isnan(old):
+                self._remove(old)
+        self.values.append(value)
+        if not math.isnan(value):
+            self._add(value)
+
+    def _kahan(self, value: float) -> None:
+        y = value - self._compensation
+        t = self._sum + y
+        self._compensation = (t - self._sum) - y
+        self._sum = t
+
+    def _add(self, value: float) -> None:
+        self.count += 1
+        self._kahan(value)
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._ssqdm += ((self.count - 1) * delta * delta) / self.count
+
+    def _remove(self, value: float) -> None:
+        self.count -= 1
+        self._kahan(-value)
+        if self.count:
+            delta = value - self._mean
+            self._mean -= delta / self.count
+            self._ssqdm -= ((self.count + 1) * delta * delta) / self.count
+        else:
+            self._sum = self._compensation = self._mean = self._ssqdm = 0.0
+
+    def sum(self, min_periods: int | None = None) -> float:
+        return self._sum if self.count >= (min_periods or self.size) else NAN
+
+    def mean(self, min_periods: int | None = None) -> float:
+        return self._sum / self.count if self.count >= (min_periods or self.size) else NAN
+
+    def std(self, ddof: int = 1, min_periods: int | None = None) -> float:
+        if self.count < (min_periods or self.size) or self.count <= ddof:
+            return NAN
+        return math.sqrt(max(self._ssqdm, 0.0) / (self.count - ddof))
+
+
+class RollingExtreme:
+    """Minimum or maximum of the last *size* values (monotonic deque)."""
+
+    def __init__(self, size: int, largest: bool):
+        self.size = size
+        self.largest = largest
+        self._position = 0
+        self._candidates: deque[tuple[int, float]] = deque()
+
+    def push(self, value: float) -> float:
+        """Add a value; return the window's extreme, or NaN until it is full."""
+        candidates = self._candidates
+        if self.largest:
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= value:
+                candidates.pop()
+        candidates.append((self._position, value))
+        if candidates[0][0] <= self._position - self.size:
+            candidates.popleft()
+        self._position += 1
+        return candidates[0][1] if self._position >= self.size else NAN
+
+
+class Ewm:
+    """``Series.ewm(..., adjust=False).mean()``, one value at a time."""
+
+    def __init__(self, com: float, min_periods: int = 0):
+        # pandas turns span and alpha into a centre of mass, then back
+        self.alpha = 1.0 / (1.0 + com)
+        self.min_periods = min_periods
+        self.value = NAN
+        self.count = 0
+
+    @classmethod
+    def from_span(cls, span: int, min_periods: int) -> "Ewm":
+        return cls((span - 1) / 2.0, min_periods)
+
+    @classmethod
+    def from_alpha(cls, alpha: float, min_periods: int) -> "Ewm":
+        return cls((1.0 - alpha) / alpha, min_periods)
+
+    def push(self, value: float) -> float:
+        """Add a value; return the average, or NaN before min_periods values."""
+        observed = not math.isnan(value)
+        self.count += observed
+        if not math.isnan(self.value):
+            if observed and self.value != value:
+                old_weight = 1.0 - self.alpha
+                self.value = (old_weight * self.value + self.alpha * value) / (
+                    old_weight + self.alpha
+                )
+        elif observed:
+            self.value = value
+        return self.value if self.count >= self.min_periods else NAN
@@ -4,37 +4,170 @@ Provides cached reference data fetching and date-index alignment for
 indicators that need data from other tickers (e.g., copper, gold, VIX).
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
-# Module-level cache survives across calls within the same process.
-# For Streamlit apps this means the reference data is fetched once per
-# server lifetime, which is fine for slow-moving macro data.
-_reference_cache: dict[str, "pd.Series | None"] = {}
+from config import settings
+from data.cache import TTLCache
 
+# Process-wide cache shared by every session of the app.  Entries expire so
+# a long-running server picks up fresh macro data, and failed downloads are
+# cached only briefly so a transient network error doesn't stick.
+_reference_cache: TTLCache[str, pd.Series] = TTLCache(
+    ttl=settings.REFERENCE_CACHE_TTL_SECONDS,
+    negative_ttl=settings.REFERENCE_CACHE_NEGATIVE_TTL_SECONDS,
+    maxsize=settings.REFERENCE_CACHE_MAX_ENTRIES,
+    name="Reference prices",
+)
 
-def fetch_reference_close(ticker: str, period: str = "2y") -> "pd.Series | None":
-    """Fetch close prices for a reference ticker with in-process caching.
+_prefetch_lock = threading.Lock()
+_prefetch_thread: "threading.Thread | None" = None
 
-    Returns None on any failure (network, invalid ticker, etc.).
-    """
-    cache_key = f"{ticker}_{period}"
-    if cache_key in _reference_cache:
-        return _reference_cache[cache_key]
+
+def _cache_key(ticker: str, period: str) -> str:
+    return f"{ticker}_{period}"
+
+
+def _download_close(ticker: str, period: str) -> "pd.Series | None":
     try:
         import yfinance as yf
 
         df = yf.Ticker(ticker).history(period=period)
         if df is not None and not df.empty and "Close" in df.columns:
-            result = df["Close"]
-            _reference_cache[cache_key] = result
-            return result
+            return df["Close"]
     except Exception:
         pass
-    _reference_cache[cache_key] = None
     return None
 
 
+def fetch_reference_close(ticker: str, period: str = "2y") -> "pd.Series | None":
+    """Fetch close prices for a reference ticker with in-process caching.
+
+    Concurrent requests for the same ticker share a single download.
+    Returns None on any failure (network, invalid ticker, etc.).
+    """
+    return _reference_cache.get_or_load(
+        _cache_key(ticker, period), lambda: _download_close(ticker, period)
+    )
+
+
+def prefetch_reference_closes(tickers: list[str], period: str = "2y") -> None:
+    """Warm the reference cache for several tickers with one bulk download.
+
+    Tickers already cached are skipped.  Tickers missing from the bulk
+    result are left uncached so fetch_reference_close() retries them
+    individually.
+    """
+    by_key = {_cache_key(t, period): t for t in tickers}
+
+    def _bulk(missing: list[str]) -> dict[str, pd.Series]:
+        if len(missing) < 2:
+            return {}
+        from data.fetcher import download_ohlcv_many
+
+        frames = download_ohlcv_many([by_key[k] for k in missing], period=period)
+        return {_cache_key(t, period): df["Close"] for t, df in frames.items()}
+
+    try:
+        _reference_cache.get_many_or_load(by_key, _bulk)
+    except Exception:
+        pass
+
+
+def reference_tickers() -> list[str]:
+    """All reference tickers used by the registered indicators."""
+    from indicators.registry import get_all_indicators
+
+    tickers: dict[str, None] = {}
+    for indicator in get_all_indicators().values():
+        tickers.update(dict.fromkeys(indicator.reference_tickers))
+    return list(tickers)
+
+
+def prefetch_reference_data(period: str = "2y", max_workers: int = 8) -> None:
+    """Load every indicator's reference data concurrently.
+
+    One bulk download covers most tickers; any it misses are fetched
+    individually in parallel.
+    """
+    tickers = reference_tickers()
+    prefetch_reference_closes(tickers, period=period)
+    missing = [t for t in tickers if _cache_key(t, period) not in _reference_cache]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reference") as pool:
+            list(pool.map(lambda t: fetch_reference_close(t, period), missing))
+
+
+def start_reference_prefetch(period: str = "2y") -> "threading.Thread | None":
+    """Prefetch reference data on a background thread if any of it is stale.
+
+    Cheap to call on every page run: returns None without starting a thread
+    while a prefetch is already running or all reference data is cached.
+    """
+    global _prefetch_thread
+    with _prefetch_lock:
+        if _prefetch_thread is not None and _prefetch_thread.is_alive():
+            return None
+        if all(_cache_key(t, period) in _reference_cache for t in reference_tickers()):
+            return None
+        _prefetch_thread = threading.Thread(
+            target=prefetch_reference_data,
+            kwargs={"period": period},
+            name="reference-prefetch",
+            daemon=True,
+        )
+        _prefetch_thread.start()
+        return _prefetch_thread
+
+
+# Alignment is repeated for the same indexes many times per run (every
+# reference series against every target ticker's index), so the normalized
+# indexes and the resulting positional indexers are memoized by content.
+_normalized_index_cache: TTLCache[tuple, pd.DatetimeIndex] = TTLCache(
+    ttl=None, maxsize=256, name="Normalized dates"
+)
+_indexer_cache: TTLCache[tuple, np.ndarray] = TTLCache(ttl=None, maxsize=512, name="Date alignment")
+
+
+def _index_fingerprint(index: pd.Index) -> tuple:
+    """Cheap content key for an index (length, tz and a hash of its values)."""
+    if isinstance(index, pd.DatetimeIndex):
+        return (len(index), str(index.tz), hash(index.asi8.tobytes()))
+    return (len(index), hash(tuple(index)))
+
+
+def _normalized_dates(index: pd.Index, key: tuple) -> pd.DatetimeIndex:
+    """tz-naive, midnight-normalised copy of index (memoized)."""
+
+    def _normalize() -> pd.DatetimeIndex:
+        dates = pd.DatetimeIndex(index)
+        # Strip timezone info for consistent joining
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        # Normalise to midnight (date-only) for date-based alignment
+        return dates.normalize()
+
+    return _normalized_index_cache.get_or_load(key, _normalize)
+
+
+def _ffill_indexer(series_index: pd.Index, target_index: pd.Index) -> np.ndarray:
+    """Positions in series_index to forward-fill onto target_index (-1 = none)."""
+    series_key = _index_fingerprint(series_index)
+    target_key = _index_fingerprint(target_index)
+
+    def _compute() -> np.ndarray:
+        source = _normalized_dates(series_index, series_key)
+        target = _normalized_dates(target_index, target_key)
+        indexer = source.get_indexer(target, method="ffill")
+        indexer.flags.writeable = False
+        return indexer
+
+    return _indexer_cache.get_or_load((series_key, target_key), _compute)
+
+
 def align_to_index(
     series: "pd.Series | None", target_index: pd.DatetimeIndex
 ) -> pd.Series:
@@ -46,25 +179,18 @@ def align_to_index(
     if series is None:
         return pd.Series(np.nan, index=target_index)
 
-    series = series.copy()
-
-    # Strip timezone info for consistent joining
-    if hasattr(series.index, "tz") and series.index.tz is not None:
-        series.index = series.index.tz_localize(None)
-    if hasattr(target_index, "tz") and target_index.tz is not None:
-        norm_target = target_index.tz_localize(None)
+    indexer = _ffill_indexer(series.index, target_index)
+    values = series.to_numpy()
+    missing = indexer < 0
+    if missing.any():
+        aligned = np.where(missing, np.nan, values.take(np.where(missing, 0, indexer)))
     else:
-        norm_target = target_index
-
-    # Normalise to midnight (date-only) for date-based alignment
-    series.index = series.index.normalize()
-    norm_target = norm_target.normalize()
-
-    aligned = series.reindex(norm_target, method="ffill")
-    aligned.index = target_index  # restore original target index
-    return aligned
+        aligned = values.take(indexer)
+    return pd.Series(aligned, index=target_index, name=series.name)
 
 
 def clear_reference_cache() -> None:
-    """Clear the reference data cache (useful for testing)."""
+    """Clear the reference data and alignment caches (useful for testing)."""
     _reference_cache.clear()
+    _normalized_index_cache.clear()
+    _indexer_cache.clear()
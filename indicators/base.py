@@ -1,11 +1,15 @@
 """Base indicator abstract class."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any, Mapping
 
 import pandas as pd
 
-from signals.base import SignalResult
+from indicators._streaming import OHLCV, StreamState, last_value
+from signals.base import SignalResult, SignalSeries
+
+if TYPE_CHECKING:
+    from indicators.features import Feature
 
 
 class BaseIndicator(ABC):
@@ -26,13 +30,86 @@ class BaseIndicator(ABC):
     def lookback(self) -> int:
         """Minimum number of bars needed before the indicator produces valid values."""
 
-    @abstractmethod
+    @property
+    def reference_tickers(self) -> tuple[str, ...]:
+        """Other tickers whose prices compute() fetches (e.g. for cross-asset signals)."""
+        return ()
+
+    @property
+    def features(self) -> tuple["Feature", ...]:
+        """Shared intermediate features compute_columns() reads.
+
+        Indicators that declare features receive the frame's FeatureStore
+        as compute_columns()' second argument, shared with every other
+        indicator computed over the same frame.
+        """
+        return ()
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Parameters that determine compute()'s output, for cache keys.
+
+        The default collects the class's upper-case constants (window
+        lengths and the like).  Indicators that read settings in compute()
+        must include those values too.
+        """
+        return {
+            attr: getattr(self, attr)
+            for attr in dir(type(self))
+            if attr.isupper() and not callable(getattr(self, attr))
+        }
+
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Compute indicator values as new columns for df.
+
+        Returns a dict of column name -> values (arrays or Series aligned
+        with df, or scalars), without copying or modifying df.  Indicators
+        implement this or compute(); the default adapts compute().
+        Indicators that declare ``features`` take a FeatureStore as a
+        second, optional argument.
+        """
+        if type(self).compute is BaseIndicator.compute:
+            raise NotImplementedError(
+                f"{type(self).__name__} must implement compute_columns() or compute()"
+            )
+        computed = self.compute(df)
+        return {c: computed[c] for c in computed.columns if c not in df.columns}
+
     def compute(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute indicator values and add columns to a copy of df.
 
         Must not modify the input DataFrame.
         Returns DataFrame with additional indicator columns.
         """
+        return df.assign(**self.compute_columns(df))
+
+    def init_state(self, df: pd.DataFrame) -> Any:
+        """State from which update() continues after df's last bar.
+
+        The default keeps the price history, and update() recomputes the
+        indicator over all of it.  The history keeps df's length (at least
+        the lookback), dropping the oldest bar as each new one arrives, so
+        a long-running stream doesn't grow.  Indicators built from running
+        windows override both to update in O(1) per bar.  The state is
+        tied to the parameters in effect when it was created.
+        """
+        history = df[[c for c in OHLCV if c in df.columns]].copy()
+        history.attrs = dict(df.attrs)
+        return StreamState(history=history, max_bars=max(len(history), self.lookback))
+
+    def update(self, state: Any, bar: Mapping[str, float]) -> dict[str, float]:
+        """Advance state by one bar and return the indicator's columns at it.
+
+        bar holds the new bar's OHLCV values and is named by its timestamp,
+        like a row of a price frame.  The values match what compute() gives
+        for the last bar of the frame with bar appended.
+        """
+        history = state.history
+        row = pd.DataFrame([{c: bar[c] for c in history.columns}], index=[bar.name])
+        state.history = pd.concat([history, row.astype(history.dtypes)]).iloc[-state.max_bars:]
+        state.history.attrs = history.attrs
+        columns = self.compute_columns(state.history)
+        return {name: last_value(values) for name, values in columns.items()}
 
     @abstractmethod
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
@@ -46,6 +123,19 @@ class BaseIndicator(ABC):
             SignalResult with direction and confidence.
         """
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        """Generate signals for every bar of df at once.
+
+        Equivalent to calling get_signal(df, idx) for each bar.  The default
+        does exactly that; indicators override it with a vectorized version.
+
+        Args:
+            df: DataFrame with indicator columns already computed.
+        """
+        return SignalSeries.from_results(
+            self.name, [self.get_signal(df, idx=i) for i in range(len(df))]
+        )
+
     @abstractmethod
     def get_chart_config(self) -> dict[str, Any]:
         """Return chart overlay/subplot configuration.
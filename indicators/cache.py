@@ -0,0 +1,70 @@
+"""Process-wide cache of computed indicator columns.
+
+Every page computes indicators over the same fetched frames, and
+Streamlit reruns the whole script on each widget change.  Indicator
+columns depend only on the price data and the indicator's parameters —
+not on signal thresholds or weights — so they are cached here and
+shared by all pages, reruns and sessions.  A threshold slider then only
+re-runs the cheap signal step.
+
+Entries are keyed by the frame's identity (ticker, interval, first and
+last bar, bar count and the last bar's values, which change while a
+bar is still forming), the indicator's name and its ``params``.  Frames
+without a ``ticker`` in ``df.attrs`` (e.g. synthetic data) are never
+cached.  ``indicators.pipeline`` assembles frames from these entries.
+"""
+
+from typing import Callable
+
+import pandas as pd
+
+from config import settings
+from data.cache import CacheStats, TTLCache
+from indicators.base import BaseIndicator
+
+_OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+_column_cache: TTLCache[tuple, pd.DataFrame] = TTLCache(
+    ttl=settings.INDICATOR_CACHE_TTL_SECONDS,
+    maxsize=settings.INDICATOR_CACHE_MAX_ENTRIES,
+    name="Indicator columns",
+)
+
+
+def frame_key(df: pd.DataFrame) -> tuple | None:
+    """Identity of a fetched price frame, or None if it can't be identified."""
+    ticker = df.attrs.get("ticker")
+    if not ticker or df.empty:
+        return None
+    last_bar = tuple(df[c].iloc[-1].item() for c in _OHLCV if c in df.columns)
+    return (ticker, df.attrs.get("interval"), df.index[0], df.index[-1], len(df), last_bar)
+
+
+def params_key(indicator: BaseIndicator) -> tuple:
+    """Hashable form of the indicator's ``params``."""
+    return tuple(sorted((k, repr(v)) for k, v in indicator.params.items()))
+
+
+def cached_columns(
+    indicator: BaseIndicator, key: tuple, load: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """The indicator's columns for the frame identified by key, loaded once.
+
+    ``load()`` must compute them from the frame's OHLCV columns alone, so
+    entries never depend on columns an earlier step added.
+    """
+    return _column_cache.get_or_load(key + (indicator.name, params_key(indicator)), load)
+
+
+def has_columns(indicator: BaseIndicator, key: tuple) -> bool:
+    """Whether the indicator's columns for the frame identified by key are cached."""
+    return key + (indicator.name, params_key(indicator)) in _column_cache
+
+
+def cache_stats() -> CacheStats:
+    """Hit/miss counters of the indicator column cache."""
+    return _column_cache.stats
+
+
+def clear_indicator_cache() -> None:
+    _column_cache.clear()
@@ -0,0 +1,136 @@
+"""Intermediate series shared by several indicators.
+
+Many indicators start from the same primitives: EMA Crossover and MACD
+both smooth Close with 12- and 26-bar EMAs, SMA Crossover and Bollinger
+Bands both take a 20-bar mean of Close.  An indicator declares the
+features it reads in its ``features`` property and looks them up in a
+``FeatureStore``.  The store computes each feature at most once per
+price frame, so indicators computed together share the work.
+
+A feature is identified by its kind, its source and its window.  The
+source is a price column or another feature, so features form a DAG
+(see ``indicators.registry.feature_graph``); e.g. ``log_return()`` is
+the first difference of ``log_price()``.
+"""
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from indicators.registry import get_feature_function, register_feature
+
+
+@dataclass(frozen=True)
+class Feature:
+    """An intermediate series computed from a price frame."""
+
+    kind: str
+    source: "str | Feature | None" = "Close"  # price column or feature it is computed from
+    window: int | None = None
+
+    @property
+    def dependencies(self) -> tuple["Feature", ...]:
+        """Features this one is computed from."""
+        return (self.source,) if isinstance(self.source, Feature) else ()
+
+
+def sma(window: int, column: str = "Close") -> Feature:
+    return Feature("sma", column, window)
+
+
+def ema(window: int, column: str = "Close") -> Feature:
+    return Feature("ema", column, window)
+
+
+def rolling_std(window: int, column: str = "Close") -> Feature:
+    """Population (ddof=0) standard deviation, as Bollinger Bands use."""
+    return Feature("std", column, window)
+
+
+def log_price(column: str = "Close") -> Feature:
+    return Feature("log", column)
+
+
+def log_return(column: str = "Close") -> Feature:
+    """Bar-to-bar log return; NaN on the first bar."""
+    return Feature("diff", log_price(column))
+
+
+def typical_price() -> Feature:
+    """(High + Low + Close) / 3."""
+    return Feature("typical_price", None)
+
+
+class FeatureStore:
+    """Features of one price frame, each computed at most once.
+
+    Safe to share between threads: a thread asking for a feature another
+    thread is computing waits for that result.
+    """
+
+    def __init__(self, prices: pd.DataFrame):
+        self.prices = prices
+        self._results: dict[Feature, Future] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, feature: Feature) -> pd.Series:
+        with self._lock:
+            result = self._results.get(feature)
+            owner = result is None
+            if owner:
+                result = self._results[feature] = Future()
+        if owner:
+            try:
+                result.set_result(get_feature_function(feature.kind)(self, feature))
+            except BaseException as e:
+                result.set_exception(e)
+                raise
+        return result.result()
+
+    def __len__(self) -> int:
+        """Number of features requested so far."""
+        with self._lock:
+            return len(self._results)
+
+    def source(self, feature: Feature) -> pd.Series:
+        """The price column or feature *feature* is computed from."""
+        if isinstance(feature.source, Feature):
+            return self[feature.source]
+        return self.prices[feature.source]
+
+
+@register_feature("sma")
+def _sma(store: FeatureStore, feature: Feature) -> pd.Series:
+    return store.source(feature).rolling(feature.window, min_periods=feature.window).mean()
+
+
+@register_feature("ema")
+def _ema(store: FeatureStore, feature: Feature) -> pd.Series:
+    return store.source(feature).ewm(
+        span=feature.window, min_periods=feature.window, adjust=False
+    ).mean()
+
+
+@register_feature("std")
+def _rolling_std(store: FeatureStore, feature: Feature) -> pd.Series:
+    return store.source(feature).rolling(feature.window, min_periods=feature.window).std(ddof=0)
+
+
+@register_feature("log")
+def _log(store: FeatureStore, feature: Feature) -> pd.Series:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log(store.source(feature))
+
+
+@register_feature("diff")
+def _diff(store: FeatureStore, feature: Feature) -> pd.Series:
+    return store.source(feature).diff()
+
+
+@register_feature("typical_price")
+def _typical_price(store: FeatureStore, feature: Feature) -> pd.Series:
+    prices = store.prices
+    return (prices["High"] + prices["Low"] + prices["Close"]) / 3
@@ -15,7 +15,7 @@ import pandas as pd
 from indicators._utils import align_to_index, fetch_reference_close
 from indicators.base import BaseIndicator
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 # ---------------------------------------------------------------------------
@@ -47,9 +47,11 @@ class CopperGoldRatio(BaseIndicator):
     def lookback(self) -> int:
         return self.SMA_LONG
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def reference_tickers(self) -> tuple[str, ...]:
+        return ("HG=F", "GC=F")
 
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         copper = fetch_reference_close("HG=F")
         gold = fetch_reference_close("GC=F")
 
@@ -59,12 +61,12 @@ class CopperGoldRatio(BaseIndicator):
         ratio = copper_aligned / gold_aligned
         ratio = ratio.replace([np.inf, -np.inf], np.nan)
 
-        df["CG_ratio"] = ratio
-        df["CG_SMA_short"] = ratio.rolling(window=self.SMA_SHORT, min_periods=1).mean()
-        df["CG_SMA_long"] = ratio.rolling(window=self.SMA_LONG, min_periods=1).mean()
-        df["CG_roc"] = ratio.pct_change(periods=20, fill_method=None)
-
-        return df
+        return {
+            "CG_ratio": ratio,
+            "CG_SMA_short": ratio.rolling(window=self.SMA_SHORT, min_periods=1).mean(),
+            "CG_SMA_long": ratio.rolling(window=self.SMA_LONG, min_periods=1).mean(),
+            "CG_roc": ratio.pct_change(periods=20, fill_method=None),
+        }
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "CG_ratio" not in df.columns:
@@ -107,6 +109,26 @@ class CopperGoldRatio(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.0,
                             f"Cu/Au ratio neutral ({ratio:.5f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "CG_ratio" not in df.columns:
+            df = self.compute(df)
+
+        ratio = df["CG_ratio"].to_numpy(dtype=float)
+        sma_s = df["CG_SMA_short"].to_numpy(dtype=float)
+        sma_l = df["CG_SMA_long"].to_numpy(dtype=float)
+        roc = df["CG_roc"].to_numpy(dtype=float)
+
+        roc_conf = np.where(np.isnan(roc), 0.3, np.abs(roc) * 5)
+        missing = np.isnan(ratio) | np.isnan(sma_s) | np.isnan(sma_l)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            ((ratio > sma_s) & (sma_s > sma_l), SignalDirection.BUY, np.fmin(0.8, roc_conf)),
+            ((ratio < sma_s) & (sma_s < sma_l), SignalDirection.SELL, np.fmin(0.8, roc_conf)),
+            (ratio > sma_s, SignalDirection.BUY, np.fmin(0.4, roc_conf * 0.6)),
+            (ratio < sma_s, SignalDirection.SELL, np.fmin(0.4, roc_conf * 0.6)),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -146,22 +168,24 @@ class VIXTermStructure(BaseIndicator):
     def lookback(self) -> int:
         return 20
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def reference_tickers(self) -> tuple[str, ...]:
+        return ("^VIX", "^VIX3M")
 
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         vix = fetch_reference_close("^VIX")
         vix3m = fetch_reference_close("^VIX3M")
 
         vix_aligned = align_to_index(vix, df.index)
         vix3m_aligned = align_to_index(vix3m, df.index)
 
-        df["VIX"] = vix_aligned
-        df["VIX3M"] = vix3m_aligned
-        # Positive spread = contango (normal), negative = backwardation (stress)
-        df["VIX_spread"] = vix3m_aligned - vix_aligned
-        df["VIX_ratio"] = vix_aligned / vix3m_aligned
-
-        return df
+        return {
+            "VIX": vix_aligned,
+            "VIX3M": vix3m_aligned,
+            # Positive spread = contango (normal), negative = backwardation (stress)
+            "VIX_spread": vix3m_aligned - vix_aligned,
+            "VIX_ratio": vix_aligned / vix3m_aligned,
+        }
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "VIX" not in df.columns:
@@ -202,6 +226,22 @@ class VIXTermStructure(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.1,
                             f"VIX near parity ({vix:.1f} vs {vix3m:.1f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "VIX" not in df.columns:
+            df = self.compute(df)
+
+        vix = df["VIX"].to_numpy(dtype=float)
+        vix3m = df["VIX3M"].to_numpy(dtype=float)
+        ratio = df["VIX_ratio"].to_numpy(dtype=float)
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(vix) | np.isnan(vix3m) | (vix3m == 0), SignalDirection.HOLD, 0.0),
+            (ratio > 1.10, SignalDirection.SELL, np.fmin(0.9, (ratio - 1.0) * 2)),
+            (ratio > 1.0, SignalDirection.SELL, np.fmin(0.6, (ratio - 1.0) * 5)),
+            ((vix < 13) & (ratio < 0.85), SignalDirection.HOLD, 0.3),
+            (ratio < 0.95, SignalDirection.BUY, np.fmin(0.5, (1.0 - ratio) * 3)),
+        ], default=(SignalDirection.HOLD, 0.1))
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
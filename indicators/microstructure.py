@@ -4,18 +4,29 @@ Uses Bulk Volume Classification (BVC) to estimate trade-flow toxicity from
 standard OHLCV data.  High VPIN indicates elevated informed-trading activity
 and reliably predicts short-term volatility spikes and adverse price moves.
 
+Two sampling modes are supported (``settings.VPIN_MODE``):
+
+- "time": imbalance over a fixed window of the chart's own bars.
+- "volume": the volume clock of the paper — intraday bars are streamed into
+  equal-volume buckets and VPIN is taken over the last N completed buckets,
+  then mapped back onto the chart's index.
+
 Reference: Easley, López de Prado & O'Hara (2012), "Flow Toxicity and
 Liquidity in a High-Frequency World".
 """
 
-from typing import Any
+from collections import deque
+from typing import Any, Mapping
 
 import numpy as np
 import pandas as pd
 
+from config import settings
+from indicators._streaming import NAN, RollingWindow, StreamState, ratio, replay
+from indicators._utils import align_to_index
 from indicators.base import BaseIndicator
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 def _norm_cdf(z: np.ndarray) -> np.ndarray:
@@ -37,6 +48,132 @@ def _norm_cdf(z: np.ndarray) -> np.ndarray:
     return np.where(z >= 0, phi, 1.0 - phi)
 
 
+def _buy_fraction(df: pd.DataFrame) -> np.ndarray:
+    """Bulk Volume Classification: estimated buy-initiated share of each bar."""
+    # Bar range as volatility proxy for BVC
+    sigma = df["High"].values - df["Low"].values
+    sigma = np.where(sigma <= 0, 1e-10, sigma)
+
+    # Normalised price change → normal CDF → buy-fraction
+    z = (df["Close"].values - df["Open"].values) / sigma
+    return _norm_cdf(z)
+
+
+class VolumeBucketVPIN:
+    """Streaming volume-clock VPIN accumulator.
+
+    Bars are fed one at a time and their volume is poured into buckets of
+    exactly ``bucket_volume`` shares, splitting a bar across buckets where
+    needed.  Only the order-flow imbalance of the last ``n_buckets`` completed
+    buckets is kept (a ring buffer), so memory stays constant however long
+    the stream is.
+    """
+
+    def __init__(self, bucket_volume: float, n_buckets: int = 50):
+        if not bucket_volume > 0:
+            raise ValueError("bucket_volume must be positive")
+        self.bucket_volume = float(bucket_volume)
+        self.n_buckets = n_buckets
+        self.buckets_completed = 0
+        self._imbalances: deque[float] = deque(maxlen=n_buckets)
+        self._filled = 0.0  # volume in the current, incomplete bucket
+        self._net_flow = 0.0  # buy − sell volume in the current bucket
+
+    @property
+    def vpin(self) -> float:
+        """VPIN over the last n_buckets completed buckets (NaN until that many exist)."""
+        if len(self._imbalances) < self.n_buckets:
+            return float("nan")
+        return sum(self._imbalances) / (self.n_buckets * self.bucket_volume)
+
+    def add_bar(self, volume: float, buy_fraction: float) -> float:
+        """Add one bar's volume with its BVC buy fraction; return the current VPIN."""
+        if not (volume > 0 and np.isfinite(volume) and np.isfinite(buy_fraction)):
+            return self.vpin
+
+        flow = 2.0 * buy_fraction - 1.0  # net buy share of each unit of volume
+        remaining = float(volume)
+
+        # Top up the bucket in progress
+        take = min(remaining, self.bucket_volume - self._filled)
+        self._filled += take
+        self._net_flow += take * flow
+        remaining -= take
+        if self._filled >= self.bucket_volume * (1 - 1e-12):
+            self._complete(abs(self._net_flow))
+
+        # Whole buckets filled by this bar all carry the same imbalance
+        full = int(remaining // self.bucket_volume)
+        if full:
+            imbalance = self.bucket_volume * abs(flow)
+            self._imbalances.extend([imbalance] * min(full, self.n_buckets))
+            self.buckets_completed += full
+            remaining -= full * self.bucket_volume
+
+        if remaining > 0:
+            self._filled = remaining
+            self._net_flow = remaining * flow
+        return self.vpin
+
+    def _complete(self, imbalance: float) -> None:
+        self._imbalances.append(imbalance)
+        self.buckets_completed += 1
+        self._filled = 0.0
+        self._net_flow = 0.0
+
+
+def volume_clock_vpin(
+    intraday: pd.DataFrame,
+    bucket_volume: "float | None" = None,
+    n_buckets: int = 50,
+    buckets_per_day: int = 50,
+) -> pd.Series:
+    """Volume-clock VPIN after each bar of an intraday OHLCV frame.
+
+    Args:
+        intraday: Intraday OHLCV bars (e.g. 1m or 5m), oldest first.
+        bucket_volume: Shares per bucket.  Defaults to the average daily
+            volume of *intraday* divided by *buckets_per_day*.
+        n_buckets: Completed buckets VPIN is measured over.
+        buckets_per_day: Used only to derive the default bucket size.
+
+    Returns:
+        Series on the intraday index; NaN until n_buckets buckets complete.
+    """
+    volume = intraday["Volume"].to_numpy(dtype=float)
+    if bucket_volume is None:
+        days = intraday.index.normalize().nunique()
+        bucket_volume = np.nansum(volume) / max(days, 1) / buckets_per_day
+    if not bucket_volume > 0:
+        return pd.Series(np.nan, index=intraday.index)
+
+    buy_frac = _buy_fraction(intraday)
+    accumulator = VolumeBucketVPIN(bucket_volume, n_buckets)
+    values = np.fromiter(
+        (accumulator.add_bar(v, f) for v, f in zip(volume, buy_frac)),
+        dtype=float,
+        count=len(volume),
+    )
+    return pd.Series(values, index=intraday.index)
+
+
+def _is_intraday(index: pd.Index) -> bool:
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+        return False
+    return (index[1:] - index[:-1]).min() < pd.Timedelta(days=1)
+
+
+def _fetch_intraday(ticker: str) -> "pd.DataFrame | None":
+    """Intraday bars for the volume-clock mode, or None if unavailable."""
+    try:
+        from data.fetcher import fetch_ohlcv
+
+        return fetch_ohlcv(ticker, period=settings.VPIN_INTRADAY_PERIOD,
+                           interval=settings.VPIN_INTRADAY_INTERVAL)
+    except Exception:
+        return None
+
+
 @register
 class VPIN(BaseIndicator):
     """Volume-Synchronized Probability of Informed Trading.
@@ -46,6 +183,13 @@ class VPIN(BaseIndicator):
     order-flow imbalance.  VPIN values are z-scored against their own recent
     history to produce context-sensitive signals.
 
+    In "volume" mode VPIN comes from equal-volume buckets of intraday bars:
+    the chart's own bars when they are intraday, otherwise bars fetched for
+    ``df.attrs["ticker"]``, with each day taking its last bucketed value.
+    Yahoo only keeps weeks of intraday history, so older daily bars have no
+    VPIN in this mode.  It falls back to "time" mode when no intraday data
+    is available.
+
     High VPIN (>2σ) → extreme toxicity, imminent volatility → SELL
     Elevated VPIN (>1σ) → caution → mild SELL
     Low VPIN (<−1σ) → calm, uninformed flow → mild BUY
@@ -53,6 +197,8 @@ class VPIN(BaseIndicator):
 
     BUCKET_COUNT = 50
     LOOKBACK_WINDOW = 50
+    ZSCORE_WINDOW = 50  # bars of VPIN history before the current bar
+    ZSCORE_MIN_HISTORY = 6
 
     @property
     def name(self) -> str:
@@ -66,65 +212,112 @@ class VPIN(BaseIndicator):
     def lookback(self) -> int:
         return self.LOOKBACK_WINDOW
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        n = len(df)
-
-        if n < self.lookback:
-            df["VPIN"] = np.nan
-            df["BuyVolPct"] = np.nan
-            return df
-
-        close = df["Close"].values
-        open_ = df["Open"].values
-        high = df["High"].values
-        low = df["Low"].values
+    @property
+    def params(self) -> dict[str, Any]:
+        params = super().params
+        params["mode"] = settings.VPIN_MODE
+        if settings.VPIN_MODE == "volume":
+            params.update(interval=settings.VPIN_INTRADAY_INTERVAL,
+                          period=settings.VPIN_INTRADAY_PERIOD,
+                          buckets_per_day=settings.VPIN_BUCKETS_PER_DAY)
+        return params
+
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
+        if len(df) < self.lookback:
+            return {"VPIN": np.nan, "BuyVolPct": np.nan, "VPIN_z": np.nan}
+
+        buy_frac = _buy_fraction(df)
+
+        vpin = None
+        if settings.VPIN_MODE == "volume":
+            vpin = self._volume_clock_vpin(df)
+        if vpin is None:
+            vpin = self._time_bar_vpin(df, buy_frac)
+
+        # Z-score of each VPIN value against its own recent history
+        history = vpin.rolling(self.ZSCORE_WINDOW + 1, min_periods=self.ZSCORE_MIN_HISTORY)
+        mean = history.mean()
+        std = history.std()
+        z_score = ((vpin - mean) / std).where(std > 0, 0.0)
+        return {"BuyVolPct": buy_frac, "VPIN": vpin, "VPIN_z": z_score.where(vpin.notna())}
+
+    def _time_bar_vpin(self, df: pd.DataFrame, buy_frac: np.ndarray) -> pd.Series:
+        """VPIN over a fixed window of the frame's own bars."""
         volume = df["Volume"].values
-
-        # Bar range as volatility proxy for BVC
-        sigma = high - low
-        sigma = np.where(sigma <= 0, 1e-10, sigma)
-
-        # Normalised price change → normal CDF → buy-fraction
-        z = (close - open_) / sigma
-        buy_frac = _norm_cdf(z)
         buy_volume = volume * buy_frac
         sell_volume = volume * (1.0 - buy_frac)
 
-        df["BuyVolPct"] = buy_frac
-
         # Rolling VPIN: |buy − sell| / total over a volume window
-        abs_imbalance = np.abs(buy_volume - sell_volume)
+        abs_imbalance = pd.Series(np.abs(buy_volume - sell_volume), index=df.index)
+        volume_s = pd.Series(volume, index=df.index)
         window = self.BUCKET_COUNT
-        vpin_vals = np.full(n, np.nan)
-
-        for i in range(window - 1, n):
-            total_vol = volume[i - window + 1 : i + 1].sum()
-            if total_vol > 0:
-                vpin_vals[i] = abs_imbalance[i - window + 1 : i + 1].sum() / total_vol
 
-        df["VPIN"] = vpin_vals
-        return df
+        total_vol = volume_s.rolling(window).sum()
+        # Count traded bars exactly: a rolling float sum can leave rounding
+        # residue where the window's volume is really zero
+        traded = (volume_s > 0).astype(float).rolling(window).sum()
+        return (abs_imbalance.rolling(window).sum() / total_vol).where(traded > 0)
+
+    def _volume_clock_vpin(self, df: pd.DataFrame) -> "pd.Series | None":
+        """Equal-volume-bucket VPIN on df's index, or None without intraday data."""
+        if _is_intraday(df.index):
+            return volume_clock_vpin(df, n_buckets=self.BUCKET_COUNT,
+                                     buckets_per_day=settings.VPIN_BUCKETS_PER_DAY)
+
+        ticker = df.attrs.get("ticker")
+        intraday = _fetch_intraday(ticker) if ticker else None
+        if intraday is None or intraday.empty:
+            return None
+
+        per_bar = volume_clock_vpin(intraday, n_buckets=self.BUCKET_COUNT,
+                                    buckets_per_day=settings.VPIN_BUCKETS_PER_DAY)
+        # Each day takes the VPIN standing at its last intraday bar
+        per_day = per_bar.groupby(per_bar.index.normalize()).last().dropna()
+        if per_day.empty:
+            return None
+        return align_to_index(per_day, df.index)
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        if settings.VPIN_MODE == "volume":
+            return super().init_state(df)  # buckets come from intraday bars: recompute
+        window = self.BUCKET_COUNT
+        state = StreamState(bars=0, imbalance=RollingWindow(window),
+                            volume=RollingWindow(window), traded=RollingWindow(window),
+                            vpin=RollingWindow(self.ZSCORE_WINDOW + 1))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        if hasattr(state, "history"):
+            return super().update(state, bar)
+        state.bars += 1
+        sigma = bar["High"] - bar["Low"]
+        z = (bar["Close"] - bar["Open"]) / (sigma if sigma > 0 else 1e-10)
+        buy_frac = float(_norm_cdf(z))
+        volume = bar["Volume"]
+        state.imbalance.push(abs(volume * buy_frac - volume * (1.0 - buy_frac)))
+        state.volume.push(volume)
+        state.traded.push(1.0 if volume > 0 else 0.0)
+        vpin = ratio(state.imbalance.sum(), state.volume.sum()) if state.traded.sum() > 0 else NAN
+        state.vpin.push(vpin)
+
+        if state.bars < self.lookback:
+            return {"VPIN": NAN, "BuyVolPct": NAN, "VPIN_z": NAN}
+        if np.isnan(vpin):
+            return {"BuyVolPct": buy_frac, "VPIN": vpin, "VPIN_z": NAN}
+        mean = state.vpin.mean(min_periods=self.ZSCORE_MIN_HISTORY)
+        std = state.vpin.std(min_periods=self.ZSCORE_MIN_HISTORY)
+        z_score = (vpin - mean) / std if std > 0 else 0.0
+        return {"BuyVolPct": buy_frac, "VPIN": vpin, "VPIN_z": z_score}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
-        if "VPIN" not in df.columns:
+        if "VPIN_z" not in df.columns:
             df = self.compute(df)
 
         vpin = df["VPIN"].iloc[idx]
         if pd.isna(vpin):
             return SignalResult(self.name, SignalDirection.HOLD, 0.0, "Insufficient data")
 
-        # Z-score relative to recent history
-        actual_idx = idx if idx >= 0 else len(df) + idx
-        start = max(0, actual_idx - 50)
-        history = df["VPIN"].iloc[start : actual_idx + 1].dropna()
-
-        if len(history) > 5:
-            mean = history.mean()
-            std = history.std()
-            z_score = (vpin - mean) / std if std > 0 else 0.0
-        else:
-            z_score = 0.0
+        z_score = df["VPIN_z"].iloc[idx]
 
         # Extreme toxicity
         if z_score > 2.0:
@@ -147,6 +340,20 @@ class VPIN(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.0,
                             f"Normal flow toxicity (VPIN={vpin:.3f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "VPIN_z" not in df.columns:
+            df = self.compute(df)
+
+        vpin = df["VPIN"].to_numpy(dtype=float)
+        z_score = df["VPIN_z"].to_numpy(dtype=float)
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(vpin), SignalDirection.HOLD, 0.0),
+            (z_score > 2.0, SignalDirection.SELL, np.fmin(0.9, 0.5 + z_score * 0.1)),
+            (z_score > 1.0, SignalDirection.SELL, np.fmin(0.6, 0.3 + z_score * 0.1)),
+            (z_score < -1.0, SignalDirection.BUY, np.fmin(0.4, np.abs(z_score) * 0.15)),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -1,15 +1,25 @@
 """Momentum indicators: RSI, Stochastic Oscillator."""
 
-from typing import Any
+from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
 import ta
 
 from config import settings
 from config.overrides import get_setting
+from indicators._streaming import (
+    NAN,
+    Ewm,
+    RollingExtreme,
+    RollingWindow,
+    StreamState,
+    ratio,
+    replay,
+)
 from indicators.base import BaseIndicator
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 @register
@@ -26,13 +36,34 @@ class RSI(BaseIndicator):
     def lookback(self) -> int:
         return settings.RSI_PERIOD
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"period": settings.RSI_PERIOD}
+
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["RSI"] = float("nan")
-            return df
-        df["RSI"] = ta.momentum.rsi(df["Close"], window=settings.RSI_PERIOD)
-        return df
+            return {"RSI": np.nan}
+        return {"RSI": ta.momentum.rsi(df["Close"], window=settings.RSI_PERIOD)}
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        # Wilder smoothing of gains and losses, as ta computes them
+        alpha = 1 / settings.RSI_PERIOD
+        state = StreamState(bars=0, prev_close=NAN,
+                            gain=Ewm.from_alpha(alpha, settings.RSI_PERIOD),
+                            loss=Ewm.from_alpha(alpha, settings.RSI_PERIOD))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        change = bar["Close"] - state.prev_close
+        state.prev_close = bar["Close"]
+        gain = state.gain.push(change if change > 0 else 0.0)
+        loss = state.loss.push(-(change if change < 0 else 0.0))
+        if state.bars < self.lookback:
+            return {"RSI": NAN}
+        if loss == 0:
+            return {"RSI": 100.0}
+        return {"RSI": 100 - (100 / (1 + gain / loss))}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "RSI" not in df.columns:
@@ -67,6 +98,24 @@ class RSI(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, f"Neutral (RSI={rsi:.1f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "RSI" not in df.columns:
+            df = self.compute(df)
+
+        rsi = df["RSI"].to_numpy(dtype=float)
+        rsi_oversold = get_setting("RSI_OVERSOLD")
+        rsi_overbought = get_setting("RSI_OVERBOUGHT")
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(rsi), SignalDirection.HOLD, 0.0),
+            (rsi < rsi_oversold, SignalDirection.BUY,
+             np.fmin(1.0, (rsi_oversold - rsi) / rsi_oversold)),
+            (rsi > rsi_overbought, SignalDirection.SELL,
+             np.fmin(1.0, (rsi - rsi_overbought) / (100 - rsi_overbought))),
+            (rsi < 45, SignalDirection.SELL, 0.15),
+            (rsi > 55, SignalDirection.BUY, 0.15),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -90,20 +139,39 @@ class Stochastic(BaseIndicator):
     def lookback(self) -> int:
         return settings.STOCH_K + settings.STOCH_D
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"k": settings.STOCH_K, "d": settings.STOCH_D, "smooth": settings.STOCH_SMOOTH}
+
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["Stoch_K"] = float("nan")
-            df["Stoch_D"] = float("nan")
-            return df
+            return {"Stoch_K": np.nan, "Stoch_D": np.nan}
         stoch = ta.momentum.StochasticOscillator(
             df["High"], df["Low"], df["Close"],
             window=settings.STOCH_K,
             smooth_window=settings.STOCH_SMOOTH,
         )
-        df["Stoch_K"] = stoch.stoch()
-        df["Stoch_D"] = stoch.stoch_signal()
-        return df
+        return {
+            "Stoch_K": stoch.stoch(),
+            "Stoch_D": stoch.stoch_signal(),
+        }
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0,
+                            low=RollingExtreme(settings.STOCH_K, largest=False),
+                            high=RollingExtreme(settings.STOCH_K, largest=True),
+                            k=RollingWindow(settings.STOCH_SMOOTH))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        lowest = state.low.push(bar["Low"])
+        highest = state.high.push(bar["High"])
+        k = ratio(100 * (bar["Close"] - lowest), highest - lowest)
+        state.k.push(k)
+        if state.bars < self.lookback:
+            return {"Stoch_K": NAN, "Stoch_D": NAN}
+        return {"Stoch_K": k, "Stoch_D": state.k.mean()}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "Stoch_K" not in df.columns:
@@ -148,6 +216,31 @@ class Stochastic(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.0,
                             f"Neutral (%K={k:.1f}, %D={d:.1f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "Stoch_K" not in df.columns:
+            df = self.compute(df)
+
+        k = df["Stoch_K"].to_numpy(dtype=float)
+        d = df["Stoch_D"].to_numpy(dtype=float)
+        prev_k = df["Stoch_K"].shift().to_numpy(dtype=float)
+        prev_d = df["Stoch_D"].shift().to_numpy(dtype=float)
+        stoch_oversold = get_setting("STOCH_OVERSOLD")
+        stoch_overbought = get_setting("STOCH_OVERBOUGHT")
+
+        missing = np.isnan(k) | np.isnan(d) | np.isnan(prev_k) | np.isnan(prev_d)
+        oversold = k < stoch_oversold
+        overbought = k > stoch_overbought
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            (oversold & (prev_k <= prev_d) & (k > d), SignalDirection.BUY,
+             np.fmax(0.5, np.fmin(1.0, (stoch_oversold - k) / stoch_oversold))),
+            (overbought & (prev_k >= prev_d) & (k < d), SignalDirection.SELL,
+             np.fmax(0.5, np.fmin(1.0, (k - stoch_overbought) / (100 - stoch_overbought)))),
+            (oversold, SignalDirection.BUY, 0.3),
+            (overbought, SignalDirection.SELL, 0.3),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
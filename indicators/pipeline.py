@@ -0,0 +1,141 @@
+"""Compute many indicators over one price frame without copying it per step.
+
+Chaining ``indicator.compute(df)`` copies the growing frame once per
+indicator, so a full run over every registered indicator copies the
+prices and all earlier columns over a dozen times.  ``IndicatorPipeline``
+instead hands every indicator the same OHLCV-only frame, collects the
+columns each one returns from ``compute_columns()``, and builds the
+result with a single concat.
+
+Under pandas' copy-on-write (always on from pandas 3, which
+requirements.txt requires) the OHLCV selection shares the caller's data,
+and ``to_numpy()`` on it returns read-only views, so an indicator can
+neither write through to the caller's frame nor corrupt the prices the
+indicators after it see.
+
+Indicators share one ``FeatureStore`` per frame, so intermediates they
+declare in common (the 12/26-bar EMAs of EMA Crossover and MACD, say)
+are computed once.  With ``threads`` > 1 the pipeline walks the feature
+DAG (``registry.feature_graph``) and submits every feature the
+indicators still to be computed need to a thread pool, in dependency
+order, ahead of the indicators themselves.  Independent branches (the
+two EMAs, the 20-bar mean and standard deviation) then run side by side,
+a dependent feature waits only for its own sources, and an indicator
+waits only for the features it reads.  Only code that releases the GIL
+(NumPy and pandas' rolling kernels) actually overlaps.  Without threads,
+features are computed on first use.
+
+Columns of fetched frames (``df.attrs["ticker"]`` set) are served from
+``indicators.cache``.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
+
+import pandas as pd
+
+from config.settings import INDICATOR_THREADS
+from indicators.base import BaseIndicator
+from indicators.cache import cached_columns, frame_key, has_columns
+from indicators.features import Feature, FeatureStore
+from indicators.registry import feature_graph
+
+_OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class IndicatorPipeline:
+    """An ordered set of indicators computed together over one frame.
+
+    Args:
+        indicators: Indicators to compute, by name or in order.
+        threads: Threads computing indicators concurrently (0 or 1 = in
+            the calling thread).
+
+    Raises:
+        KeyError: if an indicator declares a feature of an unknown kind.
+    """
+
+    def __init__(
+        self,
+        indicators: "dict[str, BaseIndicator] | Iterable[BaseIndicator]",
+        threads: int = INDICATOR_THREADS,
+    ):
+        if isinstance(indicators, dict):
+            indicators = indicators.values()
+        self.indicators: list[BaseIndicator] = list(indicators)
+        self.threads = threads
+        # Every feature the indicators read, in dependency order
+        self.features = feature_graph(self.indicators)
+
+    def _feature_schedule(self, key: "tuple | None") -> list[Feature]:
+        """Features of the indicators whose columns aren't cached, in dependency order."""
+        if key is None:
+            return list(self.features)
+        pending = [indicator for indicator in self.indicators if not has_columns(indicator, key)]
+        if len(pending) == len(self.indicators):
+            return list(self.features)
+        return list(feature_graph(pending))
+
+    def columns(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Every indicator's new columns, by name, in indicator order.
+
+        Indicators see only df's OHLCV columns (and its attrs); df itself
+        is not modified.
+        """
+        prices = df[[c for c in _OHLCV if c in df.columns]]
+        prices.attrs = dict(df.attrs)
+        key = frame_key(df)
+        features = FeatureStore(prices)
+
+        def indicator_columns(indicator: BaseIndicator) -> dict[str, Any]:
+            if indicator.features:
+                return indicator.compute_columns(prices, features)
+            return indicator.compute_columns(prices)
+
+        def compute(indicator: BaseIndicator) -> "dict[str, Any] | pd.DataFrame":
+            if key is None:
+                return indicator_columns(indicator)
+            return cached_columns(
+                indicator, key,
+                lambda: pd.DataFrame(indicator_columns(indicator), index=prices.index),
+            )
+
+        if self.threads > 1:
+            with ThreadPoolExecutor(max_workers=self.threads) as pool:
+                # Dependencies are submitted first, so no task waits on one
+                # still queued behind it
+                for feature in self._feature_schedule(key):
+                    pool.submit(features.__getitem__, feature)
+                results = list(pool.map(compute, self.indicators))
+        else:
+            results = [compute(indicator) for indicator in self.indicators]
+
+        columns: dict[str, Any] = {}
+        for result in results:
+            columns.update(result.items())
+        return columns
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """A new frame with df's columns followed by every indicator's columns.
+
+        Equivalent to calling each indicator's compute() in turn, except
+        that indicator columns already in df are replaced at the end of
+        the frame rather than in place.
+        """
+        added = pd.DataFrame(self.columns(df), index=df.index)
+        base = df.drop(columns=[c for c in added.columns if c in df.columns])
+        computed = pd.concat([base, added], axis=1)
+        computed.attrs = dict(df.attrs)
+        return computed
+
+
+def compute_indicators(
+    df: pd.DataFrame, indicators: "dict[str, BaseIndicator] | Iterable[BaseIndicator]"
+) -> pd.DataFrame:
+    """A copy of df with every indicator's columns added, cached where possible."""
+    return IndicatorPipeline(indicators).run(df)
+
+
+def compute_cached(indicator: BaseIndicator, df: pd.DataFrame) -> pd.DataFrame:
+    """indicator.compute(df), reusing columns computed earlier for the same frame."""
+    return IndicatorPipeline([indicator]).run(df)
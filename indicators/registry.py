@@ -1,8 +1,23 @@
-"""Indicator registry with auto-registration decorator."""
+"""Indicator registry with auto-registration decorators.
+
+Indicators register with ``@register``.  The shared intermediate
+features they declare (``BaseIndicator.features``) are computed by
+functions registered per feature kind with ``@register_feature``.
+"""
+
+from typing import TYPE_CHECKING, Callable, Iterable
+
+import pandas as pd
 
 from indicators.base import BaseIndicator
 
+if TYPE_CHECKING:
+    from indicators.features import Feature, FeatureStore
+
+FeatureFunction = Callable[["FeatureStore", "Feature"], pd.Series]
+
 _registry: dict[str, type[BaseIndicator]] = {}
+_feature_kinds: dict[str, FeatureFunction] = {}
 
 
 def register(cls: type[BaseIndicator]) -> type[BaseIndicator]:
@@ -37,3 +52,54 @@ def get_indicators_by_category(category: str) -> dict[str, BaseIndicator]:
 def list_indicator_names() -> list[str]:
     """Return sorted list of all registered indicator names."""
     return sorted(_registry.keys())
+
+
+def register_feature(kind: str) -> Callable[[FeatureFunction], FeatureFunction]:
+    """Decorator registering the function that computes features of *kind*.
+
+    The function receives the frame's FeatureStore and the Feature, and
+    returns a Series aligned with the frame.
+    """
+
+    def decorator(fn: FeatureFunction) -> FeatureFunction:
+        _feature_kinds[kind] = fn
+        return fn
+
+    return decorator
+
+
+def get_feature_function(kind: str) -> FeatureFunction:
+    """Get the function computing features of a kind."""
+    if kind not in _feature_kinds:
+        raise KeyError(f"Unknown feature kind: {kind}")
+    return _feature_kinds[kind]
+
+
+def feature_graph(
+    indicators: "dict[str, BaseIndicator] | Iterable[BaseIndicator]",
+) -> "dict[Feature, tuple[Feature, ...]]":
+    """The DAG of features the indicators declare, with their dependencies.
+
+    Maps every feature needed (directly or as a dependency) to the
+    features it is computed from.  Keys are in dependency order: each
+    feature comes after everything it depends on.
+
+    Raises:
+        KeyError: if a feature's kind is not registered.
+    """
+    if isinstance(indicators, dict):
+        indicators = indicators.values()
+    graph: dict = {}
+
+    def visit(feature: "Feature") -> None:
+        if feature in graph:
+            return
+        get_feature_function(feature.kind)
+        for dependency in feature.dependencies:
+            visit(dependency)
+        graph[feature] = feature.dependencies
+
+    for indicator in indicators:
+        for feature in indicator.features:
+            visit(feature)
+    return graph
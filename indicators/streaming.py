@@ -0,0 +1,72 @@
+"""Indicator values and signals for a price frame that grows bar by bar.
+
+A live refresh loop receives one new bar at a time; recomputing every
+indicator over the whole history for it repeats almost all the work.
+``IndicatorStream`` keeps each indicator's incremental state
+(``BaseIndicator.init_state``) and advances it with ``update``, which is
+O(1) per bar for the running-window indicators (moving averages, EMAs,
+MACD, RSI, Stochastic, Bollinger Bands, VWAP, OBV, time-bar VPIN).  The
+others fall back to recomputing over their price history.
+
+Signals are read from the last ``history_bars`` rows only, which must
+cover the bars any indicator's get_signal() looks back over.
+"""
+
+from collections import deque
+from typing import Iterable, Mapping
+
+import pandas as pd
+
+from config.settings import STREAM_HISTORY_BARS
+from indicators._streaming import OHLCV, Bar
+from indicators.base import BaseIndicator
+from indicators.pipeline import compute_indicators
+from signals.base import SignalResult
+
+
+class IndicatorStream:
+    """Incrementally updated indicator columns for one ticker.
+
+    Args:
+        df: Price history (OHLCV, oldest first) the stream starts from.
+        indicators: Indicators to maintain, by name or in order.
+        history_bars: Rows of computed columns kept for signals.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        indicators: "dict[str, BaseIndicator] | Iterable[BaseIndicator]",
+        history_bars: int = STREAM_HISTORY_BARS,
+    ):
+        if not isinstance(indicators, dict):
+            indicators = {indicator.name: indicator for indicator in indicators}
+        self.indicators = indicators
+        self.states = {name: indicator.init_state(df) for name, indicator in indicators.items()}
+
+        computed = compute_indicators(df, indicators).tail(history_bars)
+        self._index_name = computed.index.name
+        self._index = deque(computed.index, maxlen=history_bars)
+        self._rows = deque(computed.to_dict("records"), maxlen=history_bars)
+
+    def append(self, bar: Mapping[str, float]) -> dict[str, float]:
+        """Add a bar (OHLCV values named by its timestamp) and return its row."""
+        # Plain floats in a dict are much faster to read than a Series
+        bar = Bar(((c, float(bar[c])) for c in OHLCV if c in bar), bar.name)
+        row = dict(bar)
+        for name, indicator in self.indicators.items():
+            row.update(indicator.update(self.states[name], bar))
+        self._index.append(bar.name)
+        self._rows.append(row)
+        return row
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The most recent rows of prices and indicator columns."""
+        index = pd.Index(list(self._index), name=self._index_name)
+        return pd.DataFrame(list(self._rows), index=index)
+
+    def signals(self) -> dict[str, SignalResult]:
+        """Every indicator's signal at the latest bar."""
+        frame = self.frame
+        return {name: indicator.get_signal(frame, -1) for name, indicator in self.indicators.items()}
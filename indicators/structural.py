@@ -16,8 +16,9 @@ import numpy as np
 import pandas as pd
 
 from indicators.base import BaseIndicator
+from indicators.features import Feature, FeatureStore, log_return
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 def _hurst_exponent(returns: np.ndarray, max_lag: int = 20) -> float:
@@ -58,6 +59,76 @@ def _hurst_exponent(returns: np.ndarray, max_lag: int = 20) -> float:
     return float(max(0.0, min(1.0, slope)))
 
 
+def _effective_max_lag(n_returns: int, max_lag: int = 20) -> int:
+    """Largest R/S lag used for a window of *n_returns* returns."""
+    return min(max_lag, max(3, n_returns // 3))
+
+
+def _rolling_hurst(returns: np.ndarray, window: int, max_lag: int = 20) -> np.ndarray:
+    """Hurst exponent of every trailing *window* of returns, all at once.
+
+    Element k equals ``_hurst_exponent(returns[k:k + window], ...)`` with the
+    lag capped as in ``_effective_max_lag``.  For each lag, the R/S statistic
+    of every possible chunk start is computed once over a strided view; each
+    window then averages the chunks aligned to its own start, and the log-log
+    slope is solved in closed form across all windows.  Windows containing
+    non-finite returns fall back to the scalar routine on their finite part.
+    """
+    returns = np.asarray(returns, dtype=float)
+    n_windows = len(returns) - window + 1
+    if n_windows <= 0:
+        return np.empty(0)
+
+    hurst = np.full(n_windows, 0.5)
+    lag_cap = _effective_max_lag(window, max_lag)
+    finite = np.isfinite(returns)
+    clean = np.lib.stride_tricks.sliding_window_view(finite, window).all(axis=1)
+
+    if window >= lag_cap * 2 and clean.any():
+        lags = np.arange(2, lag_cap + 1)
+        log_lags = np.log(lags)
+        log_rs = np.zeros((n_windows, len(lags)))
+        has_rs = np.zeros((n_windows, len(lags)), dtype=bool)
+        starts = np.arange(n_windows)
+
+        filled = np.where(finite, returns, 0.0)
+        for col, lag in enumerate(lags):
+            chunks = np.lib.stride_tricks.sliding_window_view(filled, lag)
+            deviation = chunks - chunks.mean(axis=1, keepdims=True)
+            cumulative = np.cumsum(deviation, axis=1)
+            r = cumulative.max(axis=1) - cumulative.min(axis=1)
+            s = np.sqrt((deviation ** 2).sum(axis=1) / (lag - 1))
+            valid = s > 0
+            rs = np.divide(r, s, out=np.zeros_like(r), where=valid)
+
+            # Chunk j of the window starting at k begins at k + j * lag
+            offsets = starts[:, None] + lag * np.arange(window // lag)
+            counts = valid[offsets].sum(axis=1)
+            totals = rs[offsets].sum(axis=1)
+            ok = counts > 0
+            has_rs[:, col] = ok
+            log_rs[ok, col] = np.log(totals[ok] / counts[ok])
+
+        # Least-squares slope of log(R/S) on log(lag) over the available lags
+        n_points = has_rs.sum(axis=1)
+        fit = clean & (n_points >= 3)
+        x = np.where(has_rs, log_lags, 0.0)
+        y = np.where(has_rs, log_rs, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_mean = x.sum(axis=1) / n_points
+            y_mean = y.sum(axis=1) / n_points
+            dx = np.where(has_rs, log_lags - x_mean[:, None], 0.0)
+            slope = (dx * (y - y_mean[:, None])).sum(axis=1) / (dx ** 2).sum(axis=1)
+        hurst[fit] = np.clip(slope[fit], 0.0, 1.0)
+
+    for k in np.flatnonzero(~clean):
+        chunk = returns[k : k + window]
+        chunk = chunk[np.isfinite(chunk)]
+        hurst[k] = _hurst_exponent(chunk, max_lag=_effective_max_lag(len(chunk), max_lag))
+
+    return hurst
+
+
 def _log_price_acceleration(prices: np.ndarray, window: int = 60) -> float:
     """Quadratic coefficient of log(price) over a trailing window.
 
@@ -80,6 +151,47 @@ def _log_price_acceleration(prices: np.ndarray, window: int = 60) -> float:
         return 0.0
 
 
+def _rolling_log_price_acceleration(prices: np.ndarray, window: int = 60) -> np.ndarray:
+    """``_log_price_acceleration`` for every trailing window, in one pass.
+
+    With a fixed window the design matrix ``[x², x, 1]`` never changes, so
+    the least-squares curvature is a fixed linear filter of the log prices
+    (the first row of its pseudo-inverse).  Element i covers
+    ``prices[i - window + 1 : i + 1]`` and is NaN for the first
+    ``window - 1`` bars.  Windows with non-finite log prices fall back to the
+    scalar routine, which fits only the finite points.
+    """
+    prices = np.asarray(prices, dtype=float)
+    n = len(prices)
+    accel = np.full(n, np.nan)
+    if n < window:
+        return accel
+    if window < 10:
+        accel[window - 1 :] = 0.0
+        return accel
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.log(prices)
+    finite = np.isfinite(log_p)
+    clean = np.lib.stride_tricks.sliding_window_view(finite, window).all(axis=1)
+
+    # The curvature coefficient is unchanged by shifting x, so centre it for
+    # a well-conditioned solve
+    x = np.arange(window) - (window - 1) / 2
+    curvature_filter = np.linalg.pinv(np.vander(x, 3))[0]
+
+    windows = np.lib.stride_tricks.sliding_window_view(np.where(finite, log_p, 0.0), window)
+    # The filter ignores constant offsets; removing each window's level
+    # avoids cancellation on high-priced series
+    values = (windows - windows[:, :1]) @ curvature_filter
+
+    for k in np.flatnonzero(~clean):
+        values[k] = _log_price_acceleration(prices[k : k + window], window)
+
+    accel[window - 1 :] = values
+    return accel
+
+
 @register
 class BubbleRisk(BaseIndicator):
     """Bubble risk detector combining Hurst exponent and log-price acceleration.
@@ -105,37 +217,37 @@ class BubbleRisk(BaseIndicator):
     def lookback(self) -> int:
         return self.HURST_WINDOW
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (log_return(),)
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
+        if features is None:
+            features = FeatureStore(df)
         prices = df["Close"].values
         n = len(prices)
 
         hurst_arr = np.full(n, np.nan)
         accel_arr = np.full(n, np.nan)
-        score_arr = np.full(n, np.nan)
-
-        for i in range(self.HURST_WINDOW, n):
-            window_prices = prices[max(0, i - self.HURST_WINDOW) : i + 1]
-            log_ret = np.diff(np.log(window_prices))
-            log_ret = log_ret[np.isfinite(log_ret)]
 
-            h = _hurst_exponent(log_ret, max_lag=min(20, max(3, len(log_ret) // 3)))
-            hurst_arr[i] = h
+        if n > self.HURST_WINDOW:
+            log_ret = features[log_return()].to_numpy()[1:]
+            # Bar i uses the HURST_WINDOW returns ending at i
+            hurst_arr[self.HURST_WINDOW :] = _rolling_hurst(log_ret, self.HURST_WINDOW)
+            accel = _rolling_log_price_acceleration(prices, self.ACCEL_WINDOW)
+            accel_arr[self.HURST_WINDOW :] = accel[self.HURST_WINDOW :]
 
-            accel = _log_price_acceleration(window_prices, self.ACCEL_WINDOW)
-            accel_arr[i] = accel
+        # Composite score: persistence + acceleration
+        h_component = np.maximum(0.0, (hurst_arr - 0.5) * 2)  # 0 at H=0.5, 1 at H=1.0
+        a_component = np.clip(accel_arr * 5000, 0.0, 1.0)
 
-            # Composite score: persistence + acceleration
-            h_component = max(0.0, (h - 0.5) * 2)  # 0 at H=0.5, 1 at H=1.0
-            a_component = max(0.0, min(1.0, accel * 5000))
-            score_arr[i] = h_component * 0.4 + a_component * 0.6
-
-        df["Hurst"] = hurst_arr
-        df["LogAccel"] = accel_arr
-        df["BubbleScore"] = score_arr
-
-        return df
+        return {
+            "Hurst": hurst_arr,
+            "LogAccel": accel_arr,
+            "BubbleScore": h_component * 0.4 + a_component * 0.6,
+        }
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "BubbleScore" not in df.columns:
@@ -172,6 +284,21 @@ class BubbleRisk(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.0,
                             f"No bubble detected (score={score:.2f}, H={hurst:.2f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "BubbleScore" not in df.columns:
+            df = self.compute(df)
+
+        hurst = df["Hurst"].to_numpy(dtype=float)
+        score = df["BubbleScore"].to_numpy(dtype=float)
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(score) | np.isnan(hurst), SignalDirection.HOLD, 0.0),
+            (score > 0.6, SignalDirection.SELL, np.fmin(0.9, score)),
+            (score > 0.35, SignalDirection.SELL, np.fmin(0.6, score)),
+            (hurst < 0.4, SignalDirection.BUY, np.fmin(0.5, (0.5 - hurst) * 2)),
+            ((hurst > 0.55) & (score <= 0.35), SignalDirection.HOLD, 0.15),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -9,15 +9,17 @@ Reference: Kritzman, Li, Page & Rigobon (2011), "Principal Components as
 a Measure of Systemic Risk".
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
-from indicators._utils import align_to_index, fetch_reference_close
+from indicators._utils import align_to_index, fetch_reference_close, prefetch_reference_closes
 from indicators.base import BaseIndicator
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 # S&P 500 sector ETFs
 SECTOR_ETFS = [
@@ -26,24 +28,147 @@ SECTOR_ETFS = [
 ]
 
 
-def _fetch_sector_returns(target_index: pd.DatetimeIndex) -> "pd.DataFrame | None":
-    """Fetch daily returns for sector ETFs aligned to the target index."""
-    sector_closes: dict[str, pd.Series] = {}
+def _fetch_sector_closes() -> dict[str, "pd.Series | None"]:
+    """Close prices for each sector ETF (None where unavailable)."""
+    prefetch_reference_closes(SECTOR_ETFS, period="2y")
+    return {etf: fetch_reference_close(etf, period="2y") for etf in SECTOR_ETFS}
 
-    for etf in SECTOR_ETFS:
-        closes = fetch_reference_close(etf, period="2y")
-        if closes is not None:
-            aligned = align_to_index(closes, target_index)
-            sector_closes[etf] = aligned
 
-    if len(sector_closes) < 5:
+def _sector_returns(
+    sector_closes: dict[str, "pd.Series | None"], target_index: pd.DatetimeIndex
+) -> "pd.DataFrame | None":
+    aligned = {
+        etf: align_to_index(closes, target_index)
+        for etf, closes in sector_closes.items()
+        if closes is not None
+    }
+    if len(aligned) < 5:
         return None
 
-    closes_df = pd.DataFrame(sector_closes)
+    closes_df = pd.DataFrame(aligned)
     returns_df = closes_df.pct_change(fill_method=None)
     return returns_df
 
 
+def _fetch_sector_returns(target_index: pd.DatetimeIndex) -> "pd.DataFrame | None":
+    """Fetch daily returns for sector ETFs aligned to the target index."""
+    return _sector_returns(_fetch_sector_closes(), target_index)
+
+
+def _rolling_absorption(returns: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Absorption ratio and top eigenvalue for every trailing window of returns.
+
+    Element i uses rows ``i - window .. i - 1``.  Columns with any missing
+    value in a window are left out of that window; windows with fewer than
+    three columns, or with a constant column, have no value.
+
+    All windows' covariance matrices come from differences of cumulative
+    sums of outer products (one stacked n×k×k array).  Windows are then
+    grouped by which columns they include and each group's correlation
+    matrices go through a single batched ``eigvalsh`` call.
+    """
+    n, k = returns.shape
+    absorption = np.full(n, np.nan)
+    top_eigenvalue = np.full(n, np.nan)
+    if n <= window or k < 3:
+        return absorption, top_eigenvalue
+
+    finite = np.isfinite(returns)
+    values = np.where(finite, returns, 0.0)
+    # Correlation is shift-invariant; centring first keeps the running sums small
+    counts = finite.sum(axis=0)
+    values = np.where(finite, values - values.sum(axis=0) / np.maximum(counts, 1), 0.0)
+
+    def window_sums(a: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+        return cumulative[window:-1] - cumulative[: -window - 1]
+
+    n_obs = window_sums(finite.astype(float))
+    sums = window_sums(values)
+    products = window_sums(values[:, :, None] * values[:, None, :])
+
+    cov = products / window - (sums[:, :, None] * sums[:, None, :]) / window**2
+    std = np.sqrt(np.clip(np.diagonal(cov, axis1=1, axis2=2), 0.0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / (std[:, :, None] * std[:, None, :])
+
+    included = n_obs == window
+    # A constant column has an undefined correlation; detect it exactly
+    windows = np.lib.stride_tricks.sliding_window_view(values[:-1], window, axis=0)
+    constant = np.ptp(windows, axis=2) == 0
+
+    patterns, group = np.unique(included, axis=0, return_inverse=True)
+    for p, cols in enumerate(patterns):
+        cols = np.flatnonzero(cols)
+        if len(cols) < 3:
+            continue
+        rows = np.flatnonzero((group.ravel() == p) & ~(constant[:, cols].any(axis=1)))
+        if len(rows) == 0:
+            continue
+        try:
+            eigenvalues = np.linalg.eigvalsh(corr[rows][:, cols[:, None], cols])
+        except (np.linalg.LinAlgError, ValueError):
+            continue
+        total = eigenvalues.sum(axis=1)
+        ok = total > 0
+        absorption[rows[ok] + window] = eigenvalues[ok, -1] / total[ok]
+        top_eigenvalue[rows[ok] + window] = eigenvalues[ok, -1]
+
+    return absorption, top_eigenvalue
+
+
+# Sector data is the same for every ticker, so absorption ratios are cached
+# per trading calendar and reused across tickers that share it.
+_ABSORPTION_CACHE_SIZE = 32
+_absorption_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_absorption_cache_lock = threading.Lock()
+
+
+def _calendar_key(index: pd.DatetimeIndex, window: int) -> tuple:
+    dates = index.tz_localize(None) if index.tz is not None else index
+    dates = dates.normalize()
+    return (window, len(dates), hash(dates.asi8.tobytes()))
+
+
+def _absorption_for_index(
+    target_index: pd.DatetimeIndex, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Absorption ratio and top eigenvalue on *target_index*, cached per calendar."""
+    sector_closes = _fetch_sector_closes()
+    key = _calendar_key(target_index, window)
+
+    with _absorption_cache_lock:
+        cached = _absorption_cache.get(key)
+        # Reuse only if it was built from the same reference series objects
+        if cached is not None and all(
+            cached[0].get(etf) is closes for etf, closes in sector_closes.items()
+        ):
+            _absorption_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+    returns = _sector_returns(sector_closes, target_index)
+    if returns is None:
+        n = len(target_index)
+        absorption, top_eigenvalue = np.full(n, np.nan), np.full(n, np.nan)
+    else:
+        absorption, top_eigenvalue = _rolling_absorption(returns.to_numpy(dtype=float), window)
+    absorption.flags.writeable = False
+    top_eigenvalue.flags.writeable = False
+
+    with _absorption_cache_lock:
+        _absorption_cache[key] = (sector_closes, absorption, top_eigenvalue)
+        _absorption_cache.move_to_end(key)
+        while len(_absorption_cache) > _ABSORPTION_CACHE_SIZE:
+            _absorption_cache.popitem(last=False)
+    return absorption, top_eigenvalue
+
+
+def clear_absorption_cache() -> None:
+    """Clear the cached absorption ratio series (useful for testing)."""
+    with _absorption_cache_lock:
+        _absorption_cache.clear()
+
+
 @register
 class MarketCorrelation(BaseIndicator):
     """Market correlation regime via absorption ratio.
@@ -68,39 +193,13 @@ class MarketCorrelation(BaseIndicator):
     def lookback(self) -> int:
         return self.CORR_WINDOW
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        n = len(df)
-
-        sector_returns = _fetch_sector_returns(df.index)
-
-        absorption = np.full(n, np.nan)
-        top_eigenvalue = np.full(n, np.nan)
-
-        if sector_returns is not None and len(sector_returns) >= self.CORR_WINDOW:
-            for i in range(self.CORR_WINDOW, min(n, len(sector_returns))):
-                window = sector_returns.iloc[i - self.CORR_WINDOW : i]
-                window = window.dropna(axis=1, how="any")
-
-                if window.shape[1] < 3 or window.shape[0] < self.CORR_WINDOW // 2:
-                    continue
-
-                try:
-                    corr = window.corr().values
-                    if np.isnan(corr).any():
-                        continue
-                    eigenvalues = np.sort(np.linalg.eigvalsh(corr))[::-1]
-                    total = eigenvalues.sum()
-                    if total > 0:
-                        absorption[i] = eigenvalues[0] / total
-                        top_eigenvalue[i] = eigenvalues[0]
-                except (np.linalg.LinAlgError, ValueError):
-                    continue
-
-        df["AbsorptionRatio"] = absorption
-        df["TopEigenvalue"] = top_eigenvalue
+    @property
+    def reference_tickers(self) -> tuple[str, ...]:
+        return tuple(SECTOR_ETFS)
 
-        return df
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
+        absorption, top_eigenvalue = _absorption_for_index(df.index, self.CORR_WINDOW)
+        return {"AbsorptionRatio": absorption, "TopEigenvalue": top_eigenvalue}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "AbsorptionRatio" not in df.columns:
@@ -145,6 +244,29 @@ class MarketCorrelation(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.1,
                             f"Normal market correlation (AR={ar:.3f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "AbsorptionRatio" not in df.columns:
+            df = self.compute(df)
+
+        absorption = df["AbsorptionRatio"]
+        ar = absorption.to_numpy(dtype=float)
+
+        # Z-score vs. the trailing 61 bars, as in get_signal()
+        history = absorption.rolling(61, min_periods=6)
+        ar_mean = history.mean().to_numpy(dtype=float)
+        ar_std = history.std().to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_score = np.where(ar_std > 0, (ar - ar_mean) / ar_std, 0.0)
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(ar), SignalDirection.HOLD, 0.0),
+            ((ar > 0.55) | (z_score > 1.5), SignalDirection.SELL,
+             np.fmin(0.8, np.maximum(np.maximum(0.4, ar), z_score * 0.2))),
+            ((ar > 0.45) | (z_score > 0.75), SignalDirection.SELL, np.fmin(0.5, ar)),
+            ((ar < 0.30) | (z_score < -1.0), SignalDirection.BUY,
+             np.fmin(0.5, np.fmax(0.2, (0.4 - ar) * 3))),
+        ], default=(SignalDirection.HOLD, 0.1))
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -1,14 +1,17 @@
 """Trend indicators: SMA Crossover, EMA Crossover, MACD, ADX."""
 
-from typing import Any
+from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
 import ta
 
 from config import settings
+from indicators._streaming import NAN, Ewm, RollingWindow, StreamState, replay
 from indicators.base import BaseIndicator
+from indicators.features import Feature, FeatureStore, ema, sma
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 @register
@@ -25,15 +28,38 @@ class SMACrossover(BaseIndicator):
     def lookback(self) -> int:
         return settings.SMA_LONG
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"short": settings.SMA_SHORT, "long": settings.SMA_LONG}
+
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (sma(settings.SMA_SHORT), sma(settings.SMA_LONG))
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["SMA_short"] = float("nan")
-            df["SMA_long"] = float("nan")
-            return df
-        df["SMA_short"] = ta.trend.sma_indicator(df["Close"], window=settings.SMA_SHORT)
-        df["SMA_long"] = ta.trend.sma_indicator(df["Close"], window=settings.SMA_LONG)
-        return df
+            return {"SMA_short": np.nan, "SMA_long": np.nan}
+        if features is None:
+            features = FeatureStore(df)
+        return {
+            "SMA_short": features[sma(settings.SMA_SHORT)],
+            "SMA_long": features[sma(settings.SMA_LONG)],
+        }
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0, short=RollingWindow(settings.SMA_SHORT),
+                            long=RollingWindow(settings.SMA_LONG))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        state.short.push(bar["Close"])
+        state.long.push(bar["Close"])
+        if state.bars < self.lookback:
+            return {"SMA_short": NAN, "SMA_long": NAN}
+        return {"SMA_short": state.short.mean(), "SMA_long": state.long.mean()}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "SMA_short" not in df.columns:
@@ -78,6 +104,27 @@ class SMACrossover(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, "SMAs equal")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "SMA_short" not in df.columns:
+            df = self.compute(df)
+
+        short = df["SMA_short"].to_numpy(dtype=float)
+        long_ = df["SMA_long"].to_numpy(dtype=float)
+        prev_s = df["SMA_short"].shift().to_numpy(dtype=float)
+        prev_l = df["SMA_long"].shift().to_numpy(dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = np.abs(short - long_) / long_
+        missing = np.isnan(short) | np.isnan(long_) | np.isnan(prev_s) | np.isnan(prev_l)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            ((prev_s <= prev_l) & (short > long_), SignalDirection.BUY, np.fmin(1.0, spread * 20)),
+            ((prev_s >= prev_l) & (short < long_), SignalDirection.SELL, np.fmin(1.0, spread * 20)),
+            (short > long_, SignalDirection.BUY, np.fmin(0.4, spread * 10)),
+            (short < long_, SignalDirection.SELL, np.fmin(0.4, spread * 10)),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": True,
@@ -100,15 +147,39 @@ class EMACrossover(BaseIndicator):
     def lookback(self) -> int:
         return settings.EMA_LONG
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"short": settings.EMA_SHORT, "long": settings.EMA_LONG}
+
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (ema(settings.EMA_SHORT), ema(settings.EMA_LONG))
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["EMA_short"] = float("nan")
-            df["EMA_long"] = float("nan")
-            return df
-        df["EMA_short"] = ta.trend.ema_indicator(df["Close"], window=settings.EMA_SHORT)
-        df["EMA_long"] = ta.trend.ema_indicator(df["Close"], window=settings.EMA_LONG)
-        return df
+            return {"EMA_short": np.nan, "EMA_long": np.nan}
+        if features is None:
+            features = FeatureStore(df)
+        return {
+            "EMA_short": features[ema(settings.EMA_SHORT)],
+            "EMA_long": features[ema(settings.EMA_LONG)],
+        }
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0,
+                            short=Ewm.from_span(settings.EMA_SHORT, settings.EMA_SHORT),
+                            long=Ewm.from_span(settings.EMA_LONG, settings.EMA_LONG))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        short = state.short.push(bar["Close"])
+        long_ = state.long.push(bar["Close"])
+        if state.bars < self.lookback:
+            return {"EMA_short": NAN, "EMA_long": NAN}
+        return {"EMA_short": short, "EMA_long": long_}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "EMA_short" not in df.columns:
@@ -150,6 +221,27 @@ class EMACrossover(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, "EMAs equal")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "EMA_short" not in df.columns:
+            df = self.compute(df)
+
+        short = df["EMA_short"].to_numpy(dtype=float)
+        long_ = df["EMA_long"].to_numpy(dtype=float)
+        prev_s = df["EMA_short"].shift().to_numpy(dtype=float)
+        prev_l = df["EMA_long"].shift().to_numpy(dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = np.abs(short - long_) / long_
+        missing = np.isnan(short) | np.isnan(long_) | np.isnan(prev_s) | np.isnan(prev_l)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            ((prev_s <= prev_l) & (short > long_), SignalDirection.BUY, np.fmin(1.0, spread * 25)),
+            ((prev_s >= prev_l) & (short < long_), SignalDirection.SELL, np.fmin(1.0, spread * 25)),
+            (short > long_, SignalDirection.BUY, np.fmin(0.4, spread * 12)),
+            (short < long_, SignalDirection.SELL, np.fmin(0.4, spread * 12)),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": True,
@@ -172,23 +264,43 @@ class MACD(BaseIndicator):
     def lookback(self) -> int:
         return settings.MACD_SLOW + settings.MACD_SIGNAL
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"fast": settings.MACD_FAST, "slow": settings.MACD_SLOW,
+                "signal": settings.MACD_SIGNAL}
+
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (ema(settings.MACD_FAST), ema(settings.MACD_SLOW))
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["MACD_line"] = float("nan")
-            df["MACD_signal"] = float("nan")
-            df["MACD_hist"] = float("nan")
-            return df
-        macd_obj = ta.trend.MACD(
-            df["Close"],
-            window_slow=settings.MACD_SLOW,
-            window_fast=settings.MACD_FAST,
-            window_sign=settings.MACD_SIGNAL,
-        )
-        df["MACD_line"] = macd_obj.macd()
-        df["MACD_signal"] = macd_obj.macd_signal()
-        df["MACD_hist"] = macd_obj.macd_diff()
-        return df
+            return {"MACD_line": np.nan, "MACD_signal": np.nan, "MACD_hist": np.nan}
+        if features is None:
+            features = FeatureStore(df)
+        # Same construction as ta's MACD, on the shared EMAs
+        line = features[ema(settings.MACD_FAST)] - features[ema(settings.MACD_SLOW)]
+        signal = line.ewm(
+            span=settings.MACD_SIGNAL, min_periods=settings.MACD_SIGNAL, adjust=False
+        ).mean()
+        return {"MACD_line": line, "MACD_signal": signal, "MACD_hist": line - signal}
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0,
+                            fast=Ewm.from_span(settings.MACD_FAST, settings.MACD_FAST),
+                            slow=Ewm.from_span(settings.MACD_SLOW, settings.MACD_SLOW),
+                            signal=Ewm.from_span(settings.MACD_SIGNAL, settings.MACD_SIGNAL))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        line = state.fast.push(bar["Close"]) - state.slow.push(bar["Close"])
+        signal = state.signal.push(line)
+        if state.bars < self.lookback:
+            return {"MACD_line": NAN, "MACD_signal": NAN, "MACD_hist": NAN}
+        return {"MACD_line": line, "MACD_signal": signal, "MACD_hist": line - signal}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "MACD_line" not in df.columns:
@@ -236,6 +348,30 @@ class MACD(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, "MACD neutral")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "MACD_line" not in df.columns:
+            df = self.compute(df)
+
+        macd = df["MACD_line"].to_numpy(dtype=float)
+        signal = df["MACD_signal"].to_numpy(dtype=float)
+        hist = df["MACD_hist"].to_numpy(dtype=float)
+        close = df["Close"].to_numpy(dtype=float)
+        prev_macd = df["MACD_line"].shift().to_numpy(dtype=float)
+        prev_signal = df["MACD_signal"].shift().to_numpy(dtype=float)
+
+        # Normalize histogram by price so confidence is scale-independent
+        with np.errstate(divide="ignore", invalid="ignore"):
+            norm_hist = np.where(close > 0, np.abs(hist) / close, 0.0)
+        missing = np.isnan(macd) | np.isnan(signal) | np.isnan(prev_macd) | np.isnan(prev_signal)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            ((prev_macd <= prev_signal) & (macd > signal), SignalDirection.BUY, np.fmin(1.0, norm_hist * 200)),
+            ((prev_macd >= prev_signal) & (macd < signal), SignalDirection.SELL, np.fmin(1.0, norm_hist * 200)),
+            (macd > signal, SignalDirection.BUY, np.fmin(0.5, norm_hist * 120)),
+            (macd < signal, SignalDirection.SELL, np.fmin(0.5, norm_hist * 120)),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -259,20 +395,21 @@ class ADX(BaseIndicator):
     def lookback(self) -> int:
         return settings.ADX_PERIOD * 2
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"period": settings.ADX_PERIOD}
+
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["ADX"] = float("nan")
-            df["ADX_pos"] = float("nan")
-            df["ADX_neg"] = float("nan")
-            return df
+            return {"ADX": np.nan, "ADX_pos": np.nan, "ADX_neg": np.nan}
         adx_obj = ta.trend.ADXIndicator(
             df["High"], df["Low"], df["Close"], window=settings.ADX_PERIOD
         )
-        df["ADX"] = adx_obj.adx()
-        df["ADX_pos"] = adx_obj.adx_pos()
-        df["ADX_neg"] = adx_obj.adx_neg()
-        return df
+        return {
+            "ADX": adx_obj.adx(),
+            "ADX_pos": adx_obj.adx_pos(),
+            "ADX_neg": adx_obj.adx_neg(),
+        }
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "ADX" not in df.columns:
@@ -302,6 +439,24 @@ class ADX(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.1, "DIs equal")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "ADX" not in df.columns:
+            df = self.compute(df)
+
+        adx = df["ADX"].to_numpy(dtype=float)
+        plus_di = df["ADX_pos"].to_numpy(dtype=float)
+        minus_di = df["ADX_neg"].to_numpy(dtype=float)
+
+        trend_strength = np.fmin(1.0, (adx - 20) / 40)  # normalize 20-60 -> 0-1
+        missing = np.isnan(adx) | np.isnan(plus_di) | np.isnan(minus_di)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            (adx < 20, SignalDirection.HOLD, 0.2),
+            (plus_di > minus_di, SignalDirection.BUY, trend_strength),
+            (minus_di > plus_di, SignalDirection.SELL, trend_strength),
+        ], default=(SignalDirection.HOLD, 0.1))
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
@@ -1,14 +1,16 @@
 """Volatility indicators: Bollinger Bands."""
 
-from typing import Any
+from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
-import ta
 
 from config import settings
+from indicators._streaming import NAN, RollingWindow, StreamState, replay
 from indicators.base import BaseIndicator
+from indicators.features import Feature, FeatureStore, rolling_std, sma
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 @register
@@ -25,22 +27,47 @@ class BollingerBands(BaseIndicator):
     def lookback(self) -> int:
         return settings.BB_PERIOD
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"period": settings.BB_PERIOD, "std": settings.BB_STD}
+
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (sma(settings.BB_PERIOD), rolling_std(settings.BB_PERIOD))
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["BB_upper"] = float("nan")
-            df["BB_middle"] = float("nan")
-            df["BB_lower"] = float("nan")
-            df["BB_pband"] = float("nan")
-            return df
-        bb = ta.volatility.BollingerBands(
-            df["Close"], window=settings.BB_PERIOD, window_dev=settings.BB_STD
-        )
-        df["BB_upper"] = bb.bollinger_hband()
-        df["BB_middle"] = bb.bollinger_mavg()
-        df["BB_lower"] = bb.bollinger_lband()
-        df["BB_pband"] = bb.bollinger_pband()  # %B: position within bands (0=lower, 1=upper)
-        return df
+            return {"BB_upper": np.nan, "BB_middle": np.nan, "BB_lower": np.nan,
+                    "BB_pband": np.nan}
+        if features is None:
+            features = FeatureStore(df)
+        # Same construction as ta's BollingerBands, on the shared mean and std
+        middle = features[sma(settings.BB_PERIOD)]
+        width = settings.BB_STD * features[rolling_std(settings.BB_PERIOD)]
+        upper, lower = middle + width, middle - width
+        return {
+            "BB_upper": upper,
+            "BB_middle": middle,
+            "BB_lower": lower,
+            # %B: position within bands (0=lower, 1=upper)
+            "BB_pband": (df["Close"] - lower) / (upper - lower).where(upper != lower, np.nan),
+        }
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        return replay(self, StreamState(bars=0, close=RollingWindow(settings.BB_PERIOD)), df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        state.close.push(bar["Close"])
+        if state.bars < self.lookback:
+            return {"BB_upper": NAN, "BB_middle": NAN, "BB_lower": NAN, "BB_pband": NAN}
+        middle = state.close.mean()
+        width = settings.BB_STD * state.close.std(ddof=0)
+        upper, lower = middle + width, middle - width
+        pband = (bar["Close"] - lower) / (upper - lower) if upper != lower else NAN
+        return {"BB_upper": upper, "BB_middle": middle, "BB_lower": lower, "BB_pband": pband}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "BB_upper" not in df.columns:
@@ -77,6 +104,29 @@ class BollingerBands(BaseIndicator):
         return SignalResult(self.name, SignalDirection.HOLD, 0.0,
                             f"Price within bands (%B={pband:.2f})")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "BB_upper" not in df.columns:
+            df = self.compute(df)
+
+        close = df["Close"].to_numpy(dtype=float)
+        upper = df["BB_upper"].to_numpy(dtype=float)
+        lower = df["BB_lower"].to_numpy(dtype=float)
+        pband = df["BB_pband"].to_numpy(dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            width = upper - lower
+            below_conf = np.where(upper != lower, (lower - close) / width, 0.5)
+            above_conf = np.where(upper != lower, (close - upper) / width, 0.5)
+        missing = np.isnan(upper) | np.isnan(lower) | np.isnan(pband)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            (close <= lower, SignalDirection.BUY, np.fmin(1.0, np.fmax(0.5, below_conf))),
+            (close >= upper, SignalDirection.SELL, np.fmin(1.0, np.fmax(0.5, above_conf))),
+            (pband < 0.2, SignalDirection.BUY, 0.3),
+            (pband > 0.8, SignalDirection.SELL, 0.3),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": True,
@@ -1,13 +1,16 @@
 """Volume indicators: VWAP, OBV."""
 
-from typing import Any
+from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
 import ta
 
+from indicators._streaming import NAN, RollingWindow, StreamState, ratio, replay
 from indicators.base import BaseIndicator
+from indicators.features import Feature, FeatureStore, typical_price
 from indicators.registry import register
-from signals.base import SignalDirection, SignalResult
+from signals.base import SignalDirection, SignalResult, SignalSeries
 
 
 @register
@@ -26,18 +29,37 @@ class VWAP(BaseIndicator):
     def lookback(self) -> int:
         return self.WINDOW
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def features(self) -> tuple[Feature, ...]:
+        return (typical_price(),)
+
+    def compute_columns(
+        self, df: pd.DataFrame, features: FeatureStore | None = None
+    ) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["VWAP"] = float("nan")
-            return df
+            return {"VWAP": np.nan}
+        if features is None:
+            features = FeatureStore(df)
         # Rolling anchored VWAP: use a rolling window so the value stays
         # relevant on daily charts instead of drifting toward a cumulative
         # historical average.
-        typical_price = (df["High"] + df["Low"] + df["Close"]) / 3
-        tp_vol = typical_price * df["Volume"]
-        df["VWAP"] = tp_vol.rolling(window=self.WINDOW).sum() / df["Volume"].rolling(window=self.WINDOW).sum()
-        return df
+        tp_vol = features[typical_price()] * df["Volume"]
+        vwap = tp_vol.rolling(window=self.WINDOW).sum() / df["Volume"].rolling(window=self.WINDOW).sum()
+        return {"VWAP": vwap}
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0, tp_volume=RollingWindow(self.WINDOW),
+                            volume=RollingWindow(self.WINDOW))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        typical = (bar["High"] + bar["Low"] + bar["Close"]) / 3
+        state.tp_volume.push(typical * bar["Volume"])
+        state.volume.push(bar["Volume"])
+        if state.bars < self.lookback:
+            return {"VWAP": NAN}
+        return {"VWAP": ratio(state.tp_volume.sum(), state.volume.sum())}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "VWAP" not in df.columns:
@@ -63,6 +85,22 @@ class VWAP(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, "Price at VWAP")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "VWAP" not in df.columns:
+            df = self.compute(df)
+
+        close = df["Close"].to_numpy(dtype=float)
+        vwap = df["VWAP"].to_numpy(dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            confidence = np.fmin(0.8, np.abs((close - vwap) / vwap) * 10)
+
+        return SignalSeries.from_rules(self.name, [
+            (np.isnan(vwap) | (vwap == 0), SignalDirection.HOLD, 0.0),
+            (close > vwap, SignalDirection.BUY, confidence),
+            (close < vwap, SignalDirection.SELL, confidence),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": True,
@@ -85,16 +123,25 @@ class OBV(BaseIndicator):
     def lookback(self) -> int:
         return 20
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    def compute_columns(self, df: pd.DataFrame) -> dict[str, Any]:
         if len(df) < self.lookback:
-            df["OBV"] = float("nan")
-            df["OBV_SMA"] = float("nan")
-            return df
-        df["OBV"] = ta.volume.on_balance_volume(df["Close"], df["Volume"])
+            return {"OBV": np.nan, "OBV_SMA": np.nan}
+        obv = ta.volume.on_balance_volume(df["Close"], df["Volume"])
         # OBV SMA for divergence detection
-        df["OBV_SMA"] = df["OBV"].rolling(window=20).mean()
-        return df
+        return {"OBV": obv, "OBV_SMA": obv.rolling(window=20).mean()}
+
+    def init_state(self, df: pd.DataFrame) -> StreamState:
+        state = StreamState(bars=0, prev_close=NAN, obv=0.0, recent=RollingWindow(20))
+        return replay(self, state, df)
+
+    def update(self, state: StreamState, bar: Mapping[str, float]) -> dict[str, float]:
+        state.bars += 1
+        state.obv += -bar["Volume"] if bar["Close"] < state.prev_close else bar["Volume"]
+        state.prev_close = bar["Close"]
+        state.recent.push(state.obv)
+        if state.bars < self.lookback:
+            return {"OBV": NAN, "OBV_SMA": NAN}
+        return {"OBV": state.obv, "OBV_SMA": state.recent.mean()}
 
     def get_signal(self, df: pd.DataFrame, idx: int = -1) -> SignalResult:
         if "OBV" not in df.columns:
@@ -122,7 +169,8 @@ class OBV(BaseIndicator):
         price_change = df["Close"].iloc[idx] - price_start
         obv_change = df["OBV"].iloc[idx] - obv_start
 
-        obv_slice = df["OBV"].iloc[start_idx:]
+        # Only bars up to idx — never look past the evaluated bar
+        obv_slice = df["OBV"].iloc[start_idx : idx + 1 if idx != -1 else None]
         obv_range = obv_slice.max() - obv_slice.min()
         if pd.isna(obv_range) or obv_range == 0:
             obv_range = 1
@@ -149,6 +197,41 @@ class OBV(BaseIndicator):
 
         return SignalResult(self.name, SignalDirection.HOLD, 0.0, "OBV neutral")
 
+    def get_signal_series(self, df: pd.DataFrame) -> SignalSeries:
+        if "OBV" not in df.columns:
+            df = self.compute(df)
+
+        close = df["Close"]
+        obv = df["OBV"]
+        obv_sma = df["OBV_SMA"].to_numpy(dtype=float)
+
+        # Compare price trend vs OBV trend over last 10 bars
+        lookback = min(10, len(df) - 1)
+        if lookback < 2:
+            n = len(df)
+            return SignalSeries(self.name, np.zeros(n, dtype=np.int8), np.zeros(n))
+
+        price_start = close.shift(lookback).to_numpy(dtype=float)
+        obv_start = obv.shift(lookback).to_numpy(dtype=float)
+        price_change = close.to_numpy(dtype=float) - price_start
+        obv_change = obv.to_numpy(dtype=float) - obv_start
+
+        window = obv.rolling(lookback + 1, min_periods=1)
+        obv_range = (window.max() - window.min()).to_numpy(dtype=float)
+        obv_range = np.where(np.isnan(obv_range) | (obv_range == 0), 1.0, obv_range)
+        divergence = np.fmin(0.8, np.abs(obv_change) / obv_range)
+
+        obv = obv.to_numpy(dtype=float)
+        missing = np.isnan(obv) | np.isnan(obv_sma) | np.isnan(price_start) | np.isnan(obv_start)
+
+        return SignalSeries.from_rules(self.name, [
+            (missing, SignalDirection.HOLD, 0.0),
+            ((price_change < 0) & (obv_change > 0), SignalDirection.BUY, divergence),
+            ((price_change > 0) & (obv_change < 0), SignalDirection.SELL, divergence),
+            (obv > obv_sma, SignalDirection.BUY, 0.3),
+            (obv < obv_sma, SignalDirection.SELL, 0.3),
+        ])
+
     def get_chart_config(self) -> dict[str, Any]:
         return {
             "overlay": False,
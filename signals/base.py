@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 
 class SignalDirection(Enum):
     BUY = "BUY"
@@ -23,6 +25,59 @@ class SignalResult:
         self.confidence = max(0.0, min(1.0, self.confidence))
 
 
+# Integer codes used by whole-series (array) signal APIs
+DIRECTION_CODES = {SignalDirection.BUY: 1, SignalDirection.SELL: -1, SignalDirection.HOLD: 0}
+CODE_DIRECTIONS = {code: direction for direction, code in DIRECTION_CODES.items()}
+
+
+@dataclass
+class SignalSeries:
+    """Signals from a single indicator for every bar of a DataFrame."""
+
+    indicator_name: str
+    direction: np.ndarray  # int8 per bar: 1 = BUY, -1 = SELL, 0 = HOLD
+    confidence: np.ndarray  # float per bar, 0.0 to 1.0
+
+    def __len__(self) -> int:
+        return len(self.direction)
+
+    def direction_at(self, i: int) -> SignalDirection:
+        return CODE_DIRECTIONS[int(self.direction[i])]
+
+    @classmethod
+    def from_results(cls, indicator_name: str, results: list[SignalResult]) -> "SignalSeries":
+        """Pack per-bar SignalResults into arrays."""
+        return cls(
+            indicator_name,
+            np.array([DIRECTION_CODES[r.direction] for r in results], dtype=np.int8),
+            np.array([r.confidence for r in results], dtype=float),
+        )
+
+    @classmethod
+    def from_rules(
+        cls,
+        indicator_name: str,
+        rules: list[tuple[np.ndarray, SignalDirection, "np.ndarray | float"]],
+        default: tuple[SignalDirection, float] = (SignalDirection.HOLD, 0.0),
+    ) -> "SignalSeries":
+        """Build signals from ordered (mask, direction, confidence) rules.
+
+        Each bar takes the first rule whose mask is True, mirroring an
+        if/return chain in get_signal(); bars matching no rule get *default*.
+        Confidence is clamped to [0, 1] the same way SignalResult does.
+        """
+        masks = [mask for mask, _, _ in rules]
+        direction = np.select(
+            masks, [DIRECTION_CODES[d] for _, d, _ in rules], default=DIRECTION_CODES[default[0]]
+        ).astype(np.int8)
+        confidence = np.select(
+            masks, [np.broadcast_to(c, np.shape(masks[0])) for _, _, c in rules], default=default[1]
+        ).astype(float)
+        # max(0.0, min(1.0, x)) with Python's NaN semantics (NaN → 1.0)
+        confidence = np.fmax(0.0, np.fmin(1.0, confidence))
+        return cls(indicator_name, direction, confidence)
+
+
 @dataclass
 class CombinedSignal:
     """Result of combining multiple indicator signals."""
@@ -32,3 +87,27 @@ class CombinedSignal:
     scores: dict[str, float] = field(default_factory=dict)  # direction -> weighted score
     individual_signals: list[SignalResult] = field(default_factory=list)
     reasoning: str = ""
+
+
+@dataclass
+class CombinedSignalSeries:
+    """Combined signals for every bar, as produced by combine_signals_matrix()."""
+
+    direction: np.ndarray  # int8 per bar: 1 = BUY, -1 = SELL, 0 = HOLD
+    confidence: np.ndarray  # float per bar, 0.0 to 1.0
+    buy_scores: np.ndarray  # weighted BUY score per bar
+    sell_scores: np.ndarray  # weighted SELL score per bar
+    hold_scores: np.ndarray  # weighted HOLD score per bar (recorded, never votes)
+
+    def __len__(self) -> int:
+        return len(self.direction)
+
+    def direction_at(self, i: int) -> SignalDirection:
+        return CODE_DIRECTIONS[int(self.direction[i])]
+
+    def scores_at(self, i: int) -> dict[str, float]:
+        return {
+            "BUY": float(self.buy_scores[i]),
+            "SELL": float(self.sell_scores[i]),
+            "HOLD": float(self.hold_scores[i]),
+        }
@@ -1,11 +1,36 @@
 """Weighted majority voting signal combiner."""
 
+import numpy as np
 import pandas as pd
 
 from config.overrides import get_setting
-from config.settings import INDICATOR_CATEGORIES, TIMESCALE_ADJUSTMENTS
+from config.settings import (
+    INDICATOR_CACHE_TTL_SECONDS,
+    INDICATOR_CATEGORIES,
+    SIGNAL_CACHE_MAX_ENTRIES,
+    TIMESCALE_ADJUSTMENTS,
+    TUNABLE_THRESHOLDS,
+)
+from data.cache import TTLCache
 from indicators.base import BaseIndicator
-from signals.base import CombinedSignal, SignalDirection, SignalResult
+from indicators.cache import frame_key, params_key
+from indicators.pipeline import compute_indicators
+from signals.base import (
+    DIRECTION_CODES,
+    CombinedSignal,
+    CombinedSignalSeries,
+    SignalDirection,
+    SignalResult,
+)
+
+# Latest-bar signals of fetched frames, shared by every session and expiring
+# with the indicator columns they are read from
+_signal_cache: TTLCache[tuple, CombinedSignal] = TTLCache(
+    ttl=INDICATOR_CACHE_TTL_SECONDS, maxsize=SIGNAL_CACHE_MAX_ENTRIES, name="Combined signals"
+)
+
+# Settings get_signal() and the vote read; session overrides change the result
+_SIGNAL_SETTINGS = ("INDICATOR_WEIGHTS", *TUNABLE_THRESHOLDS)
 
 
 def _get_timescale(horizon_days: int) -> str:
@@ -16,15 +41,32 @@ def _get_timescale(horizon_days: int) -> str:
     return "long"
 
 
-def _get_adjusted_weight(indicator_name: str, horizon_days: int) -> float:
-    weights = get_setting("INDICATOR_WEIGHTS")
+def _adjusted_weight(indicator_name: str, timescale: str, weights: dict[str, float]) -> float:
     base_weight = weights.get(indicator_name, 1.0)
     category = INDICATOR_CATEGORIES.get(indicator_name, "trend")
-    timescale = _get_timescale(horizon_days)
     adjustment = TIMESCALE_ADJUSTMENTS[timescale].get(category, 1.0)
     return base_weight * adjustment
 
 
+def _get_adjusted_weight(indicator_name: str, horizon_days: int) -> float:
+    return _adjusted_weight(
+        indicator_name, _get_timescale(horizon_days), get_setting("INDICATOR_WEIGHTS")
+    )
+
+
+def indicator_weights(indicator_names: list[str], horizon_days: int) -> np.ndarray:
+    """Timescale-adjusted voting weights, one per indicator, in the given order.
+
+    Settings are read once here, so callers combining many bars don't pay
+    for a session-state lookup per indicator per bar.
+    """
+    weights = get_setting("INDICATOR_WEIGHTS")
+    timescale = _get_timescale(horizon_days)
+    return np.array(
+        [_adjusted_weight(name, timescale, weights) for name in indicator_names], dtype=float
+    )
+
+
 def _build_reasoning(
     direction: SignalDirection,
     confidence: float,
@@ -98,11 +140,9 @@ def combine_signals(
     individual_signals: list[SignalResult] = []
     direction_scores: dict[str, float] = {"BUY": 0.0, "SELL": 0.0, "HOLD": 0.0}
 
-    working_df = df if precomputed else df.copy()
+    working_df = df if precomputed else compute_indicators(df, indicators)
 
     for name, indicator in indicators.items():
-        if not precomputed:
-            working_df = indicator.compute(working_df)
         signal = indicator.get_signal(working_df, idx=idx)
         individual_signals.append(signal)
 
@@ -149,3 +189,145 @@ def combine_signals(
         individual_signals=individual_signals,
         reasoning=reasoning,
     )
+
+
+def combine_signals_cached(
+    indicators: dict[str, BaseIndicator],
+    df: pd.DataFrame,
+    horizon_days: int = 5,
+) -> CombinedSignal:
+    """combine_signals() at df's last bar, shared by every session.
+
+    df must already contain the indicator columns (e.g. from
+    compute_indicators()).  Results are keyed by the frame's identity,
+    the indicators and their parameters, the horizon and the effective
+    weights and thresholds, so sessions with different Advanced Settings
+    don't share entries.  Concurrent identical requests wait for one
+    computation.  Frames without a ticker in ``df.attrs`` are combined
+    uncached.  The returned signal is shared; don't modify it.
+    """
+    key = frame_key(df)
+    if key is None:
+        return combine_signals(indicators, df, horizon_days, precomputed=True)
+    key += (
+        horizon_days,
+        tuple((name, params_key(indicator)) for name, indicator in indicators.items()),
+        tuple(repr(get_setting(name)) for name in _SIGNAL_SETTINGS),
+    )
+    return _signal_cache.get_or_load(
+        key, lambda: combine_signals(indicators, df, horizon_days, precomputed=True)
+    )
+
+
+def clear_signal_cache() -> None:
+    _signal_cache.clear()
+
+
+def signal_matrices(
+    indicators: dict[str, BaseIndicator],
+    df: pd.DataFrame,
+    precomputed: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bar signals of every indicator as (n_bars, n_indicators) arrays.
+
+    Args:
+        indicators: dict of name -> BaseIndicator instance (column order).
+        df: DataFrame with OHLCV data.
+        precomputed: if True, skip indicator computation (columns already in df).
+
+    Returns:
+        (direction_matrix, confidence_matrix): int8 direction codes
+        (1 = BUY, -1 = SELL, 0 = HOLD) and confidences.
+    """
+    working_df = df if precomputed else compute_indicators(df, indicators)
+    directions = np.zeros((len(df), len(indicators)), dtype=np.int8)
+    confidences = np.zeros((len(df), len(indicators)), dtype=float)
+    for j, indicator in enumerate(indicators.values()):
+        series = indicator.get_signal_series(working_df)
+        directions[:, j] = series.direction
+        confidences[:, j] = series.confidence
+    return directions, confidences
+
+
+def combine_signals_matrix(
+    direction_matrix: np.ndarray,
+    confidence_matrix: np.ndarray,
+    weights: np.ndarray,
+    ambiguity_threshold: float | None = None,
+) -> CombinedSignalSeries:
+    """Weighted voting over every bar at once.
+
+    Applies exactly the rules of combine_signals() — HOLD signals don't
+    vote, and a BUY/SELL margin below the ambiguity threshold gives HOLD —
+    but without building per-bar SignalResults or reasoning text.  Use
+    combined_signal_at() for the full breakdown of bars that are displayed.
+
+    Args:
+        direction_matrix: (n_bars, n_indicators) direction codes.
+        confidence_matrix: (n_bars, n_indicators) confidences.
+        weights: (n_indicators,) weights, e.g. from indicator_weights().
+        ambiguity_threshold: defaults to the AMBIGUITY_THRESHOLD setting.
+
+    Returns:
+        CombinedSignalSeries with one combined signal per bar.
+    """
+    if ambiguity_threshold is None:
+        ambiguity_threshold = get_setting("AMBIGUITY_THRESHOLD")
+
+    n_bars = direction_matrix.shape[0]
+    buy_score = np.zeros(n_bars)
+    sell_score = np.zeros(n_bars)
+    hold_score = np.zeros(n_bars)
+    # Accumulate indicator by indicator so the sums round exactly as the
+    # sequential per-bar loop in combine_signals() does.
+    for j in range(direction_matrix.shape[1]):
+        score = confidence_matrix[:, j] * weights[j]
+        codes = direction_matrix[:, j]
+        buy_score += np.where(codes == DIRECTION_CODES[SignalDirection.BUY], score, 0.0)
+        sell_score += np.where(codes == DIRECTION_CODES[SignalDirection.SELL], score, 0.0)
+        hold_score += np.where(codes == DIRECTION_CODES[SignalDirection.HOLD], score, 0.0)
+
+    directional_total = buy_score + sell_score
+    buy_wins = buy_score >= sell_score
+    top_score = np.where(buy_wins, buy_score, sell_score)
+    second_score = np.where(buy_wins, sell_score, buy_score)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        decided = (directional_total != 0) & (
+            (top_score - second_score) / directional_total >= ambiguity_threshold
+        )
+        confidence = np.where(decided, top_score / directional_total, 0.0)
+    direction = np.where(
+        decided,
+        np.where(buy_wins, DIRECTION_CODES[SignalDirection.BUY], DIRECTION_CODES[SignalDirection.SELL]),
+        DIRECTION_CODES[SignalDirection.HOLD],
+    ).astype(np.int8)
+
+    return CombinedSignalSeries(direction, confidence, buy_score, sell_score, hold_score)
+
+
+def combined_signal_at(
+    combined: CombinedSignalSeries,
+    i: int,
+    indicators: dict[str, BaseIndicator],
+    df: pd.DataFrame,
+) -> CombinedSignal:
+    """Expand one bar of a CombinedSignalSeries into a full CombinedSignal.
+
+    The individual signals and reasoning text are built here, only for
+    the bars that are actually shown.  *df* must already hold the
+    indicator columns.
+    """
+    direction = combined.direction_at(i)
+    confidence = float(combined.confidence[i])
+    scores = combined.scores_at(i)
+    individual_signals = [indicator.get_signal(df, idx=i) for indicator in indicators.values()]
+    return CombinedSignal(
+        direction=direction,
+        confidence=confidence,
+        scores=scores,
+        individual_signals=individual_signals,
+        reasoning=_build_reasoning(
+            direction, confidence, individual_signals, scores["BUY"], scores["SELL"]
+        ),
+    )
@@ -0,0 +1,215 @@
+"""Concurrent watchlist scan engine.
+
+Fetching is network-bound, so tickers are fanned out over a bounded thread
+pool.  Indicator computation is CPU-bound, so computed frames are produced
+in a process pool.  Signal combination runs in the caller's thread because
+it reads session-scoped setting overrides.
+
+Results are yielded as each ticker finishes, so callers can update progress
+and partial results incrementally instead of waiting for the whole list.
+"""
+
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Iterator
+
+import pandas as pd
+
+from config.settings import (
+    DEFAULT_INTERVAL,
+    SCAN_COMPUTE_WORKERS,
+    SCAN_IO_WORKERS,
+    SCREENER_PERIOD,
+)
+from data.fetcher import fetch_ohlcv, fetch_ohlcv_many, get_asset_info
+from indicators.base import BaseIndicator
+from indicators.pipeline import compute_indicators
+from signals.base import CombinedSignal
+from signals.combiner import combine_signals_cached
+
+
+@dataclass
+class ScanResult:
+    """Outcome of scanning a single ticker."""
+
+    ticker: str
+    name: str = ""
+    price: float = float("nan")
+    change_pct: float = float("nan")
+    signal: CombinedSignal | None = None
+    error: str = ""  # non-empty when the ticker failed
+    fetch_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.signal is not None and not self.error
+
+
+# The compute pool outlives individual scans so worker processes keep their
+# in-process reference-data caches warm between scans.
+_pool_lock = threading.Lock()
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_size = 0
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    global _process_pool, _process_pool_size
+    with _pool_lock:
+        if _process_pool is None or _process_pool_size != workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = ProcessPoolExecutor(max_workers=workers)
+            _process_pool_size = workers
+        return _process_pool
+
+
+def _discard_process_pool() -> None:
+    global _process_pool, _process_pool_size
+    with _pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_size = 0
+
+
+def _fetch(ticker: str, period: str, interval: str) -> tuple[pd.DataFrame, dict | None, float]:
+    start = time.perf_counter()
+    df = fetch_ohlcv(ticker, period=period, interval=interval)
+    info = get_asset_info(ticker)
+    return df, info, time.perf_counter() - start
+
+
+def _compute(df: pd.DataFrame, indicators: list[BaseIndicator]) -> tuple[pd.DataFrame, float]:
+    start = time.perf_counter()
+    computed = compute_indicators(df, indicators)
+    return computed, time.perf_counter() - start
+
+
+def _describe_error(exc: BaseException) -> str:
+    if isinstance(exc, ValueError):
+        return str(exc)
+    return f"{type(exc).__name__}: {exc}"
+
+
+def scan_tickers(
+    tickers: list[str],
+    indicators: dict[str, BaseIndicator],
+    horizon_days: int = 5,
+    period: str = SCREENER_PERIOD,
+    interval: str = DEFAULT_INTERVAL,
+    io_workers: int = SCAN_IO_WORKERS,
+    compute_workers: int = SCAN_COMPUTE_WORKERS,
+    prefetch: bool = True,
+) -> Iterator[ScanResult]:
+    """Scan tickers concurrently, yielding one ScanResult per ticker as it finishes.
+
+    Args:
+        tickers: Ticker symbols to scan (duplicates are scanned once).
+        indicators: dict of indicator name -> instance.
+        horizon_days: Prediction horizon for signal combination.
+        period: Data period to fetch for each ticker.
+        interval: Bar interval to fetch for each ticker.
+        io_workers: Maximum concurrent fetches.
+        compute_workers: Indicator compute processes.  0 computes in the
+            fetch thread pool instead (useful where subprocesses are unwanted).
+        prefetch: Warm the data cache with one bulk download before fanning
+            out, so per-ticker fetches are cache hits.
+
+    Yields:
+        ScanResult in completion order.  Failed tickers are yielded too, with
+        ``error`` set, so callers can report them.
+    """
+    unique = list(dict.fromkeys(tickers))
+    if not unique:
+        return
+
+    if prefetch and len(unique) > 1:
+        try:
+            fetch_ohlcv_many(unique, period=period, interval=interval)
+        except Exception:
+            pass  # per-ticker fetches below report individual failures
+
+    indicator_list = list(indicators.values())
+    compute_pool: Executor | None = (
+        _get_process_pool(compute_workers) if compute_workers > 0 else None
+    )
+
+    started: dict[str, float] = {}
+    fetched: dict[str, tuple[pd.DataFrame, dict | None, float]] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(io_workers, len(unique))),
+        thread_name_prefix="scan-io",
+    ) as io_pool:
+        pending: dict[Future, tuple[str, str]] = {}
+
+        def submit_compute(ticker: str) -> None:
+            nonlocal compute_pool
+            df = fetched[ticker][0]
+            if compute_pool is not None:
+                try:
+                    pending[compute_pool.submit(_compute, df, indicator_list)] = (ticker, "compute")
+                    return
+                except (BrokenProcessPool, RuntimeError):
+                    _discard_process_pool()
+                    compute_pool = None
+            pending[io_pool.submit(_compute, df, indicator_list)] = (ticker, "compute")
+
+        for ticker in unique:
+            started[ticker] = time.perf_counter()
+            pending[io_pool.submit(_fetch, ticker, period, interval)] = (ticker, "fetch")
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker, stage = pending.pop(future)
+
+                if stage == "fetch":
+                    try:
+                        fetched[ticker] = future.result()
+                    except Exception as e:
+                        yield ScanResult(
+                            ticker=ticker,
+                            error=_describe_error(e),
+                            total_seconds=time.perf_counter() - started[ticker],
+                        )
+                        continue
+                    submit_compute(ticker)
+                    continue
+
+                df, info, fetch_seconds = fetched.pop(ticker)
+                result = ScanResult(ticker=ticker, fetch_seconds=fetch_seconds)
+                try:
+                    try:
+                        computed, result.compute_seconds = future.result()
+                    except BrokenProcessPool:
+                        # A worker died; finish the scan in-thread.
+                        _discard_process_pool()
+                        compute_pool = None
+                        computed, result.compute_seconds = _compute(df, indicator_list)
+
+                    result.signal = combine_signals_cached(
+                        indicators, computed, horizon_days=horizon_days
+                    )
+                    result.name = info["name"] if info else ticker
+                    result.price = float(df["Close"].iloc[-1])
+                    prev_close = float(df["Close"].iloc[-2]) if len(df) > 1 else result.price
+                    result.change_pct = (result.price - prev_close) / prev_close * 100
+                except Exception as e:
+                    result.signal = None
+                    result.error = _describe_error(e)
+
+                result.total_seconds = time.perf_counter() - started[ticker]
+                yield result
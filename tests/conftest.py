@@ -92,3 +92,21 @@ def ohlcv_short():
 def ohlcv_empty():
     """Empty OHLCV DataFrame."""
     return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ohlcv_store(tmp_path, monkeypatch):
+    """Keep the on-disk OHLCV store out of the user's home directory."""
+    from data import store
+
+    monkeypatch.setattr(store, "_STORE_DIR", tmp_path / "ohlcv")
+
+
+@pytest.fixture(autouse=True)
+def _empty_indicator_cache():
+    """Don't let computed indicator columns leak between tests."""
+    from indicators.cache import clear_indicator_cache
+
+    clear_indicator_cache()
+    yield
+    clear_indicator_cache()
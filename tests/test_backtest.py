@@ -4,9 +4,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from backtesting.engine import run_backtest
+from backtesting.engine import array_report, overlap_report, run_backtest
 from backtesting.metrics import compute_metrics
-from backtesting.report import BacktestReport, Trade
+from backtesting.report import RESULT_METRICS, BacktestReport, MultiHorizonReport, Trade
+from indicators.momentum import RSI
 from indicators.registry import get_all_indicators
 from tests.conftest import make_ohlcv
 
@@ -64,6 +65,183 @@ class TestRunBacktest:
             assert report_with_cost.trades[0].pnl_pct < report_no_cost.trades[0].pnl_pct
 
 
+class TestArrayEngine:
+    """The array engine must reproduce the loop engine trade for trade."""
+
+    @pytest.fixture
+    def indicators(self):
+        return get_all_indicators()
+
+    @pytest.mark.parametrize("trend,seed,horizon", [
+        ("up", 42, 5), ("volatile", 7, 1), ("down", 3, 10), ("volatile", 11, 20),
+    ])
+    def test_matches_loop_engine(self, indicators, trend, seed, horizon):
+        df = make_ohlcv(400, trend=trend, seed=seed)
+        loop = run_backtest(df, indicators, ticker="TEST", period="1y",
+                            horizon_days=horizon, cost_per_trade_pct=0.1, engine="loop")
+        array = run_backtest(df, indicators, ticker="TEST", period="1y",
+                             horizon_days=horizon, cost_per_trade_pct=0.1, engine="array")
+
+        assert array.total_trades == loop.total_trades > 0
+        assert list(array.trades) == loop.trades
+        for field in ("winning_trades", "losing_trades", "win_rate", "correct_predictions",
+                      "prediction_accuracy", "cumulative_return", "max_drawdown"):
+            assert getattr(array, field) == getattr(loop, field), field
+        assert array.sharpe_ratio == pytest.approx(loop.sharpe_ratio, rel=1e-12)
+        assert array.profit_factor == pytest.approx(loop.profit_factor, rel=1e-12)
+        pd.testing.assert_series_equal(array.equity_curve, loop.equity_curve)
+
+    def test_trades_materialized_lazily(self, indicators):
+        df = make_ohlcv(300, trend="volatile", seed=7)
+        report = run_backtest(df, indicators, ticker="TEST", period="1y",
+                              horizon_days=5, engine="array")
+        assert report.trades._trades is None  # metrics didn't need Trade objects
+        assert len(report.trades) == len(report.trade_arrays) == report.total_trades
+        assert isinstance(report.trades[0], Trade)
+        assert report.trades._trades is not None
+
+    def test_insufficient_data_zero_trades(self, indicators):
+        report = run_backtest(make_ohlcv(10), indicators, ticker="TEST", period="1y",
+                              horizon_days=5, engine="array")
+        assert report.total_trades == 0
+        assert len(report.trades) == 0
+
+    def test_unknown_engine(self, indicators):
+        with pytest.raises(ValueError, match="Unknown backtest engine"):
+            run_backtest(make_ohlcv(300), indicators, ticker="TEST", period="1y", engine="fast")
+
+
+class TestOverlapEngine:
+    @pytest.fixture
+    def indicators(self):
+        return get_all_indicators()
+
+    @staticmethod
+    def _report(horizon=5):
+        return BacktestReport(ticker="TEST", period="1y", horizon_days=horizon,
+                              initial_capital=10_000.0)
+
+    def test_enters_on_every_signal(self, indicators):
+        df = make_ohlcv(400, trend="volatile", seed=7)
+        array = run_backtest(df, indicators, ticker="TEST", period="1y", engine="array")
+        overlap = run_backtest(df, indicators, ticker="TEST", period="1y", engine="overlap")
+
+        assert overlap.total_trades > array.total_trades
+        # The non-overlapping trades are a subset of the overlapping ones
+        assert set(array.trade_arrays.entry_idx) <= set(overlap.trade_arrays.entry_idx)
+        assert (np.diff(overlap.trade_arrays.entry_idx) < 5).any()
+
+    def test_equity_matches_cohort_loop(self):
+        df = make_ohlcv(120, trend="volatile", seed=5)
+        rng = np.random.default_rng(0)
+        direction = rng.choice(np.array([-1, 0, 1], dtype=np.int8), size=len(df))
+        horizon, start, end, cost = 4, 10, len(df) - 4, 0.2
+        report = overlap_report(self._report(horizon), df, direction, start, end, cost)
+
+        close = df["Close"].to_numpy()
+        equity = [10_000.0]
+        for s in range(start, end + horizon):
+            open_cohorts = [direction[t] for t in range(max(start, s - horizon), min(s, end))]
+            step = sum(d * (close[s] / close[s - 1] - 1) for d in open_cohorts) / horizon
+            if start <= s < end and direction[s] != 0:
+                step -= cost / 100 / horizon
+            equity.append(equity[-1] * (1 + step))
+
+        np.testing.assert_allclose(report.equity_curve.to_numpy(), equity, rtol=1e-12)
+        assert report.equity_curve.index[0] == df.index[start - 1]
+        assert report.total_trades == np.count_nonzero(direction[start:end])
+        assert report.cumulative_return == pytest.approx(equity[-1] / 10_000.0 - 1, rel=1e-12)
+
+    def test_start_date_invariant(self):
+        df = make_ohlcv(200, trend="volatile", seed=9)
+        direction = np.random.default_rng(1).choice(np.array([-1, 0, 1], dtype=np.int8),
+                                                    size=len(df))
+        end = len(df) - 5
+        early = overlap_report(self._report(), df, direction, 60, end, 0.1).trade_arrays
+        late = overlap_report(self._report(), df, direction, 61, end, 0.1).trade_arrays
+        np.testing.assert_array_equal(early.entry_idx[early.entry_idx >= 61], late.entry_idx)
+
+        # The skip-ahead walk can pick a different trade sequence from a one-bar shift
+        walk = [array_report(self._report(), df, direction, start, end, 0.1).trade_arrays
+                for start in range(60, 65)]
+        assert any(set(w.entry_idx[w.entry_idx >= 64]) != set(walk[-1].entry_idx) for w in walk)
+
+    def test_no_signals(self):
+        df = make_ohlcv(100)
+        report = overlap_report(self._report(), df, np.zeros(len(df), dtype=np.int8),
+                                 60, 95, 0.1)
+        assert report.total_trades == 0
+        assert report.equity_curve.empty
+
+    def test_multi_horizon(self, indicators):
+        df = make_ohlcv(300, trend="volatile", seed=3)
+        multi = run_backtest(df, indicators, ticker="TEST", period="1y",
+                             horizon_days=[1, 5], engine="overlap")
+        single = run_backtest(df, indicators, ticker="TEST", period="1y",
+                              horizon_days=5, engine="overlap")
+        pd.testing.assert_series_equal(multi[5].equity_curve, single.equity_curve)
+
+
+class TestMultiHorizon:
+    @pytest.fixture
+    def indicators(self):
+        return get_all_indicators()
+
+    @pytest.mark.parametrize("engine", ["loop", "array"])
+    def test_matches_single_horizon_runs(self, indicators, engine):
+        df = make_ohlcv(400, trend="volatile", seed=11)
+        multi = run_backtest(df, indicators, ticker="TEST", period="1y",
+                             horizon_days=[1, 5, 20], engine=engine)
+
+        assert isinstance(multi, MultiHorizonReport)
+        assert multi.horizons == [1, 5, 20]
+        for horizon in (1, 5, 20):
+            single = run_backtest(df, indicators, ticker="TEST", period="1y",
+                                  horizon_days=horizon, engine=engine)
+            assert multi[horizon].horizon_days == horizon
+            assert list(multi[horizon].trades) == list(single.trades)
+            assert multi[horizon].sharpe_ratio == single.sharpe_ratio
+
+    def test_indicators_computed_once(self, monkeypatch):
+        calls = []
+        rsi = RSI()
+        compute = rsi.compute_columns
+        monkeypatch.setattr(rsi, "compute_columns", lambda df: calls.append(1) or compute(df))
+        run_backtest(make_ohlcv(300, trend="volatile"), {"RSI": rsi}, ticker="TEST",
+                     period="1y", horizon_days=[1, 5, 20], engine="array")
+        assert len(calls) == 1
+
+    def test_comparison_table(self, indicators):
+        multi = run_backtest(make_ohlcv(300, trend="up"), indicators, ticker="TEST",
+                             period="1y", horizon_days=(5, 1, 5), engine="array")
+        table = multi.comparison()
+        assert list(table.index) == [5, 1]  # request order, duplicates dropped
+        assert list(table.columns) == list(RESULT_METRICS)
+        assert table.loc[1, "total_trades"] == multi[1].total_trades
+
+    def test_horizon_too_long_gives_empty_report(self, indicators):
+        multi = run_backtest(make_ohlcv(200), indicators, ticker="TEST", period="1y",
+                             horizon_days=[5, 500], engine="array")
+        assert multi[500].total_trades == 0
+        assert multi[5].horizon_days == 5
+
+    def test_numpy_horizons(self, indicators):
+        df = make_ohlcv(300, trend="volatile", seed=4)
+        multi = run_backtest(df, indicators, ticker="TEST", period="1y",
+                             horizon_days=np.array([1, 5]), engine="array")
+        assert isinstance(multi, MultiHorizonReport)
+        assert multi.horizons == [1, 5]
+        assert all(type(h) is int for h in multi.horizons)
+        single = run_backtest(df, indicators, ticker="TEST", period="1y",
+                              horizon_days=np.int64(5), engine="array")
+        assert single.horizon_days == 5
+        assert list(single.trades) == list(multi[5].trades)
+
+    def test_empty_list(self, indicators):
+        with pytest.raises(ValueError, match="at least one horizon"):
+            run_backtest(make_ohlcv(300), indicators, ticker="TEST", period="1y", horizon_days=[])
+
+
 class TestComputeMetrics:
     def _make_trade(self, pnl_pct, correct=True, direction="BUY"):
         return Trade(
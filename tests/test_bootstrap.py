@@ -0,0 +1,106 @@
+"""Tests for bootstrap confidence intervals."""
+
+import time
+
+import numpy as np
+import pytest
+
+from backtesting.bootstrap import _path_metrics, bootstrap_price_paths, bootstrap_trades
+from backtesting.engine import run_backtest
+from backtesting.metrics import compute_metrics
+from backtesting.report import BacktestReport, TradeArrays
+from indicators.momentum import RSI, Stochastic
+from indicators.trend import MACD
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture(scope="module")
+def df():
+    return make_ohlcv(1500, trend="volatile", seed=4)
+
+
+@pytest.fixture(scope="module")
+def indicators():
+    return {"RSI": RSI(), "Stochastic": Stochastic(), "MACD": MACD()}
+
+
+@pytest.fixture(scope="module", params=["loop", "array"])
+def report(request, df, indicators):
+    return run_backtest(df, indicators, ticker="T", period="5y", engine=request.param)
+
+
+def _report_for(returns: np.ndarray) -> BacktestReport:
+    n = len(returns)
+    zeros = np.zeros(n, dtype=np.int8)
+    dates = make_ohlcv(n + 1).index
+    report = BacktestReport(ticker="T", period="1y", horizon_days=5, initial_capital=1.0)
+    report.trade_arrays = TradeArrays(
+        entry_idx=np.arange(n), exit_idx=np.arange(n) + 1,
+        entry_dates=dates[:-1], exit_dates=dates[1:],
+        direction=zeros + 1, actual_direction=zeros,
+        entry_price=np.ones(n), exit_price=np.ones(n), pnl_pct=returns,
+    )
+    return compute_metrics(report)
+
+
+class TestPathMetrics:
+    def test_matches_compute_metrics_per_row(self):
+        rng = np.random.default_rng(1)
+        returns = rng.normal(0.002, 0.03, size=(20, 30))
+        returns[0] = 0.01  # zero variance
+        returns[1, :5] = -0.2  # drawdown from the initial capital
+        cumulative_return, sharpe_ratio, max_drawdown = _path_metrics(returns, 5, False)
+        for i, row in enumerate(returns):
+            expected = _report_for(row)
+            assert cumulative_return[i] == pytest.approx(expected.cumulative_return, rel=1e-12)
+            assert sharpe_ratio[i] == pytest.approx(expected.sharpe_ratio, rel=1e-9, abs=1e-12)
+            assert max_drawdown[i] == pytest.approx(expected.max_drawdown, rel=1e-12, abs=1e-15)
+
+
+class TestBootstrapTrades:
+    def test_interval_brackets_observed_and_is_reproducible(self, report):
+        result = bootstrap_trades(report, n_resamples=2000, seed=3)
+        assert result.n_resamples == len(result.sharpe_ratio) == 2000
+        low, high = result.interval("cumulative_return")
+        assert low < report.cumulative_return < high
+        assert (result.max_drawdown >= 0).all()
+
+        again = bootstrap_trades(report, n_resamples=2000, seed=3)
+        np.testing.assert_array_equal(again.sharpe_ratio, result.sharpe_ratio)
+
+    def test_summary(self, report):
+        summary = bootstrap_trades(report, n_resamples=500, seed=0).summary()
+        assert list(summary.index) == ["cumulative_return", "sharpe_ratio", "max_drawdown"]
+        assert summary.loc["sharpe_ratio", "observed"] == report.sharpe_ratio
+        assert (summary["low"] <= summary["median"]).all()
+        assert (summary["median"] <= summary["high"]).all()
+
+    def test_no_trades(self):
+        report = BacktestReport(ticker="T", period="1y", horizon_days=5, initial_capital=1.0)
+        with pytest.raises(ValueError):
+            bootstrap_trades(report)
+
+    def test_ten_thousand_resamples_are_fast(self, report):
+        start = time.perf_counter()
+        bootstrap_trades(report, n_resamples=10_000, seed=0)
+        assert time.perf_counter() - start < 1.0
+
+
+class TestBootstrapPricePaths:
+    def test_whole_path_block_reproduces_the_backtest(self, report, df):
+        # A single block spanning the path can only start at its first bar
+        result = bootstrap_price_paths(report, df["Close"], n_resamples=5,
+                                       block_bars=len(df), seed=0)
+        np.testing.assert_allclose(result.cumulative_return, report.cumulative_return, rtol=1e-9)
+        np.testing.assert_allclose(result.sharpe_ratio, report.sharpe_ratio, rtol=1e-9)
+        np.testing.assert_allclose(result.max_drawdown, report.max_drawdown, rtol=1e-9)
+
+    def test_resampled_paths_vary(self, report, df):
+        result = bootstrap_price_paths(report, df["Close"], n_resamples=1000, seed=1)
+        assert result.method == "price_path"
+        assert np.std(result.cumulative_return) > 0
+        assert 0.0 <= result.probability_of_loss <= 1.0
+
+    def test_dates_must_be_in_price_index(self, report, df):
+        with pytest.raises(ValueError, match="missing"):
+            bootstrap_price_paths(report, df["Close"].iloc[:100])
@@ -0,0 +1,342 @@
+"""Tests for the in-process TTL cache and the caches built on it."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from config import settings
+from config.overrides import override_settings
+from data.cache import TTLCache, shared_caches
+from indicators import _utils
+from indicators import cache as indicator_cache
+from indicators.momentum import RSI
+from indicators.pipeline import compute_cached, compute_indicators
+from indicators.registry import get_all_indicators
+from indicators.structural import BubbleRisk
+from tests.conftest import make_ohlcv
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_hit_after_load(self):
+        cache = TTLCache(ttl=10)
+        calls = []
+        assert cache.get_or_load("a", lambda: calls.append(1) or 42) == 42
+        assert cache.get_or_load("a", lambda: calls.append(1) or 0) == 42
+        assert len(calls) == 1
+        assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert "a" in cache
+        clock.now = 10.0
+        assert "a" not in cache
+        assert cache.get_or_load("a", lambda: 2) == 2
+
+    def test_failures_cached_for_negative_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=100, negative_ttl=5, clock=clock)
+        assert cache.get_or_load("a", lambda: None) is None
+        assert cache.get_or_load("a", lambda: 1) is None  # still negatively cached
+        clock.now = 5.0
+        assert cache.get_or_load("a", lambda: 1) == 1
+
+    def test_negative_caching_disabled(self):
+        cache = TTLCache(ttl=100, negative_ttl=0)
+        cache.get_or_load("a", lambda: None)
+        assert "a" not in cache
+
+    def test_lru_eviction(self):
+        cache = TTLCache(ttl=None, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a is now most recently used
+        cache.set("c", 3)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats.evictions == 1
+
+    def test_loader_errors_not_cached(self):
+        cache = TTLCache(ttl=10)
+
+        def boom():
+            raise RuntimeError("network down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("a", boom)
+        assert cache.get_or_load("a", lambda: 7) == 7
+        assert cache.stats.load_errors == 1
+
+    def test_single_flight(self):
+        cache = TTLCache(ttl=10)
+        calls = []
+        release = threading.Event()
+
+        def slow_load():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_load)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+
+    def test_in_flight_count(self):
+        cache = TTLCache(ttl=10)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_load():
+            started.set()
+            release.wait(5)
+            return "value"
+
+        thread = threading.Thread(target=lambda: cache.get_or_load("k", slow_load))
+        thread.start()
+        started.wait(5)
+        assert cache.in_flight == 1
+        release.set()
+        thread.join(5)
+        assert cache.in_flight == 0
+
+    def test_memory_usage(self):
+        cache = TTLCache(ttl=10)
+        assert cache.memory_usage() == 0
+        df = make_ohlcv(1_000)
+        cache.set("frame", df)
+        cache.set("columns", {"RSI": df["Close"].to_numpy()})
+        expected = df.memory_usage(deep=True).sum() + df["Close"].to_numpy().nbytes
+        assert expected <= cache.memory_usage() < expected + 2_000
+
+    def test_named_caches_are_listed(self):
+        import data.fetcher  # noqa: F401
+        import signals.combiner  # noqa: F401
+
+        assert {"Price data", "Indicator columns", "Reference prices", "Combined signals"} <= set(
+            shared_caches()
+        )
+        cache = TTLCache(ttl=10, name="test cache")
+        assert shared_caches()["test cache"] is cache
+
+    def test_bulk_load_leaves_unreturned_keys_uncached(self):
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        requested = []
+
+        def bulk(keys):
+            requested.append(keys)
+            return {"b": 2}
+
+        result = cache.get_many_or_load(["a", "b", "c"], bulk)
+        assert result == {"a": 1, "b": 2}
+        assert requested == [["b", "c"]]
+        assert "b" in cache and "c" not in cache
+
+
+@pytest.fixture
+def reference_downloads(monkeypatch):
+    """Serve reference closes from memory and record what was downloaded."""
+    downloads = []
+    index = pd.bdate_range("2024-01-02", periods=50)
+
+    def _download_close(ticker, period):
+        downloads.append(ticker)
+        return None if ticker.startswith("BAD") else pd.Series(1.0, index=index)
+
+    def _download_many(tickers, period="1y", interval="1d"):
+        downloads.append(tuple(tickers))
+        return {t: pd.DataFrame({"Close": 2.0}, index=index) for t in tickers if not t.startswith("BAD")}
+
+    monkeypatch.setattr(_utils, "_download_close", _download_close)
+    monkeypatch.setattr("data.fetcher.download_ohlcv_many", _download_many)
+    _utils.clear_reference_cache()
+    yield downloads
+    _utils.clear_reference_cache()
+
+
+class TestReferenceService:
+    def test_fetch_is_cached(self, reference_downloads):
+        first = _utils.fetch_reference_close("^VIX")
+        assert _utils.fetch_reference_close("^VIX") is first
+        assert reference_downloads == ["^VIX"]
+
+    def test_prefetch_bulk_then_individual_fallback(self, reference_downloads, monkeypatch):
+        monkeypatch.setattr(_utils, "reference_tickers", lambda: ["^VIX", "BAD1", "GC=F"])
+        _utils.prefetch_reference_data()
+        assert reference_downloads[0] == ("^VIX", "BAD1", "GC=F")
+        assert reference_downloads[1:] == ["BAD1"]
+        assert _utils.fetch_reference_close("GC=F").iloc[0] == 2.0
+        assert _utils.fetch_reference_close("BAD1") is None  # negatively cached
+        assert len(reference_downloads) == 2
+
+    def test_reference_tickers_cover_cross_asset_indicators(self):
+        tickers = _utils.reference_tickers()
+        for ticker in ("HG=F", "GC=F", "^VIX", "^VIX3M", "XLK"):
+            assert ticker in tickers
+
+    def test_background_prefetch_runs_once(self, reference_downloads, monkeypatch):
+        monkeypatch.setattr(_utils, "reference_tickers", lambda: ["^VIX", "GC=F"])
+        thread = _utils.start_reference_prefetch()
+        assert thread is not None
+        thread.join(5)
+        assert _utils.start_reference_prefetch() is None  # everything is cached now
+        assert reference_downloads == [("^VIX", "GC=F")]
+
+
+def _reindex_align(series, target_index):
+    """Reference: the reindex-based alignment align_to_index used to do."""
+    series = series.copy()
+    if series.index.tz is not None:
+        series.index = series.index.tz_localize(None)
+    norm_target = target_index.tz_localize(None) if target_index.tz is not None else target_index
+    series.index = series.index.normalize()
+    aligned = series.reindex(norm_target.normalize(), method="ffill")
+    aligned.index = target_index
+    return aligned
+
+
+class TestAlignToIndex:
+    reference = pd.Series(
+        range(300),
+        index=pd.bdate_range("2023-06-01", periods=300, tz="America/New_York"),
+        name="Close",
+        dtype=float,
+    )
+
+    @pytest.mark.parametrize(
+        "target",
+        [
+            pd.bdate_range("2023-01-02", periods=400),  # starts before the reference
+            pd.date_range("2023-07-01", periods=200, freq="D", tz="UTC"),  # crypto calendar
+            pd.date_range("2024-01-02 09:30", periods=100, freq="5min", tz="America/New_York"),
+        ],
+    )
+    def test_matches_reindex(self, target):
+        _utils.clear_reference_cache()
+        expected = _reindex_align(self.reference, target)
+        pd.testing.assert_series_equal(_utils.align_to_index(self.reference, target), expected)
+        # Second call is served from the indexer cache
+        pd.testing.assert_series_equal(_utils.align_to_index(self.reference, target), expected)
+
+    def test_indexer_shared_across_series_with_same_calendar(self):
+        _utils.clear_reference_cache()
+        target = pd.bdate_range("2023-01-02", periods=400)
+        misses = _utils._indexer_cache.stats.misses
+        for offset in range(5):
+            _utils.align_to_index(self.reference + offset, target)
+        assert _utils._indexer_cache.stats.misses == misses + 1
+
+    def test_none_gives_all_nan(self):
+        target = pd.bdate_range("2024-01-02", periods=10)
+        result = _utils.align_to_index(None, target)
+        assert result.isna().all()
+        assert result.index.equals(target)
+
+
+def _fetched(n_bars=300, ticker="TEST", **kwargs):
+    df = make_ohlcv(n_bars, **kwargs)
+    df.attrs.update(ticker=ticker, interval="1d")
+    return df
+
+
+def _uncached(df, indicators):
+    computed = df.copy()
+    for indicator in indicators:
+        computed = indicator.compute(computed)
+    return computed
+
+
+class TestIndicatorColumnCache:
+    def test_matches_compute_and_hits_on_rerun(self):
+        df = _fetched(trend="volatile")
+        # Indicators that need only the frame's own prices
+        indicators = {n: i for n, i in get_all_indicators().items() if not i.reference_tickers}
+        expected = _uncached(df, indicators.values())
+
+        first = compute_indicators(df, indicators)
+        stats = indicator_cache.cache_stats()
+        misses, hits = stats.misses, stats.hits
+        second = compute_indicators(df, indicators)
+
+        pd.testing.assert_frame_equal(first, expected)
+        pd.testing.assert_frame_equal(second, expected)
+        assert stats.misses == misses
+        assert stats.hits == hits + len(indicators)
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+    def test_thresholds_dont_invalidate(self):
+        df = _fetched()
+        compute_cached(BubbleRisk(), df)
+        misses = indicator_cache.cache_stats().misses
+        with override_settings(RSI_OVERSOLD=20, AMBIGUITY_THRESHOLD=0.2):
+            compute_cached(BubbleRisk(), df)
+        assert indicator_cache.cache_stats().misses == misses
+
+    def test_parameter_change_recomputes(self, monkeypatch):
+        df = _fetched(trend="volatile")
+        default = compute_cached(RSI(), df)["RSI"]
+        monkeypatch.setattr(settings, "RSI_PERIOD", 7)
+        shorter = compute_cached(RSI(), df)["RSI"]
+        pd.testing.assert_series_equal(shorter, RSI().compute(df)["RSI"])
+        assert not shorter.equals(default)
+
+    def test_new_or_updated_bar_recomputes(self):
+        df = _fetched()
+        compute_cached(RSI(), df)
+        misses = indicator_cache.cache_stats().misses
+
+        forming = df.copy()
+        forming.iloc[-1, forming.columns.get_loc("Close")] += 1.0  # last bar still moving
+        compute_cached(RSI(), forming)
+        compute_cached(RSI(), _fetched(301))
+        compute_cached(RSI(), _fetched(ticker="OTHER"))
+        assert indicator_cache.cache_stats().misses == misses + 3
+
+    def test_frames_without_ticker_not_cached(self):
+        df = make_ohlcv(300)
+        compute_cached(RSI(), df)
+        compute_cached(RSI(), df)
+        assert len(indicator_cache._column_cache) == 0
+
+    def test_callers_cannot_corrupt_entries(self):
+        df = _fetched(trend="volatile")
+        result = compute_cached(RSI(), df)
+        result.loc[:, "RSI"] = 0.0
+        pd.testing.assert_series_equal(compute_cached(RSI(), df)["RSI"],
+                                       RSI().compute(df)["RSI"])
+
+    def test_frame_with_existing_columns(self):
+        df = _fetched(trend="volatile")
+        precomputed = RSI().compute(df)
+        compute_cached(RSI(), precomputed)
+        # The entry still holds the RSI column for the raw frame
+        pd.testing.assert_frame_equal(compute_cached(RSI(), df), precomputed)
+
+    def test_lru_bound(self, monkeypatch):
+        monkeypatch.setattr(indicator_cache, "_column_cache", TTLCache(ttl=None, maxsize=2))
+        for ticker in ("A", "B", "C"):
+            compute_cached(RSI(), _fetched(ticker=ticker))
+        assert len(indicator_cache._column_cache) == 2
+        assert indicator_cache.cache_stats().evictions == 1
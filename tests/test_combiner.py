@@ -1,10 +1,23 @@
 """Tests for signal combination logic."""
 
+import numpy as np
 import pytest
 
-from indicators.registry import get_all_indicators
+from config.overrides import override_settings
+from indicators.pipeline import compute_indicators
+from indicators.registry import get_all_indicators, get_indicator
 from signals.base import CombinedSignal, SignalDirection
-from signals.combiner import _get_timescale, combine_signals
+from signals.combiner import (
+    _get_adjusted_weight,
+    _get_timescale,
+    clear_signal_cache,
+    combine_signals,
+    combine_signals_cached,
+    combine_signals_matrix,
+    combined_signal_at,
+    indicator_weights,
+    signal_matrices,
+)
 from tests.conftest import make_ohlcv
 
 
@@ -88,3 +101,99 @@ class TestCombineSignals:
         result = combine_signals(indicators, df, horizon_days=5)
         assert isinstance(result, CombinedSignal)
         assert len(result.individual_signals) == 1
+
+
+class TestCombineSignalsCached:
+    @pytest.fixture
+    def indicators(self):
+        return {name: get_indicator(name) for name in ["RSI", "MACD", "Stochastic"]}
+
+    @pytest.fixture
+    def computed(self, indicators):
+        clear_signal_cache()
+        df = make_ohlcv(200, trend="volatile", seed=5)
+        df.attrs = {"ticker": "TEST", "interval": "1d"}
+        yield compute_indicators(df, indicators)
+        clear_signal_cache()
+
+    def test_matches_and_is_shared(self, indicators, computed):
+        cached = combine_signals_cached(indicators, computed, horizon_days=5)
+        assert cached == combine_signals(indicators, computed, horizon_days=5, precomputed=True)
+        assert combine_signals_cached(indicators, computed.copy(), horizon_days=5) is cached
+        assert combine_signals_cached(indicators, computed, horizon_days=20) is not cached
+
+    def test_settings_overrides_get_their_own_entry(self, indicators, computed):
+        default = combine_signals_cached(indicators, computed)
+        with override_settings(RSI_OVERSOLD=45, RSI_OVERBOUGHT=55, AMBIGUITY_THRESHOLD=0.0):
+            overridden = combine_signals_cached(indicators, computed)
+            assert overridden == combine_signals(indicators, computed, precomputed=True)
+        assert overridden is not default
+        assert combine_signals_cached(indicators, computed) is default
+
+    def test_frames_without_ticker_not_cached(self, indicators, computed):
+        computed.attrs = {}
+        first = combine_signals_cached(indicators, computed)
+        assert combine_signals_cached(indicators, computed) is not first
+
+
+class TestCombineSignalsMatrix:
+    def test_weighted_vote_and_ambiguity(self):
+        # Bars: clear BUY, ambiguous split, HOLD-only, SELL outvotes BUY
+        directions = np.array([[1, 1], [1, -1], [0, 0], [1, -1]], dtype=np.int8)
+        confidences = np.array([[0.5, 0.3], [0.5, 0.5], [0.9, 0.9], [0.2, 0.6]])
+        combined = combine_signals_matrix(directions, confidences, np.array([1.0, 2.0]),
+                                          ambiguity_threshold=0.1)
+        assert [combined.direction_at(i) for i in range(4)] == [
+            SignalDirection.BUY, SignalDirection.SELL, SignalDirection.HOLD, SignalDirection.SELL]
+        np.testing.assert_allclose(combined.confidence, [1.0, 1 / 1.5, 0.0, 1.2 / 1.4])
+        assert combined.scores_at(2) == {"BUY": 0.0, "SELL": 0.0, "HOLD": 2.7}
+
+        ambiguous = combine_signals_matrix(directions, confidences, np.array([1.0, 1.0]),
+                                           ambiguity_threshold=0.1)
+        assert ambiguous.direction_at(1) == SignalDirection.HOLD
+        assert ambiguous.confidence[1] == 0.0
+
+    def test_no_indicators(self):
+        combined = combine_signals_matrix(np.zeros((3, 0), dtype=np.int8), np.zeros((3, 0)),
+                                          np.zeros(0))
+        assert len(combined) == 3
+        assert (combined.direction == 0).all() and (combined.confidence == 0).all()
+
+    def test_weights_match_per_indicator_lookup(self):
+        names = list(get_all_indicators())
+        for horizon in (1, 5, 20):
+            expected = [_get_adjusted_weight(name, horizon) for name in names]
+            assert indicator_weights(names, horizon).tolist() == expected
+
+    @pytest.mark.parametrize("horizon", [2, 5, 15])
+    def test_matches_combine_signals_on_every_bar(self, horizon):
+        indicators = get_all_indicators()
+        df = make_ohlcv(300, trend="volatile", seed=9)
+        for indicator in indicators.values():
+            df = indicator.compute(df)
+
+        directions, confidences = signal_matrices(indicators, df, precomputed=True)
+        combined = combine_signals_matrix(
+            directions, confidences, indicator_weights(list(indicators), horizon))
+
+        assert len(combined) == len(df)
+        for i in range(11, len(df)):
+            expected = combine_signals(indicators, df, horizon, idx=i, precomputed=True)
+            assert combined.direction_at(i) == expected.direction, f"bar {i}"
+            assert combined.confidence[i] == pytest.approx(expected.confidence, abs=1e-12)
+
+    def test_combined_signal_at_builds_reasoning_lazily(self):
+        indicators = get_all_indicators()
+        df = make_ohlcv(250, trend="up")
+        for indicator in indicators.values():
+            df = indicator.compute(df)
+
+        directions, confidences = signal_matrices(indicators, df, precomputed=True)
+        combined = combine_signals_matrix(directions, confidences,
+                                          indicator_weights(list(indicators), 5))
+        expected = combine_signals(indicators, df, 5, idx=200, precomputed=True)
+        result = combined_signal_at(combined, 200, indicators, df)
+        assert result.direction == expected.direction
+        assert result.reasoning == expected.reasoning
+        assert result.individual_signals == expected.individual_signals
+        assert result.scores == pytest.approx(expected.scores)
@@ -1,13 +1,23 @@
 """Tests for data fetcher utility functions.
 
-Note: fetch_ohlcv and other @st.cache_data functions are not tested here
-because they depend on Streamlit runtime. We test pure utility functions only.
+Note: network-backed fetches are not exercised here. The bulk-fetch tests
+replace yfinance with synthetic data.
 """
 
+import threading
+import time
+
 import pandas as pd
 import pytest
 
-from data.fetcher import compute_buy_and_hold, is_crypto_ticker
+from data import fetcher
+from data.fetcher import (
+    _split_download,
+    compute_buy_and_hold,
+    fetch_ohlcv_many,
+    is_crypto_ticker,
+)
+from tests.conftest import make_ohlcv
 
 
 class TestIsCryptoTicker:
@@ -60,3 +70,131 @@ class TestComputeBuyAndHold:
     def test_empty_dataframe(self):
         df = pd.DataFrame({"Close": []})
         assert compute_buy_and_hold(df) is None
+
+
+def _multi_download(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Build a grouped multi-ticker frame shaped like yf.download(group_by="ticker")."""
+    return pd.concat(frames, axis=1)
+
+
+class TestSplitDownload:
+    def test_splits_per_ticker(self):
+        a = make_ohlcv(30, seed=1)
+        b = make_ohlcv(30, seed=2)
+        frames = _split_download(_multi_download({"AAA": a, "BBB": b}), ["AAA", "BBB"], "1d")
+        assert set(frames) == {"AAA", "BBB"}
+        pd.testing.assert_frame_equal(frames["AAA"], a)
+        assert list(frames["BBB"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+    def test_drops_nan_rows_per_ticker(self):
+        a = make_ohlcv(30, seed=1)
+        b = make_ohlcv(30, seed=2)
+        b.iloc[:5] = float("nan")  # e.g. listed later than AAA
+        frames = _split_download(_multi_download({"AAA": a, "BBB": b}), ["AAA", "BBB"], "1d")
+        assert len(frames["AAA"]) == 30
+        assert len(frames["BBB"]) == 25
+
+    def test_invalid_and_missing_tickers_omitted(self):
+        a = make_ohlcv(30, seed=1)
+        empty = a.copy()
+        empty[:] = float("nan")
+        frames = _split_download(
+            _multi_download({"AAA": a, "BAD": empty}), ["AAA", "BAD", "GONE"], "1d"
+        )
+        assert set(frames) == {"AAA"}
+
+    def test_flat_columns_single_ticker(self):
+        a = make_ohlcv(30, seed=1)
+        frames = _split_download(a, ["AAA"], "1d")
+        pd.testing.assert_frame_equal(frames["AAA"], a)
+
+    def test_empty_download(self):
+        assert _split_download(pd.DataFrame(), ["AAA"], "1d") == {}
+
+    def test_restores_utc_for_daily_bars(self):
+        a = make_ohlcv(10, seed=1)
+        a.index = a.index.tz_localize("UTC").tz_convert("America/New_York")
+        frames = _split_download(_multi_download({"BTC-USD": a}), ["BTC-USD"], "1d")
+        idx = frames["BTC-USD"].index
+        assert str(idx.tz) == "UTC"
+        assert (idx == idx.normalize()).all()
+
+
+class TestFetchOhlcvMany:
+    def test_single_bulk_download_populates_cache(self, monkeypatch):
+        calls = []
+        source = {"AAA": make_ohlcv(30, seed=1), "BBB": make_ohlcv(30, seed=2)}
+
+        def _download(tickers, **kwargs):
+            calls.append(list(tickers))
+            return _multi_download({t: source[t] for t in tickers if t in source})
+
+        def _history_not_expected(*args, **kwargs):
+            raise AssertionError("single-ticker fetch should be a cache hit")
+
+        monkeypatch.setattr(fetcher.yf, "download", _download)
+        monkeypatch.setattr(fetcher.yf, "Ticker", _history_not_expected)
+        fetcher.clear_ohlcv_cache()
+
+        frames = fetch_ohlcv_many(["AAA", "BBB", "AAA"], period="bulktest")
+        assert calls == [["AAA", "BBB"]]
+        assert set(frames) == {"AAA", "BBB"}
+
+        # Later single fetches are served from the bulk result
+        single = fetcher.fetch_ohlcv("BBB", period="bulktest")
+        pd.testing.assert_frame_equal(single, source["BBB"])
+
+        # A second bulk call doesn't download again
+        fetch_ohlcv_many(["AAA", "BBB"], period="bulktest")
+        assert len(calls) == 1
+
+        fetcher.clear_ohlcv_cache()
+
+    def test_failed_tickers_omitted(self, monkeypatch):
+        monkeypatch.setattr(
+            fetcher.yf, "download",
+            lambda tickers, **kwargs: _multi_download({"AAA": make_ohlcv(30, seed=1)}),
+        )
+        fetcher.clear_ohlcv_cache()
+        frames = fetch_ohlcv_many(["AAA", "NOPE"], period="bulktest2")
+        assert set(frames) == {"AAA"}
+        fetcher.clear_ohlcv_cache()
+
+
+class TestFetchOhlcv:
+    def test_concurrent_fetches_share_one_download(self, monkeypatch):
+        calls = []
+        release = threading.Event()
+
+        class _Ticker:
+            def __init__(self, ticker):
+                pass
+
+            def history(self, **kwargs):
+                calls.append(kwargs)
+                release.wait(5)
+                return make_ohlcv(30, seed=1)
+
+        monkeypatch.setattr(fetcher.yf, "Ticker", _Ticker)
+        monkeypatch.setattr(fetcher, "OHLCV_STORE_ENABLED", False)
+        fetcher.clear_ohlcv_cache()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(fetcher.fetch_ohlcv("AAA", period="cotest")))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(df.attrs["ticker"] == "AAA" for df in results)
+        # Every caller gets its own copy
+        results[0].loc[results[0].index[0], "Close"] = -1.0
+        assert (fetcher.fetch_ohlcv("AAA", period="cotest")["Close"] > 0).all()
+        fetcher.clear_ohlcv_cache()
@@ -259,6 +259,72 @@ class TestBubbleRisk:
         assert isinstance(signal, SignalResult)
         assert signal.indicator_name == "Bubble Risk"
 
+    @staticmethod
+    def _scalar_hurst(prices, window=120):
+        """Reference: the per-bar loop BubbleRisk.compute used to run."""
+        import numpy as np
+        from indicators.structural import _hurst_exponent
+
+        out = np.full(len(prices), np.nan)
+        for i in range(window, len(prices)):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_ret = np.diff(np.log(prices[i - window : i + 1]))
+            log_ret = log_ret[np.isfinite(log_ret)]
+            out[i] = _hurst_exponent(log_ret, max_lag=min(20, max(3, len(log_ret) // 3)))
+        return out
+
+    @pytest.mark.parametrize("trend", ["flat", "up", "volatile"])
+    def test_rolling_hurst_matches_scalar(self, trend):
+        import numpy as np
+        from indicators.structural import BubbleRisk
+
+        df = make_ohlcv(300, trend=trend, seed=7)
+        result = BubbleRisk().compute(df)
+        expected = self._scalar_hurst(df["Close"].values)
+        np.testing.assert_allclose(result["Hurst"].values, expected, rtol=0, atol=1e-12)
+
+    def test_rolling_hurst_handles_bad_prices(self):
+        import numpy as np
+        from indicators.structural import BubbleRisk
+
+        df = make_ohlcv(300, trend="volatile", seed=3)
+        df.iloc[160, df.columns.get_loc("Close")] = np.nan
+        df.iloc[250, df.columns.get_loc("Close")] = 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = BubbleRisk().compute(df)
+        expected = self._scalar_hurst(df["Close"].values)
+        np.testing.assert_allclose(result["Hurst"].values, expected, rtol=0, atol=1e-12)
+
+    def test_rolling_hurst_short_series(self):
+        from indicators.structural import _rolling_hurst
+
+        assert len(_rolling_hurst(make_ohlcv(50)["Close"].pct_change().values[1:], 120)) == 0
+
+    @pytest.mark.parametrize("start_price", [1.0, 50_000.0])
+    def test_rolling_accel_matches_polyfit(self, start_price):
+        import numpy as np
+        from indicators.structural import BubbleRisk, _log_price_acceleration
+
+        df = make_ohlcv(300, start_price=start_price, trend="up", seed=11)
+        df.iloc[200, df.columns.get_loc("Close")] = np.nan
+        df.iloc[240, df.columns.get_loc("Close")] = 0.0
+        prices = df["Close"].values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = BubbleRisk().compute(df)
+            expected = np.full(len(prices), np.nan)
+            for i in range(BubbleRisk.HURST_WINDOW, len(prices)):
+                expected[i] = _log_price_acceleration(prices[i - 120 : i + 1], BubbleRisk.ACCEL_WINDOW)
+        np.testing.assert_allclose(result["LogAccel"].values, expected, rtol=0, atol=1e-15)
+
+    def test_rolling_accel_detects_curvature(self):
+        import numpy as np
+        from indicators.structural import _rolling_log_price_acceleration
+
+        x = np.arange(100, dtype=float)
+        accel = _rolling_log_price_acceleration(np.exp(0.001 * x ** 2), 60)
+        assert np.isnan(accel[:59]).all()
+        np.testing.assert_allclose(accel[59:], 0.001, rtol=1e-9)
+
 
 class TestVPIN:
     def test_compute_adds_columns(self, ohlcv_200_up):
@@ -292,6 +358,153 @@ class TestVPIN:
         assert isinstance(signal, SignalResult)
         assert signal.indicator_name == "VPIN"
 
+    def test_rolling_vpin_matches_window_sums(self):
+        import numpy as np
+        from indicators.microstructure import VPIN
+
+        df = make_ohlcv(300, trend="volatile", seed=4)
+        df.iloc[100:160, df.columns.get_loc("Volume")] = 0.0  # a full window with no volume
+        result = VPIN().compute(df)
+
+        volume = df["Volume"].values
+        imbalance = np.abs(2 * result["BuyVolPct"].values - 1) * volume
+        expected = np.full(len(df), np.nan)
+        for i in range(VPIN.BUCKET_COUNT - 1, len(df)):
+            total = volume[i - VPIN.BUCKET_COUNT + 1 : i + 1].sum()
+            if total > 0:
+                expected[i] = imbalance[i - VPIN.BUCKET_COUNT + 1 : i + 1].sum() / total
+        np.testing.assert_allclose(result["VPIN"].values, expected, rtol=1e-12, atol=1e-12)
+
+    def test_zscore_column_matches_history(self):
+        from indicators.microstructure import VPIN
+
+        result = VPIN().compute(make_ohlcv(300, trend="volatile", seed=4))
+        assert "VPIN_z" in result.columns
+        for i in (60, 120, 299):
+            history = result["VPIN"].iloc[max(0, i - 50) : i + 1].dropna()
+            expected = (result["VPIN"].iloc[i] - history.mean()) / history.std() if len(history) > 5 else 0.0
+            assert result["VPIN_z"].iloc[i] == pytest.approx(expected, abs=1e-9)
+        # Too little history → neutral z-score rather than NaN
+        assert result["VPIN_z"].iloc[VPIN.BUCKET_COUNT - 1] == 0.0
+        assert result["VPIN_z"].iloc[: VPIN.BUCKET_COUNT - 1].isna().all()
+
+    def test_signal_uses_precomputed_zscore(self):
+        from indicators.microstructure import VPIN
+
+        vpin = VPIN()
+        result = vpin.compute(make_ohlcv(300, trend="volatile", seed=4))
+        result.iloc[-1, result.columns.get_loc("VPIN_z")] = 2.5
+        signal = vpin.get_signal(result)
+        assert signal.direction == SignalDirection.SELL
+        assert "+2.5σ" in signal.detail
+
+
+def _intraday_ohlcv(days: int = 6, bars_per_day: int = 78, seed: int = 5) -> pd.DataFrame:
+    """Synthetic 5-minute bars for consecutive sessions."""
+    df = make_ohlcv(days * bars_per_day, trend="volatile", seed=seed)
+    sessions = pd.bdate_range("2024-03-04", periods=days, tz="America/New_York")
+    offsets = pd.to_timedelta(570 + 5 * pd.RangeIndex(bars_per_day), unit="min")
+    df.index = pd.DatetimeIndex([day + off for day in sessions for off in offsets])
+    return df
+
+
+class TestVolumeClockVPIN:
+    def test_bucket_accounting_matches_cumulative_volume(self):
+        import numpy as np
+        from indicators.microstructure import _buy_fraction, volume_clock_vpin
+
+        df = _intraday_ohlcv()
+        bucket, n_buckets = 250_000.0, 20
+        result = volume_clock_vpin(df, bucket_volume=bucket, n_buckets=n_buckets)
+
+        # Reference: bucket k spans cumulative volume [k*V, (k+1)*V); its net
+        # flow comes from interpolating cumulative net flow at the boundaries
+        volume = df["Volume"].values
+        net = volume * (2 * _buy_fraction(df) - 1)
+        cum_vol = np.concatenate([[0.0], np.cumsum(volume)])
+        cum_net = np.concatenate([[0.0], np.cumsum(net)])
+        edges = np.arange(0, cum_vol[-1] + 1, bucket)
+        imbalance = np.abs(np.diff(np.interp(edges, cum_vol, cum_net)))
+        for i in (100, 250, len(df) - 1):
+            completed = int(cum_vol[i + 1] // bucket)
+            expected = imbalance[completed - n_buckets : completed].sum() / (n_buckets * bucket)
+            assert result.iloc[i] == pytest.approx(expected, rel=1e-9)
+
+    def test_ring_buffer_is_bounded(self):
+        from indicators.microstructure import VolumeBucketVPIN
+
+        acc = VolumeBucketVPIN(bucket_volume=100.0, n_buckets=10)
+        for _ in range(1_000):
+            acc.add_bar(350.0, 0.8)
+        assert acc.buckets_completed == 3_500
+        assert len(acc._imbalances) == 10
+        assert acc.vpin == pytest.approx(0.6)
+
+    def test_one_sided_and_balanced_flow(self):
+        import math
+        from indicators.microstructure import VolumeBucketVPIN
+
+        acc = VolumeBucketVPIN(bucket_volume=10.0, n_buckets=5)
+        assert math.isnan(acc.add_bar(45.0, 1.0))  # only 4 buckets completed
+        assert acc.add_bar(5.0, 1.0) == pytest.approx(1.0)
+        for _ in range(5):
+            acc.add_bar(10.0, 0.5)
+        assert acc.vpin == pytest.approx(0.0)
+
+    def test_skips_bars_without_volume(self):
+        from indicators.microstructure import VolumeBucketVPIN
+
+        acc = VolumeBucketVPIN(bucket_volume=10.0, n_buckets=2)
+        acc.add_bar(float("nan"), 0.9)
+        acc.add_bar(0.0, 0.9)
+        assert acc.buckets_completed == 0
+
+    def test_volume_mode_on_intraday_frame(self, monkeypatch):
+        from config import settings
+        from indicators.microstructure import VPIN, volume_clock_vpin
+
+        monkeypatch.setattr(settings, "VPIN_MODE", "volume")
+        df = _intraday_ohlcv()
+        result = VPIN().compute(df)
+        expected = volume_clock_vpin(df, n_buckets=VPIN.BUCKET_COUNT,
+                                     buckets_per_day=settings.VPIN_BUCKETS_PER_DAY)
+        pd.testing.assert_series_equal(result["VPIN"], expected, check_names=False)
+        assert result["VPIN"].notna().sum() > 0
+
+    def test_volume_mode_maps_onto_daily_index(self, monkeypatch):
+        from config import settings
+        from indicators import microstructure
+        from indicators.microstructure import VPIN
+
+        intraday = _intraday_ohlcv(days=6)
+        monkeypatch.setattr(settings, "VPIN_MODE", "volume")
+        monkeypatch.setattr(microstructure, "_fetch_intraday", lambda ticker: intraday)
+
+        daily = make_ohlcv(100)
+        daily.index = pd.bdate_range(end="2024-03-11", periods=100, tz="America/New_York")
+        daily.attrs["ticker"] = "TEST"
+        result = VPIN().compute(daily)
+
+        covered = result["VPIN"].dropna()
+        assert covered.index.min() >= pd.Timestamp("2024-03-04", tz="America/New_York")
+        per_bar = microstructure.volume_clock_vpin(intraday, buckets_per_day=settings.VPIN_BUCKETS_PER_DAY)
+        last_of_day = per_bar[per_bar.index.normalize() == pd.Timestamp("2024-03-08", tz="America/New_York")].iloc[-1]
+        assert result["VPIN"].loc["2024-03-08"] == pytest.approx(last_of_day)
+        assert isinstance(VPIN().get_signal(result), SignalResult)
+
+    def test_volume_mode_falls_back_without_intraday(self, monkeypatch):
+        from config import settings
+        from indicators import microstructure
+        from indicators.microstructure import VPIN
+
+        daily = make_ohlcv(200, trend="volatile")
+        time_mode = VPIN().compute(daily)
+
+        monkeypatch.setattr(settings, "VPIN_MODE", "volume")
+        monkeypatch.setattr(microstructure, "_fetch_intraday", lambda ticker: None)
+        daily.attrs["ticker"] = "TEST"
+        pd.testing.assert_frame_equal(VPIN().compute(daily), time_mode)
+
 
 class TestMarketCorrelation:
     def test_compute_adds_columns(self, ohlcv_200_up):
@@ -308,3 +521,181 @@ class TestMarketCorrelation:
         signal = mc.get_signal(result)
         assert isinstance(signal, SignalResult)
         assert signal.indicator_name == "Market Correlation"
+
+    @staticmethod
+    def _sector_returns(n=300, k=11, seed=0):
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        market = rng.normal(size=(n, 1)) * 0.01
+        returns = market * rng.uniform(0.3, 1.2, size=k) + rng.normal(size=(n, k)) * 0.008
+        returns[0, :] = np.nan
+        returns[:40, 9] = np.nan  # late listing
+        returns[120, 3] = np.nan  # single gap
+        returns[180:250, 2] = 0.0  # stale prices
+        return returns
+
+    def test_rolling_absorption_matches_per_window(self):
+        import numpy as np
+        from indicators.systemic import _rolling_absorption
+
+        returns = self._sector_returns()
+        frame = pd.DataFrame(returns)
+        expected_ar = np.full(len(frame), np.nan)
+        expected_top = np.full(len(frame), np.nan)
+        for i in range(60, len(frame)):
+            window = frame.iloc[i - 60 : i].dropna(axis=1, how="any")
+            corr = window.corr().values
+            if window.shape[1] < 3 or np.isnan(corr).any():
+                continue
+            eigenvalues = np.linalg.eigvalsh(corr)
+            expected_ar[i] = eigenvalues[-1] / eigenvalues.sum()
+            expected_top[i] = eigenvalues[-1]
+
+        absorption, top = _rolling_absorption(returns, 60)
+        np.testing.assert_allclose(absorption, expected_ar, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(top, expected_top, rtol=0, atol=1e-11)
+        assert np.isnan(absorption[245])  # constant column over the window → skipped
+
+    def test_absorption_cached_per_calendar(self, monkeypatch):
+        import numpy as np
+        from indicators import systemic
+        from indicators.systemic import SECTOR_ETFS, MarketCorrelation
+
+        index = pd.bdate_range("2024-01-02", periods=300)
+        returns = self._sector_returns()
+        closes = {
+            etf: pd.Series(100 * np.cumprod(1 + np.nan_to_num(returns[:, j])), index=index)
+            for j, etf in enumerate(SECTOR_ETFS)
+        }
+        monkeypatch.setattr(systemic, "prefetch_reference_closes", lambda *a, **kw: None)
+        monkeypatch.setattr(systemic, "fetch_reference_close", lambda etf, period="2y": closes[etf])
+        calls = []
+        real = systemic._rolling_absorption
+        monkeypatch.setattr(systemic, "_rolling_absorption",
+                            lambda r, w: calls.append(w) or real(r, w))
+        systemic.clear_absorption_cache()
+
+        a = make_ohlcv(300, seed=1)
+        b = make_ohlcv(300, seed=2)
+        b.index = b.index.tz_localize("America/New_York")
+        mc = MarketCorrelation()
+        result_a = mc.compute(a)
+        result_b = mc.compute(b)
+
+        assert calls == [60]
+        np.testing.assert_array_equal(result_a["AbsorptionRatio"].values,
+                                      result_b["AbsorptionRatio"].values)
+        assert result_a["AbsorptionRatio"].notna().sum() > 100
+
+        # Refreshed reference data invalidates the cached series
+        closes["XLF"] = closes["XLF"] * 1.0
+        mc.compute(a)
+        assert calls == [60, 60]
+        systemic.clear_absorption_cache()
+
+
+# --- Vectorized signal series ---
+
+
+def _reference_frame(n: int = 300, seed: int = 3) -> pd.DataFrame:
+    """OHLCV plus synthetic cross-asset columns spanning every signal regime."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    df = make_ohlcv(n, trend="volatile", seed=seed)
+    vix3m = 18 + rng.normal(size=n).cumsum() * 0.3
+    vix = vix3m * np.clip(rng.normal(0.95, 0.12, size=n), 0.6, 1.4)
+    vix[:5] = np.nan
+    vix3m[50] = 0.0
+    df["VIX"] = vix
+    df["VIX3M"] = vix3m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df["VIX_ratio"] = vix / vix3m
+    absorption = 0.42 + np.sin(np.arange(n) / 15) * 0.2 + rng.normal(size=n) * 0.02
+    absorption[:60] = np.nan
+    absorption[150] = np.nan
+    df["AbsorptionRatio"] = absorption
+    return df
+
+
+class TestSignalSeries:
+    """get_signal_series() must reproduce get_signal() on every bar."""
+
+    @pytest.fixture(autouse=True)
+    def _synthetic_copper_gold(self, monkeypatch):
+        import numpy as np
+        from indicators import macro
+
+        index = pd.bdate_range("2022-01-03", periods=600)
+        rng = np.random.default_rng(11)
+        closes = {
+            "HG=F": pd.Series(4 * np.exp(rng.normal(0, 0.02, 600).cumsum()), index=index),
+            "GC=F": pd.Series(1900 * np.exp(rng.normal(0, 0.01, 600).cumsum()), index=index),
+        }
+        monkeypatch.setattr(macro, "fetch_reference_close", lambda ticker, period="2y": closes[ticker])
+
+    @staticmethod
+    def _assert_parity(indicator, df, start=11):
+        import numpy as np
+
+        series = indicator.get_signal_series(df)
+        assert len(series) == len(df)
+        assert series.indicator_name == indicator.name
+        for i in range(start, len(df)):
+            expected = indicator.get_signal(df, idx=i)
+            assert series.direction_at(i) == expected.direction, f"bar {i}"
+            assert np.isclose(series.confidence[i], expected.confidence, rtol=0, atol=1e-12), f"bar {i}"
+
+    @pytest.mark.parametrize("name", [
+        "RSI", "Stochastic", "SMA Crossover", "EMA Crossover", "MACD", "ADX",
+        "Bollinger Bands", "VWAP", "OBV", "Copper-Gold Ratio", "Bubble Risk", "VPIN",
+    ])
+    @pytest.mark.parametrize("trend", ["up", "down", "volatile"])
+    def test_matches_get_signal(self, name, trend):
+        indicator = get_all_indicators()[name]
+        df = indicator.compute(make_ohlcv(300, trend=trend, seed=7))
+        self._assert_parity(indicator, df)
+
+    @pytest.mark.parametrize("name", ["VIX Term Structure", "Market Correlation"])
+    def test_matches_get_signal_on_reference_columns(self, name):
+        indicator = get_all_indicators()[name]
+        df = _reference_frame()
+        series = indicator.get_signal_series(df)
+        assert {series.direction_at(i) for i in range(len(df))} >= {
+            SignalDirection.BUY, SignalDirection.SELL, SignalDirection.HOLD}
+        self._assert_parity(indicator, df)
+
+    def test_default_falls_back_to_get_signal(self):
+        from indicators.base import BaseIndicator
+
+        class Alternating(BaseIndicator):
+            name = "Alternating"
+            category = "trend"
+            lookback = 1
+
+            def compute(self, df):
+                return df
+
+            def get_signal(self, df, idx=-1):
+                direction = SignalDirection.BUY if idx % 2 else SignalDirection.SELL
+                return SignalResult(self.name, direction, 0.5, "")
+
+            def get_chart_config(self):
+                return {"overlay": True, "columns": [], "colors": {}}
+
+        series = Alternating().get_signal_series(make_ohlcv(6))
+        assert [series.direction_at(i) for i in range(6)] == [SignalDirection.SELL, SignalDirection.BUY] * 3
+        assert series.confidence.tolist() == [0.5] * 6
+
+    def test_obv_signal_ignores_later_bars(self):
+        from indicators.volume import OBV
+
+        obv = OBV()
+        df = obv.compute(make_ohlcv(120, trend="volatile", seed=4))
+        before = obv.get_signal(df, idx=60)
+        spiked = df.copy()
+        spiked.iloc[62:, spiked.columns.get_loc("OBV")] += 1e12
+        after = obv.get_signal(spiked, idx=60)
+        assert after.direction == before.direction
+        assert after.confidence == before.confidence
@@ -0,0 +1,137 @@
+"""Tests for the live intraday poller (no network: bars come from a fake feed)."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from data import live
+from data.live import LivePoller, get_poller
+from indicators.pipeline import compute_indicators
+from indicators.registry import get_indicator
+from tests.conftest import make_ohlcv
+
+INDICATORS = {name: get_indicator(name) for name in ["RSI", "MACD", "Bollinger Bands", "ADX"]}
+
+
+class FakeFeed:
+    """Serves a 1-minute frame up to a movable clock; the last bar is still forming."""
+
+    def __init__(self, n_bars=400):
+        df = make_ohlcv(n_bars, trend="volatile", seed=3)
+        df.index = pd.date_range("2026-01-05 14:30", periods=n_bars, freq="1min", tz="UTC")
+        df.attrs = {"ticker": "TEST", "interval": "1m"}
+        self.df = df
+        self.visible = 300  # bars published so far, the last one still forming
+        self.calls = []
+        self.error = None
+
+    def now(self) -> pd.Timestamp:
+        return self.df.index[self.visible - 1] + pd.Timedelta(seconds=30)
+
+    def fetch(self, ticker, period, interval):
+        self.calls.append(period)
+        if self.error:
+            raise ValueError(self.error)
+        return self.df.iloc[: self.visible].copy()
+
+
+@pytest.fixture
+def feed():
+    return FakeFeed()
+
+
+def _poller(feed):
+    return LivePoller("TEST", "1m", fetch=feed.fetch, now=feed.now)
+
+
+class TestLivePoller:
+    def test_streams_closed_bars_like_a_full_recompute(self, feed):
+        poller = _poller(feed)
+        poller.poll()
+        assert poller.snapshot(INDICATORS).last_bar == feed.df.index[298]  # 299 is still forming
+
+        for _ in range(5):
+            feed.visible += 7
+            assert poller.poll() == 7
+        snapshot = poller.snapshot(INDICATORS)
+        closed = feed.df.iloc[: feed.visible - 1]
+        assert snapshot.last_bar == closed.index[-1]
+        expected = compute_indicators(closed, INDICATORS).tail(len(snapshot.frame))
+        # ADX recomputes over a fixed-length window of recent bars, so its
+        # smoothing forgets bars the full recompute still sees (~1e-9)
+        pd.testing.assert_frame_equal(
+            snapshot.frame[expected.columns], expected, check_freq=False, check_names=False,
+            check_dtype=False, rtol=1e-7,
+        )
+
+    def test_first_poll_loads_history_then_polls_recent_bars(self, feed):
+        poller = _poller(feed)
+        poller.poll()
+        assert poller.poll() == 0
+        assert feed.calls == [live.LIVE_HISTORY_PERIOD["1m"], live.LIVE_POLL_PERIOD]
+
+    def test_failed_poll_keeps_previous_bars(self, feed):
+        poller = _poller(feed)
+        poller.poll()
+        before = poller.snapshot(INDICATORS)
+        feed.error = "network down"
+        assert poller.poll() == 0
+        failed = poller.snapshot(INDICATORS)
+        assert failed.error == "network down"
+        pd.testing.assert_frame_equal(failed.frame, before.frame)
+
+        feed.error = None
+        feed.visible += 1
+        assert poller.poll() == 1
+        assert poller.snapshot(INDICATORS).error is None
+
+    def test_failed_first_load(self, feed):
+        feed.error = "no data"
+        poller = _poller(feed)
+        poller.poll()
+        assert poller.ready.is_set()
+        snapshot = poller.snapshot(INDICATORS)
+        assert snapshot.frame is None and snapshot.error == "no data"
+
+    def test_first_load_with_only_a_forming_bar(self, feed):
+        feed.visible = 1
+        poller = _poller(feed)
+        assert poller.poll() == 0
+        assert poller.snapshot(INDICATORS).frame is None
+        feed.visible = 300
+        assert poller.poll() == 0  # reloads history rather than failing
+        snapshot = poller.snapshot(INDICATORS)
+        assert snapshot.error is None
+        assert snapshot.last_bar == feed.df.index[298]
+        assert feed.calls == [live.LIVE_HISTORY_PERIOD["1m"]] * 2
+
+    def test_rejects_unsupported_interval(self):
+        with pytest.raises(ValueError, match="Live mode"):
+            LivePoller("TEST", "1d")
+
+
+class TestSharedPollers:
+    @pytest.fixture(autouse=True)
+    def fake_download(self, feed, monkeypatch):
+        monkeypatch.setattr(live, "download_ohlcv", feed.fetch)
+        yield
+        live.stop_all_pollers()
+
+    def test_one_poller_per_ticker_and_interval(self, feed):
+        poller = get_poller("TEST", "1m")
+        assert get_poller("TEST", "1m") is poller
+        assert get_poller("TEST", "5m") is not poller
+        assert poller.ready.wait(5)
+        assert feed.calls.count(live.LIVE_HISTORY_PERIOD["1m"]) == 1
+
+    def test_idle_poller_retires(self, monkeypatch):
+        monkeypatch.setattr(live, "LIVE_IDLE_SECONDS", 0)
+        monkeypatch.setitem(live.LIVE_INTERVALS, "1m", 0.01)
+        poller = get_poller("TEST", "1m")
+        deadline = time.monotonic() + 5
+        while poller.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not poller.running
+        assert poller not in live.active_pollers()
+        assert get_poller("TEST", "1m") is not poller
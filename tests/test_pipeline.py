@@ -0,0 +1,209 @@
+"""Tests for the indicator pipeline and shared features."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import registry
+from indicators.base import BaseIndicator
+from indicators.features import Feature, FeatureStore, ema, log_price, log_return, sma
+from indicators.momentum import RSI
+from indicators.pipeline import IndicatorPipeline
+from indicators.registry import feature_graph, get_all_indicators
+from indicators.trend import MACD, EMACrossover, SMACrossover
+from indicators.volatility import BollingerBands
+from signals.base import SignalDirection, SignalResult
+from tests.conftest import make_ohlcv
+
+
+class RangeOnly(BaseIndicator):
+    """Third-party style indicator that only implements compute()."""
+
+    name = "Range"
+    category = "volatility"
+    lookback = 1
+
+    def compute(self, df):
+        df = df.copy()
+        df["Range"] = df["High"] - df["Low"]
+        return df
+
+    def get_signal(self, df, idx=-1):
+        return SignalResult(self.name, SignalDirection.HOLD, 0.0, "")
+
+    def get_chart_config(self):
+        return {"overlay": False, "columns": ["Range"], "colors": {}}
+
+
+@pytest.fixture(scope="module")
+def df():
+    return make_ohlcv(400, trend="volatile", seed=2)
+
+
+def _chained(df, indicators):
+    computed = df.copy()
+    for indicator in indicators:
+        computed = indicator.compute(computed)
+    return computed
+
+
+class TestIndicatorPipeline:
+    def test_matches_chained_compute(self, df):
+        indicators = [i for i in get_all_indicators().values() if not i.reference_tickers]
+        indicators.append(RangeOnly())
+        pd.testing.assert_frame_equal(IndicatorPipeline(indicators).run(df),
+                                      _chained(df, indicators))
+
+    def test_input_untouched(self, df):
+        before = df.copy()
+        IndicatorPipeline({"RSI": RSI(), "MACD": MACD()}).run(df)
+        pd.testing.assert_frame_equal(df, before)
+
+    def test_indicators_get_read_only_prices(self, df):
+        seen = []
+
+        class Probe(RangeOnly):
+            def compute_columns(self, prices):
+                seen.append(prices["Close"].to_numpy())
+                return {"Probe": 1.0}
+
+        result = IndicatorPipeline([Probe()]).run(df)
+        assert not seen[0].flags.writeable
+        assert np.shares_memory(seen[0], df["Close"].to_numpy())
+        assert (result["Probe"] == 1.0).all()  # scalars broadcast
+
+    def test_indicators_cannot_write_prices(self, df):
+        class Vandal(RangeOnly):
+            def compute_columns(self, prices):
+                prices["Close"].to_numpy()[0] = 0.0
+                return {}
+
+        before = df.copy()
+        with pytest.raises(ValueError, match="read-only"):
+            IndicatorPipeline([Vandal(), RSI()]).run(df)
+        pd.testing.assert_frame_equal(df, before)
+
+    def test_existing_columns_replaced(self, df):
+        computed = RSI().compute(df)
+        computed["RSI"] = 0.0
+        result = IndicatorPipeline([RSI()]).run(computed)
+        assert list(result.columns).count("RSI") == 1
+        pd.testing.assert_series_equal(result["RSI"], RSI().compute(df)["RSI"])
+
+    def test_keeps_attrs(self, df):
+        tagged = df.copy()
+        tagged.attrs["currency"] = "EUR"
+        assert IndicatorPipeline([RSI()]).run(tagged).attrs["currency"] == "EUR"
+
+    def test_indicator_without_compute_rejected(self, df):
+        class Bare(RangeOnly):
+            compute = BaseIndicator.compute
+
+        with pytest.raises(NotImplementedError, match="compute_columns"):
+            IndicatorPipeline([Bare()]).run(df)
+
+    def test_threads_match_sequential(self, df):
+        indicators = [i for i in get_all_indicators().values() if not i.reference_tickers]
+        pd.testing.assert_frame_equal(IndicatorPipeline(indicators, threads=4).run(df),
+                                      IndicatorPipeline(indicators, threads=0).run(df))
+
+
+def _counting_features(monkeypatch) -> list[Feature]:
+    """Record every feature computation."""
+    computed = []
+    for kind, fn in list(registry._feature_kinds.items()):
+        def counting(store, feature, fn=fn):
+            computed.append(feature)
+            return fn(store, feature)
+        monkeypatch.setitem(registry._feature_kinds, kind, counting)
+    return computed
+
+
+class TestFeatures:
+    def test_graph_in_dependency_order(self):
+        graph = feature_graph([MACD(), EMACrossover(), SMACrossover(), BollingerBands(),
+                               get_all_indicators()["Bubble Risk"]])
+        assert ema(12) in graph and sma(20) in graph
+        assert list(graph).count(ema(12)) == 1
+        keys = list(graph)
+        assert keys.index(log_price()) < keys.index(log_return())
+        assert graph[log_return()] == (log_price(),)
+
+    def test_unknown_kind_rejected(self):
+        class Odd(RangeOnly):
+            features = (Feature("no-such-kind"),)
+
+        with pytest.raises(KeyError, match="no-such-kind"):
+            IndicatorPipeline([Odd()])
+
+    @pytest.mark.parametrize("threads", [0, 4])
+    def test_shared_features_computed_once(self, df, monkeypatch, threads):
+        computed = _counting_features(monkeypatch)
+        IndicatorPipeline([EMACrossover(), MACD(), SMACrossover(), BollingerBands()],
+                          threads=threads).run(df)
+        assert sorted(computed, key=repr) == sorted(
+            [ema(12), ema(26), sma(20), sma(50), Feature("std", "Close", 20)], key=repr
+        )
+
+    def test_threads_compute_feature_graph_up_front(self, df, monkeypatch):
+        computed = _counting_features(monkeypatch)
+        threads = set()
+        count = registry._feature_kinds["sma"]
+
+        def recording(store, feature):
+            threads.add(threading.current_thread())
+            return count(store, feature)
+
+        monkeypatch.setitem(registry._feature_kinds, "sma", recording)
+
+        class Declares(RangeOnly):
+            # Declared but never read: only the graph walk computes them
+            features = (sma(7), log_return())
+
+            def compute_columns(self, prices, features=None):
+                return {"Declares": 0.0}
+
+        IndicatorPipeline([Declares(), RSI()], threads=4).run(df)
+        assert set(computed) == {sma(7), log_price(), log_return()}
+        assert computed.index(log_price()) < computed.index(log_return())
+        assert threading.main_thread() not in threads
+
+    def test_threads_skip_features_of_cached_columns(self, df, monkeypatch):
+        tagged = df.copy()
+        tagged.attrs = {"ticker": "FEATURES", "interval": "1d"}
+        indicators = [EMACrossover(), MACD()]
+        IndicatorPipeline(indicators, threads=4).run(tagged)
+        computed = _counting_features(monkeypatch)
+        IndicatorPipeline(indicators, threads=4).run(tagged)
+        assert computed == []
+
+    def test_store_waits_for_concurrent_computation(self, df, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow(store, feature):
+            calls.append(feature)
+            started.set()
+            release.wait(5)
+            return store.prices["Close"] * 2
+
+        monkeypatch.setitem(registry._feature_kinds, "slow", slow)
+        store = FeatureStore(df)
+        results = []
+        first = threading.Thread(target=lambda: results.append(store[Feature("slow")]))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=lambda: results.append(store[Feature("slow")]))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+        assert len(calls) == 1
+        assert len(results) == 2 and results[0] is results[1]
+
+    def test_standalone_compute_builds_own_store(self, df):
+        direct = MACD().compute_columns(df)
+        shared = MACD().compute_columns(df, FeatureStore(df))
+        pd.testing.assert_series_equal(direct["MACD_hist"], shared["MACD_hist"])
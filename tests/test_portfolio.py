@@ -0,0 +1,133 @@
+"""Tests for multi-ticker portfolio backtests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting import portfolio
+from backtesting.engine import run_backtest
+from backtesting.portfolio import run_portfolio_backtest, run_watchlist_backtest
+from backtesting.report import PortfolioReport, Trade
+from data import watchlists
+from indicators.momentum import RSI, Stochastic
+from indicators.trend import MACD, SMACrossover
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def indicators():
+    return {"RSI": RSI(), "Stochastic": Stochastic(), "MACD": MACD(),
+            "SMA Crossover": SMACrossover()}
+
+
+def _frames(n_tickers=6, n_bars=400):
+    frames = {}
+    for i in range(n_tickers):
+        df = make_ohlcv(n_bars, trend=("up", "down", "volatile")[i % 3], seed=i,
+                        start_price=20 + 10 * i)
+        frames[f"T{i}"] = df
+    return frames
+
+
+class TestRunPortfolioBacktest:
+    def test_single_ticker_single_slot_matches_engine(self, indicators):
+        df = make_ohlcv(400, trend="volatile", seed=3)
+        single = run_backtest(df, indicators, ticker="T", period="2y", engine="array")
+        result = run_portfolio_backtest({"T": df}, indicators, period="2y",
+                                        max_positions=1, workers=0)
+
+        np.testing.assert_array_equal(result.trade_arrays.entry_idx, single.trade_arrays.entry_idx)
+        np.testing.assert_allclose(result.trade_arrays.pnl_pct, single.trade_arrays.pnl_pct,
+                                   rtol=0, atol=1e-15)
+        assert result.win_rate == single.win_rate
+        # Marked-to-market equity equals the compounded equity at every exit
+        exits = single.equity_curve.index[1:]
+        np.testing.assert_allclose(result.equity_curve.loc[exits].to_numpy(),
+                                   single.equity_curve.iloc[1:].to_numpy(), rtol=1e-12)
+
+    def test_position_limit_and_cash(self, indicators):
+        result = run_portfolio_backtest(_frames(), indicators, max_positions=3, workers=0)
+        assert isinstance(result, PortfolioReport)
+        assert result.total_trades > 0
+        arrays = result.trade_arrays
+        for t in range(len(result.equity_curve)):
+            pos = result.equity_curve.index[t]
+            open_positions = ((arrays.entry_dates <= pos) & (arrays.exit_dates > pos)).sum()
+            assert open_positions <= 3
+        assert (result.exposure <= 1 + 1e-12).all() and (result.exposure >= 0).all()
+
+    def test_per_ticker_trades_never_overlap(self, indicators):
+        result = run_portfolio_backtest(_frames(), indicators, max_positions=4, workers=0)
+        arrays = result.trade_arrays
+        for ticker in set(arrays.ticker):
+            mask = arrays.ticker == ticker
+            assert (arrays.exit_idx[mask][:-1] <= arrays.entry_idx[mask][1:]).all()
+        assert result.per_ticker["trades"].sum() == result.total_trades
+        trade = result.trades[0]
+        assert isinstance(trade, Trade) and trade.ticker in result.tickers
+
+    def test_mixed_calendars_and_timezones(self, indicators):
+        stock = make_ohlcv(400, seed=1)
+        stock.index = stock.index.tz_localize("America/New_York")
+        crypto = make_ohlcv(560, seed=2)
+        crypto.index = pd.date_range(stock.index[0].tz_localize(None), periods=560,
+                                     freq="D", tz="UTC")
+        result = run_portfolio_backtest({"AAA": stock, "BTC-USD": crypto}, indicators,
+                                        max_positions=2, workers=0)
+        assert result.equity_curve.index.tz is None
+        assert result.equity_curve.index.is_monotonic_increasing
+        assert {"AAA", "BTC-USD"} <= set(result.trade_arrays.ticker)
+        assert not result.is_crypto
+
+    def test_horizon_counts_each_tickers_own_bars(self, indicators):
+        stock = make_ohlcv(400, seed=1)
+        stock.index = pd.bdate_range("2024-01-01", periods=400)  # 5-day weeks
+        crypto = make_ohlcv(560, seed=2)
+        crypto.index = pd.date_range("2024-01-01", periods=560, freq="D")  # 7-day weeks
+        result = run_portfolio_backtest({"AAA": stock, "BTC-USD": crypto}, indicators,
+                                        horizon_days=5, max_positions=2, workers=0)
+        arrays = result.trade_arrays
+        for ticker, df in (("AAA", stock), ("BTC-USD", crypto)):
+            mask = arrays.ticker == ticker
+            assert mask.any()
+            held = (df.index.get_indexer(arrays.exit_dates[mask])
+                    - df.index.get_indexer(arrays.entry_dates[mask]))
+            assert (held == 5).all()
+        # Stock trades span weekends, so some last longer on the calendar
+        stock_days = (arrays.exit_dates - arrays.entry_dates)[arrays.ticker == "AAA"]
+        assert (stock_days > pd.Timedelta(days=5)).any()
+
+    def test_short_history_skipped(self, indicators):
+        frames = {"OK": make_ohlcv(400), "NEW": make_ohlcv(30)}
+        result = run_portfolio_backtest(frames, indicators, workers=0)
+        assert result.tickers == ["OK"]
+        assert "NEW" in result.skipped
+
+    def test_process_pool_matches_inline(self, indicators):
+        frames = _frames(4, 300)
+        inline = run_portfolio_backtest(frames, indicators, max_positions=2, workers=0)
+        pooled = run_portfolio_backtest(frames, indicators, max_positions=2, workers=2)
+        pd.testing.assert_series_equal(pooled.equity_curve, inline.equity_curve)
+
+
+class TestRunWatchlistBacktest:
+    def test_resolves_preset_and_reports_failures(self, indicators, monkeypatch):
+        monkeypatch.setattr(watchlists, "load_watchlists", lambda: {})
+        monkeypatch.setattr(watchlists, "WATCHLIST_PRESETS", {"Mine": ["AAA", "BAD", "BBB"]})
+        monkeypatch.setattr(portfolio, "fetch_ohlcv_many", lambda tickers, **kw: {})
+
+        def fake_fetch(ticker, period="1y", interval="1d"):
+            if ticker == "BAD":
+                raise ValueError("No data returned for 'BAD'.")
+            return make_ohlcv(300, seed=len(ticker) + ord(ticker[0]))
+
+        monkeypatch.setattr(portfolio, "fetch_ohlcv", fake_fetch)
+        result = run_watchlist_backtest("Mine", indicators, period="1y", workers=0)
+        assert result.ticker == "Mine"
+        assert result.tickers == ["AAA", "BBB"]
+        assert "No data returned" in result.skipped["BAD"]
+
+    def test_unknown_watchlist(self, indicators, monkeypatch):
+        monkeypatch.setattr(watchlists, "load_watchlists", lambda: {})
+        with pytest.raises(ValueError, match="Unknown watchlist"):
+            run_watchlist_backtest("Nope", indicators, period="1y")
@@ -0,0 +1,68 @@
+"""Tests for the concurrent watchlist scan engine."""
+
+import pytest
+
+from indicators.momentum import RSI
+from indicators.trend import SMACrossover
+from signals import scanner
+from signals.base import CombinedSignal
+from signals.scanner import ScanResult, scan_tickers
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    """Serve synthetic data instead of hitting Yahoo Finance."""
+    calls = []
+
+    def _fetch_ohlcv(ticker, period="6mo", interval="1d"):
+        calls.append(ticker)
+        if ticker.startswith("BAD"):
+            raise ValueError(f"No data returned for '{ticker}'.")
+        return make_ohlcv(150, trend="up", seed=len(ticker))
+
+    monkeypatch.setattr(scanner, "fetch_ohlcv", _fetch_ohlcv)
+    monkeypatch.setattr(scanner, "fetch_ohlcv_many", lambda tickers, **kw: {})
+    monkeypatch.setattr(scanner, "get_asset_info", lambda t: {"name": f"{t} Inc."})
+    return calls
+
+
+@pytest.fixture
+def indicators():
+    return {"RSI": RSI(), "SMA Crossover": SMACrossover()}
+
+
+class TestScanTickers:
+    def test_yields_one_result_per_ticker(self, fake_fetch, indicators):
+        results = list(scan_tickers(["AAA", "BB", "C"], indicators, compute_workers=0))
+        assert sorted(r.ticker for r in results) == ["AAA", "BB", "C"]
+        for r in results:
+            assert isinstance(r, ScanResult)
+            assert r.ok
+            assert isinstance(r.signal, CombinedSignal)
+            assert r.name == f"{r.ticker} Inc."
+            assert r.price > 0
+            assert r.total_seconds >= r.fetch_seconds
+
+    def test_failures_reported_not_skipped(self, fake_fetch, indicators):
+        results = {r.ticker: r for r in scan_tickers(["AAA", "BAD1"], indicators, compute_workers=0)}
+        assert results["AAA"].ok
+        assert not results["BAD1"].ok
+        assert "No data returned" in results["BAD1"].error
+        assert results["BAD1"].signal is None
+
+    def test_duplicates_scanned_once(self, fake_fetch, indicators):
+        results = list(scan_tickers(["AAA", "AAA", "BB"], indicators, compute_workers=0))
+        assert len(results) == 2
+        assert sorted(fake_fetch) == ["AAA", "BB"]
+
+    def test_empty_watchlist(self, fake_fetch, indicators):
+        assert list(scan_tickers([], indicators)) == []
+
+    def test_process_pool_matches_inline(self, fake_fetch, indicators):
+        inline = {r.ticker: r for r in scan_tickers(["AAA", "BB"], indicators, compute_workers=0)}
+        pooled = {r.ticker: r for r in scan_tickers(["AAA", "BB"], indicators, compute_workers=2)}
+        for ticker, r in inline.items():
+            assert pooled[ticker].ok
+            assert pooled[ticker].signal.direction == r.signal.direction
+            assert pooled[ticker].signal.confidence == pytest.approx(r.signal.confidence)
@@ -0,0 +1,143 @@
+"""Tests for the persistent on-disk OHLCV store."""
+
+import pandas as pd
+import pytest
+
+from data import store
+from tests.conftest import make_ohlcv
+
+pytestmark = pytest.mark.skipif(not store.is_available(), reason="pyarrow not installed")
+
+
+def _recent_ohlcv(n_bars: int, seed: int = 1) -> pd.DataFrame:
+    """Synthetic daily bars ending today, tz-aware like yfinance history()."""
+    df = make_ohlcv(n_bars, seed=seed)
+    end = pd.Timestamp.now(tz="America/New_York").normalize()
+    df.index = pd.bdate_range(end=end, periods=n_bars, tz="America/New_York")
+    return df
+
+
+class FakeYahoo:
+    """Stands in for yf.Ticker(...).history(), serving slices of a fixed history."""
+
+    def __init__(self, history: pd.DataFrame):
+        self.history = history
+        self.calls: list[dict] = []
+
+    def __call__(self, **kwargs) -> pd.DataFrame:
+        self.calls.append(kwargs)
+        if "start" in kwargs:
+            return self.history.loc[self.history.index >= kwargs["start"]]
+        start = store.period_start(kwargs["period"], pd.Timestamp.now(tz="America/New_York"))
+        return self.history if start is None else self.history.loc[self.history.index >= start]
+
+
+class TestSupports:
+    def test_long_daily_periods_supported(self):
+        assert store.supports("1y", "1d")
+        assert store.supports("5y", "1d")
+        assert store.supports("max", "1wk")
+        assert store.supports("6mo", "1d")
+
+    def test_short_or_intraday_not_supported(self):
+        assert not store.supports("5d", "1d")
+        assert not store.supports("1wk", "1d")
+        assert not store.supports("1y", "5m")
+
+
+class TestPeriodStart:
+    def test_max_is_unbounded(self):
+        assert store.period_start("max", pd.Timestamp("2024-06-15")) is None
+
+    def test_years_and_months(self):
+        now = pd.Timestamp("2024-06-15 13:30")
+        assert store.period_start("1y", now) == pd.Timestamp("2023-06-15")
+        assert store.period_start("3mo", now) == pd.Timestamp("2024-03-15")
+        assert store.period_start("ytd", now) == pd.Timestamp("2024-01-01")
+
+    def test_unsupported_raises(self):
+        with pytest.raises(ValueError):
+            store.period_start("5d", pd.Timestamp("2024-06-15"))
+
+
+class TestMergeBars:
+    def test_new_bars_win_and_sorted(self):
+        stored = _recent_ohlcv(10)
+        update = stored.iloc[-2:].copy()
+        update["Close"] = update["Close"] * 1.01
+        merged = store.merge_bars(stored, update)
+        assert len(merged) == 10
+        assert merged.index.is_monotonic_increasing
+        assert merged["Close"].iloc[-1] == update["Close"].iloc[-1]
+
+
+class TestFetchWithStore:
+    def test_first_fetch_downloads_full_period(self):
+        yahoo = FakeYahoo(_recent_ohlcv(600))
+        df = store.fetch_with_store("AAPL", "1y", "1d", yahoo)
+        assert yahoo.calls == [{"period": "1y"}]
+        assert 240 < len(df) < 270
+        assert store.load_bars("AAPL", "1d") is not None
+
+    def test_refresh_only_fetches_tail(self):
+        full = _recent_ohlcv(600)
+        yahoo = FakeYahoo(full.iloc[:-3])
+        store.fetch_with_store("AAPL", "2y", "1d", yahoo)
+
+        # Three new bars arrive
+        yahoo.history = full
+        yahoo.calls.clear()
+        df = store.fetch_with_store("AAPL", "2y", "1d", yahoo)
+
+        assert len(yahoo.calls) == 1
+        assert "start" in yahoo.calls[0]
+        assert df.index[-1] == full.index[-1]
+        assert not df.index.duplicated().any()
+        stored, _ = store.load_bars("AAPL", "1d")
+        assert len(stored) == len(full.loc[full.index >= stored.index[0]])
+
+    def test_longer_period_triggers_full_fetch(self):
+        yahoo = FakeYahoo(_recent_ohlcv(600))
+        store.fetch_with_store("AAPL", "6mo", "1d", yahoo)
+        yahoo.calls.clear()
+        store.fetch_with_store("AAPL", "2y", "1d", yahoo)
+        assert yahoo.calls == [{"period": "2y"}]
+        # Now the shorter period is served incrementally
+        yahoo.calls.clear()
+        df = store.fetch_with_store("AAPL", "1y", "1d", yahoo)
+        assert "start" in yahoo.calls[0]
+        assert 240 < len(df) < 270
+
+    def test_readjusted_history_is_replaced(self):
+        full = _recent_ohlcv(300)
+        yahoo = FakeYahoo(full)
+        store.fetch_with_store("AAPL", "1y", "1d", yahoo)
+
+        # A split re-adjusts every historical price
+        adjusted = full.copy()
+        adjusted[["Open", "High", "Low", "Close"]] /= 2
+        yahoo.history = adjusted
+        yahoo.calls.clear()
+        df = store.fetch_with_store("AAPL", "1y", "1d", yahoo)
+
+        assert [list(c) for c in yahoo.calls] == [["start"], ["period"]]
+        stored, _ = store.load_bars("AAPL", "1d")
+        assert stored["Close"].iloc[0] == pytest.approx(adjusted.loc[stored.index[0], "Close"])
+        assert df["Close"].iloc[-1] == pytest.approx(adjusted["Close"].iloc[-1])
+
+    def test_failed_refresh_serves_stored_bars(self):
+        yahoo = FakeYahoo(_recent_ohlcv(300))
+        first = store.fetch_with_store("AAPL", "1y", "1d", yahoo)
+
+        def _offline(**kwargs):
+            raise ValueError("network down")
+
+        df = store.fetch_with_store("AAPL", "1y", "1d", _offline)
+        pd.testing.assert_frame_equal(df, first, check_freq=False)
+
+    def test_record_fetch_seeds_store(self):
+        df = _recent_ohlcv(300)
+        store.record_fetch("MSFT", "1y", "1d", df.loc[df.index >= store.period_start("1y", df.index[-1])])
+        yahoo = FakeYahoo(df)
+        store.fetch_with_store("MSFT", "1y", "1d", yahoo)
+        assert "start" in yahoo.calls[0]
@@ -0,0 +1,135 @@
+"""Tests for incremental indicator updates and the indicator stream."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import settings
+from indicators._streaming import Ewm, RollingExtreme, RollingWindow, iter_bars
+from indicators.pipeline import compute_indicators
+from indicators.registry import get_all_indicators, get_indicator
+from indicators.streaming import IndicatorStream
+from tests.conftest import make_ohlcv
+
+INCREMENTAL = ["SMA Crossover", "EMA Crossover", "MACD", "RSI", "Stochastic",
+               "Bollinger Bands", "VWAP", "OBV", "VPIN"]
+
+
+@pytest.fixture(scope="module")
+def df():
+    return make_ohlcv(400, trend="volatile", seed=6)
+
+
+def _streamed(indicator, df, start):
+    state = indicator.init_state(df.iloc[:start])
+    rows = [indicator.update(state, bar) for bar in iter_bars(df.iloc[start:])]
+    return state, pd.DataFrame(rows, index=df.index[start:])
+
+
+def _assert_matches(streamed, expected):
+    expected = expected[streamed.columns].astype(float)
+    np.testing.assert_array_equal(streamed.isna().to_numpy(), expected.isna().to_numpy())
+    np.testing.assert_allclose(streamed.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+class TestRunningWindows:
+    def test_match_pandas(self):
+        values = pd.Series(np.random.default_rng(0).normal(100, 5, 500))
+        window, ewm, low = RollingWindow(20), Ewm.from_span(12, 12), RollingExtreme(14, largest=False)
+        means, stds, ewms, lows = [], [], [], []
+        for value in values.tolist():
+            window.push(value)
+            means.append(window.mean())
+            stds.append(window.std(ddof=0))
+            ewms.append(ewm.push(value))
+            lows.append(low.push(value))
+        np.testing.assert_allclose(means, values.rolling(20).mean(), rtol=1e-12)
+        np.testing.assert_allclose(stds, values.rolling(20).std(ddof=0), rtol=1e-9)
+        np.testing.assert_array_equal(ewms, values.ewm(span=12, min_periods=12, adjust=False).mean())
+        np.testing.assert_array_equal(lows, values.rolling(14).min())
+
+    def test_nan_values_take_a_slot_but_are_not_counted(self):
+        values = pd.Series([1.0, np.nan, 3.0, 4.0, np.nan, np.nan, np.nan, 8.0])
+        window = RollingWindow(4)
+        got = []
+        for value in values.tolist():
+            window.push(value)
+            got.append(window.mean(min_periods=2))
+        np.testing.assert_array_equal(got, values.rolling(4, min_periods=2).mean())
+
+
+class TestIncrementalUpdates:
+    @pytest.mark.parametrize("name", INCREMENTAL)
+    def test_matches_full_recompute(self, name, df):
+        indicator = get_indicator(name)
+        _, streamed = _streamed(indicator, df, 250)
+        expected = pd.DataFrame(indicator.compute_columns(df), index=df.index).iloc[250:]
+        _assert_matches(streamed, expected)
+
+    @pytest.mark.parametrize("name", INCREMENTAL)
+    def test_short_history_matches_prefix_recompute(self, name, df):
+        # Frames shorter than the lookback compute to NaN; so must the stream
+        indicator = get_indicator(name)
+        _, streamed = _streamed(indicator, df.iloc[:80], 3)
+        expected = pd.DataFrame(
+            [pd.DataFrame(indicator.compute_columns(df.iloc[: i + 1]), index=df.index[: i + 1]).iloc[-1]
+             for i in range(3, 80)],
+            index=df.index[3:80],
+        )
+        _assert_matches(streamed, expected)
+
+    def test_other_indicators_recompute(self, df):
+        indicator = get_indicator("Bubble Risk")
+        state, streamed = _streamed(indicator, df, 390)
+        assert state.history.index[-1] == df.index[-1]
+        _assert_matches(streamed, pd.DataFrame(indicator.compute_columns(df), index=df.index).iloc[390:])
+
+    def test_recompute_history_keeps_its_length(self, df):
+        indicator = get_indicator("ADX")
+        state = indicator.init_state(df.iloc[:300])
+        for bar in iter_bars(df.iloc[300:]):
+            indicator.update(state, bar)
+            assert len(state.history) == 300
+        pd.testing.assert_frame_equal(state.history, df.iloc[100:][state.history.columns],
+                                      check_freq=False)
+
+    def test_vpin_volume_mode_recomputes(self, df, monkeypatch):
+        monkeypatch.setattr(settings, "VPIN_MODE", "volume")
+        indicator = get_indicator("VPIN")
+        state, streamed = _streamed(indicator, df, 395)
+        assert hasattr(state, "history")
+        _assert_matches(streamed, pd.DataFrame(indicator.compute_columns(df), index=df.index).iloc[395:])
+
+    def test_updates_are_fast(self, df):
+        indicator = get_indicator("Stochastic")
+        state = indicator.init_state(df)
+        bars = list(iter_bars(df)) * 5
+        start = time.perf_counter()
+        for bar in bars:
+            indicator.update(state, bar)
+        assert (time.perf_counter() - start) / len(bars) < 1e-4
+
+
+class TestIndicatorStream:
+    def test_signals_match_full_recompute(self, df):
+        indicators = {n: i for n, i in get_all_indicators().items() if not i.reference_tickers}
+        stream = IndicatorStream(df.iloc[:370], indicators)
+        for i in range(370, 400):
+            row = stream.append(df.iloc[i])
+            full = compute_indicators(df.iloc[: i + 1], indicators)
+            assert row["RSI"] == pytest.approx(full["RSI"].iloc[-1], rel=1e-9)
+            for name, signal in stream.signals().items():
+                expected = indicators[name].get_signal(full, -1)
+                assert signal.direction == expected.direction, name
+                assert signal.confidence == pytest.approx(expected.confidence, rel=1e-9, abs=1e-12)
+
+    def test_frame_keeps_recent_rows(self, df):
+        stream = IndicatorStream(df.iloc[:300], [get_indicator("RSI")], history_bars=50)
+        for i in range(300, 310):
+            stream.append(df.iloc[i])
+        frame = stream.frame
+        assert len(frame) == 50
+        assert frame.index[-1] == df.index[309]
+        assert list(frame.columns) == ["Open", "High", "Low", "Close", "Volume", "RSI"]
@@ -0,0 +1,101 @@
+"""Tests for parameter sweeps and scoped setting overrides."""
+
+import pandas as pd
+import pytest
+
+from backtesting.engine import run_backtest
+from backtesting.sweep import RESULT_METRICS, expand_grid, run_sweep
+from config import settings
+from config.overrides import get_setting, override_settings
+from indicators.momentum import RSI, Stochastic
+from indicators.trend import MACD, SMACrossover
+from tests.conftest import make_ohlcv
+
+
+class TestOverrideSettings:
+    def test_scoped_and_nested(self):
+        assert get_setting("RSI_OVERSOLD") == settings.RSI_OVERSOLD
+        with override_settings(RSI_OVERSOLD=25, RSI_OVERBOUGHT=75):
+            with override_settings(RSI_OVERSOLD=20):
+                assert get_setting("RSI_OVERSOLD") == 20
+                assert get_setting("RSI_OVERBOUGHT") == 75
+            assert get_setting("RSI_OVERSOLD") == 25
+        assert get_setting("RSI_OVERSOLD") == settings.RSI_OVERSOLD
+
+    def test_changes_signals(self):
+        df = RSI().compute(make_ohlcv(200, trend="up"))
+        with override_settings(RSI_OVERBOUGHT=50):
+            strict = RSI().get_signal_series(df)
+        default = RSI().get_signal_series(df)
+        assert (strict.direction != default.direction).any()
+
+
+class TestExpandGrid:
+    def test_cartesian_product(self):
+        configs = expand_grid({"RSI_OVERSOLD": [25, 30], "horizon_days": [1, 5, 10]})
+        assert len(configs) == 6
+        assert {"RSI_OVERSOLD": 30, "horizon_days": 10} in configs
+
+    def test_rejects_compute_settings(self):
+        with pytest.raises(ValueError, match="RSI_PERIOD"):
+            expand_grid({"RSI_PERIOD": [10, 14]})
+
+
+class TestRunSweep:
+    @pytest.fixture
+    def indicators(self):
+        return {"RSI": RSI(), "Stochastic": Stochastic(), "MACD": MACD(),
+                "SMA Crossover": SMACrossover()}
+
+    @pytest.fixture
+    def grid(self):
+        return {
+            "RSI_OVERSOLD": [25, 35],
+            "AMBIGUITY_THRESHOLD": [0.05, 0.2],
+            "INDICATOR_WEIGHTS": [{}, {"MACD": 2.0}],
+            "horizon_days": [3, 10],
+        }
+
+    def test_matches_individual_backtests(self, indicators, grid):
+        df = make_ohlcv(400, trend="volatile", seed=5)
+        table = run_sweep(df, indicators, grid, ticker="TEST", period="2y", workers=0)
+
+        assert len(table) == 16
+        assert list(table.columns) == list(grid) + list(RESULT_METRICS)
+        assert table["sharpe_ratio"].is_monotonic_decreasing
+
+        for row in table.to_dict("records"):
+            overrides = {"RSI_OVERSOLD": row["RSI_OVERSOLD"],
+                         "AMBIGUITY_THRESHOLD": row["AMBIGUITY_THRESHOLD"],
+                         "INDICATOR_WEIGHTS": {**settings.INDICATOR_WEIGHTS,
+                                               **row["INDICATOR_WEIGHTS"]}}
+            with override_settings(**overrides):
+                report = run_backtest(df, indicators, ticker="TEST", period="2y",
+                                      horizon_days=row["horizon_days"])
+            assert row["total_trades"] == report.total_trades
+            assert row["cumulative_return"] == pytest.approx(report.cumulative_return, abs=1e-12)
+            assert row["sharpe_ratio"] == pytest.approx(report.sharpe_ratio, abs=1e-9)
+
+    def test_process_pool_matches_inline(self, indicators, grid):
+        df = make_ohlcv(300, trend="up", seed=2)
+        inline = run_sweep(df, indicators, grid, ticker="TEST", period="1y", workers=0)
+        pooled = run_sweep(df, indicators, grid, ticker="TEST", period="1y", workers=2)
+        pd.testing.assert_frame_equal(pooled, inline)
+
+    def test_keeps_current_overrides_for_unswept_settings(self, indicators):
+        df = make_ohlcv(300, trend="volatile", seed=8)
+        default = run_sweep(df, indicators, {"horizon_days": [5]}, ticker="T", period="1y",
+                            workers=0)
+        with override_settings(AMBIGUITY_THRESHOLD=0.6):
+            table = run_sweep(df, indicators, {"horizon_days": [5]}, ticker="T", period="1y",
+                              workers=0)
+            report = run_backtest(df, indicators, ticker="T", period="1y", horizon_days=5)
+        assert table["total_trades"].iloc[0] == report.total_trades
+        assert table["total_trades"].iloc[0] < default["total_trades"].iloc[0]
+
+    def test_too_many_configs(self, indicators, monkeypatch):
+        from backtesting import sweep
+        monkeypatch.setattr(sweep, "SWEEP_MAX_CONFIGS", 3)
+        with pytest.raises(ValueError, match="limit"):
+            run_sweep(make_ohlcv(300), indicators, {"horizon_days": [1, 2, 3, 4]},
+                      ticker="T", period="1y", workers=0)
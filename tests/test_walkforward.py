@@ -0,0 +1,94 @@
+"""Tests for walk-forward optimization."""
+
+import numpy as np
+import pytest
+
+from backtesting.engine import _simulate_arrays
+from backtesting.walkforward import Fold, walk_forward, walk_forward_folds
+from indicators.momentum import RSI, Stochastic
+from indicators.trend import MACD, SMACrossover
+from signals.combiner import combine_signals_matrix, indicator_weights, signal_matrices
+from tests.conftest import make_ohlcv
+
+
+class TestWalkForwardFolds:
+    def test_rolling(self):
+        folds = walk_forward_folds(n_bars=100, first_bar=10, train_bars=40, test_bars=20)
+        assert folds == [Fold(10, 50, 50, 70), Fold(30, 70, 70, 90), Fold(50, 90, 90, 100)]
+
+    def test_anchored(self):
+        folds = walk_forward_folds(n_bars=100, first_bar=10, train_bars=40, test_bars=30,
+                                   anchored=True)
+        assert folds == [Fold(10, 50, 50, 80), Fold(10, 80, 80, 100)]
+
+    def test_too_short(self):
+        assert walk_forward_folds(n_bars=40, first_bar=10, train_bars=40, test_bars=20) == []
+
+
+class TestWalkForward:
+    @pytest.fixture
+    def indicators(self):
+        return {"RSI": RSI(), "Stochastic": Stochastic(), "MACD": MACD(),
+                "SMA Crossover": SMACrossover()}
+
+    @pytest.fixture
+    def df(self):
+        return make_ohlcv(700, trend="volatile", seed=12)
+
+    def test_single_config_matches_array_engine(self, indicators, df):
+        result = walk_forward(df, indicators, {"AMBIGUITY_THRESHOLD": [0.1]}, ticker="T",
+                              period="2y", train_bars=150, test_bars=50, min_trades=0, workers=0)
+
+        computed = df.copy()
+        for indicator in indicators.values():
+            computed = indicator.compute(computed)
+        combined = combine_signals_matrix(*signal_matrices(indicators, computed, precomputed=True),
+                                          indicator_weights(list(indicators), 5))
+        first_test = result.folds["test_start"].iloc[0]
+        expected = _simulate_arrays(computed, combined.direction, 5,
+                                    computed.index.get_loc(first_test), len(computed) - 5, 0.1)
+
+        np.testing.assert_array_equal(result.report.trade_arrays.entry_idx, expected.entry_idx)
+        np.testing.assert_array_equal(result.report.trade_arrays.pnl_pct, expected.pnl_pct)
+        assert result.folds["total_trades"].sum() == result.report.total_trades
+
+    def test_picks_best_eligible_config_per_fold(self, indicators, df):
+        grid = {"RSI_OVERSOLD": [25, 35], "AMBIGUITY_THRESHOLD": [0.05, 1.01]}
+        result = walk_forward(df, indicators, grid, ticker="T", period="2y",
+                              train_bars=150, test_bars=50, min_trades=1, workers=0)
+
+        assert len(result.in_sample) == 4 * len(result.folds)
+        # A 101% margin never trades, so it's never eligible
+        assert (result.folds["AMBIGUITY_THRESHOLD"] == 0.05).all()
+        for fold in result.folds.itertuples():
+            candidates = result.in_sample[(result.in_sample["fold"] == fold.fold)
+                                          & (result.in_sample["total_trades"] >= 1)]
+            assert fold.train_sharpe_ratio == candidates["sharpe_ratio"].max()
+
+    def test_out_of_sample_trades_inside_test_windows(self, indicators, df):
+        result = walk_forward(df, indicators, {"RSI_OVERSOLD": [25, 35]}, ticker="T",
+                              period="2y", train_bars=200, test_bars=60, min_trades=0, workers=0)
+        entries = result.report.trade_arrays.entry_dates
+        assert (entries >= result.folds["test_start"].iloc[0]).all()
+        exits = result.report.trade_arrays.exit_dates
+        assert (exits[:-1] <= entries[1:]).all()  # no overlapping positions
+        assert len(result.report.equity_curve) == result.report.total_trades + 1
+
+    def test_process_pool_matches_inline(self, indicators, df):
+        grid = {"RSI_OVERSOLD": [25, 35], "INDICATOR_WEIGHTS": [{}, {"MACD": 2.0}]}
+        inline = walk_forward(df, indicators, grid, ticker="T", period="2y",
+                              train_bars=150, test_bars=100, workers=0)
+        pooled = walk_forward(df, indicators, grid, ticker="T", period="2y",
+                              train_bars=150, test_bars=100, workers=2)
+        assert pooled.report.cumulative_return == inline.report.cumulative_return
+        assert pooled.folds["RSI_OVERSOLD"].tolist() == inline.folds["RSI_OVERSOLD"].tolist()
+
+    def test_rejects_horizon_sweep(self, indicators, df):
+        with pytest.raises(ValueError, match="fixed horizon"):
+            walk_forward(df, indicators, {"horizon_days": [1, 5]}, ticker="T", period="2y")
+
+    def test_not_enough_history(self, indicators):
+        result = walk_forward(make_ohlcv(150), indicators, {"RSI_OVERSOLD": [30]}, ticker="T",
+                              period="1y", workers=0)
+        assert result.report.total_trades == 0
+        assert result.folds.empty
@@ -16,6 +16,8 @@ from config.settings import (
     TUNABLE_THRESHOLDS,
 )
 from config.overrides import clear_overrides, get_setting, set_override
+from data.cache import shared_caches
+from data.live import active_pollers
 from indicators.registry import get_all_indicators
 
 
@@ -46,10 +48,10 @@ def interval_select(key: str = "interval") -> str:
     return st.selectbox("Interval", INTERVALS, index=4, key=key)  # default "1d"
 
 
-def horizon_input(key: str = "horizon") -> int:
-    """Render prediction horizon slider."""
+def horizon_input(key: str = "horizon", unit: str = "days") -> int:
+    """Render prediction horizon slider; *unit* names the bars it counts."""
     return st.slider(
-        "Prediction Horizon (days)",
+        f"Prediction Horizon ({unit})",
         min_value=1,
         max_value=30,
         value=DEFAULT_PREDICTION_HORIZON,
@@ -202,3 +204,31 @@ def advanced_settings(key_prefix: str = "adv") -> None:
         if st.button("Reset to Defaults", key=f"{key_prefix}_reset"):
             clear_overrides()
             st.rerun()
+
+
+def cache_diagnostics() -> None:
+    """Render a Cache Diagnostics expander for the caches shared by every session.
+
+    Shows each cache's entries, hit rate (lookups answered from the cache
+    or by waiting on another session's load), loads in flight and
+    approximate memory, plus the running live pollers.
+    """
+    with st.expander("Cache Diagnostics"):
+        rows = []
+        total_bytes = 0
+        for name, cache in shared_caches().items():
+            stats = cache.stats
+            memory = cache.memory_usage()
+            total_bytes += memory
+            rows.append({
+                "Cache": name,
+                "Entries": len(cache),
+                "Hit Rate": f"{stats.hit_rate:.0%}",
+                "Coalesced": stats.coalesced,
+                "In Flight": cache.in_flight,
+                "Memory (MB)": round(memory / 1e6, 1),
+            })
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.caption(
+            f"{total_bytes / 1e6:.1f} MB cached · {len(active_pollers())} live poller(s)"
+        )
@@ -3,10 +3,21 @@
 import pandas as pd
 import streamlit as st
 
+from backtesting.bootstrap import bootstrap_price_paths, bootstrap_trades
 from backtesting.engine import run_backtest
+from backtesting.sweep import run_sweep
 from charts.factory import render_equity_curve, render_price_chart
-from config.settings import BACKTEST_FETCH_PERIOD
+from config.overrides import get_setting
+from config.settings import (
+    BACKTEST_FETCH_PERIOD,
+    BOOTSTRAP_BLOCK_BARS,
+    BOOTSTRAP_RESAMPLES,
+    INDICATOR_WEIGHTS,
+    MULTI_TIMEFRAME_HORIZONS,
+    TUNABLE_THRESHOLDS,
+)
 from data.fetcher import compute_buy_and_hold, fetch_ohlcv
+from indicators.pipeline import compute_indicators
 from indicators.registry import get_all_indicators
 from ui.components import (
     advanced_settings,
@@ -36,6 +47,12 @@ def render():
         selected_indicators = indicator_picker(key="backtest_indicators")
         initial_capital = capital_input(key="backtest_capital")
         cost_pct = cost_input(key="backtest_cost")
+        overlapping = st.checkbox(
+            "Overlapping positions", value=False, key="backtest_overlap",
+            help="Enter on every signal with 1/horizon of capital instead of waiting "
+                 "for the open trade to close. Uses all signals and doesn't depend on "
+                 "the start date.",
+        )
         advanced_settings(key_prefix="backtest_adv")
 
     if not ticker:
@@ -75,12 +92,13 @@ def render():
     chosen = {n: all_indicators[n] for n in selected_indicators if n in all_indicators}
 
     # Run backtest
+    engine = "overlap" if overlapping else "array"
     try:
         with st.spinner("Running backtest..."):
             report = run_backtest(
                 df, chosen, ticker=ticker, period=period,
                 horizon_days=horizon, initial_capital=initial_capital,
-                cost_per_trade_pct=cost_pct,
+                cost_per_trade_pct=cost_pct, engine=engine,
             )
     except Exception as e:
         st.error(f"Error running backtest: {e}")
@@ -88,6 +106,7 @@ def render():
 
     if report.total_trades == 0:
         st.warning("No trades generated. Try a longer period or different indicators.")
+        _render_sweep(df, chosen, ticker, period, horizon, initial_capital, cost_pct)
         return
 
     # Compute benchmark/buy-and-hold returns for context
@@ -143,9 +162,7 @@ def render():
             )
 
     # Price chart with prediction markers
-    computed_df = df.copy()
-    for name, indicator in chosen.items():
-        computed_df = indicator.compute(computed_df)
+    computed_df = compute_indicators(df, chosen)
 
     correct_trades = [t for t in report.trades if t.correct]
     incorrect_trades = [t for t in report.trades if not t.correct]
@@ -183,6 +200,12 @@ def render():
     if not report.equity_curve.empty:
         render_equity_curve(report.equity_curve, title="Equity Curve")
 
+    if not overlapping:  # resampling assumes trades that follow one another
+        inputs = (ticker, period, horizon, tuple(sorted(chosen)), initial_capital, cost_pct)
+        _render_bootstrap(report, df, cost_pct, inputs)
+    _render_horizon_comparison(computed_df, chosen, ticker, period, horizon, initial_capital,
+                               cost_pct, engine)
+
     # Trade log
     with st.expander("Trade Log", expanded=False):
         trade_data = []
@@ -206,3 +229,163 @@ def render():
             file_name=f"backtest_{ticker}_{period}_{horizon}d.csv",
             mime="text/csv",
         )
+
+    _render_sweep(df, chosen, ticker, period, horizon, initial_capital, cost_pct)
+
+
+def _render_bootstrap(report, df, cost_pct, inputs) -> None:
+    """Confidence intervals for return, Sharpe and drawdown from resampled histories."""
+    with st.expander("Robustness (Bootstrap)", expanded=False):
+        method = st.radio(
+            "Resample", options=["Trades", "Price path"], horizontal=True, key="bootstrap_method",
+            help="Trades: redraw the trade returns with replacement. "
+                 "Price path: replay the trades on prices rebuilt from blocks of real bar returns.",
+        )
+        cols = st.columns(2)
+        n_resamples = cols[0].number_input("Resamples", min_value=100, max_value=100_000,
+                                           value=BOOTSTRAP_RESAMPLES, step=1000,
+                                           key="bootstrap_resamples")
+        block_bars = cols[1].number_input("Block length (bars)", min_value=1, max_value=250,
+                                          value=BOOTSTRAP_BLOCK_BARS,
+                                          disabled=method != "Price path",
+                                          key="bootstrap_block")
+        # The report's headline numbers catch changes made in advanced settings
+        key = (inputs, report.total_trades, report.cumulative_return,
+               method, int(n_resamples), int(block_bars) if method == "Price path" else None)
+        # Resampling takes seconds at large counts, so it runs on demand and
+        # the result is kept for the inputs it was computed with
+        if st.button("Run Bootstrap", key="bootstrap_run"):
+            # Fixed seed so the intervals don't jitter between runs
+            with st.spinner(f"Resampling {int(n_resamples):,} histories..."):
+                if method == "Trades":
+                    result = bootstrap_trades(report, n_resamples=int(n_resamples), seed=0)
+                else:
+                    result = bootstrap_price_paths(report, df["Close"], n_resamples=int(n_resamples),
+                                                   block_bars=int(block_bars),
+                                                   cost_per_trade_pct=cost_pct, seed=0)
+            st.session_state["bootstrap_result"] = (key, result)
+
+        stored = st.session_state.get("bootstrap_result")
+        if stored is None or stored[0] != key:
+            return
+        result = stored[1]
+
+        summary = result.summary().rename(index={
+            "cumulative_return": "Return", "sharpe_ratio": "Sharpe Ratio",
+            "max_drawdown": "Max Drawdown",
+        })
+        summary.columns = ["Observed", "Median", f"{result.confidence:.0%} Low",
+                           f"{result.confidence:.0%} High"]
+        formats = {"Return": "{:+.1%}", "Sharpe Ratio": "{:.2f}", "Max Drawdown": "{:.1%}"}
+        st.dataframe(
+            summary.apply(lambda row: row.map(formats[row.name].format), axis=1),
+            use_container_width=True,
+        )
+        st.metric("Probability of Loss", f"{result.probability_of_loss:.1%}",
+                  help="Share of resamples ending with a negative return")
+
+
+def _render_horizon_comparison(computed_df, chosen, ticker, period, horizon, initial_capital,
+                               cost_pct, engine) -> None:
+    """The same signals backtested at the multi-timeframe horizons, side by side."""
+    with st.expander("Horizon Comparison", expanded=False):
+        horizons = sorted(set(MULTI_TIMEFRAME_HORIZONS) | {horizon})
+        multi = run_backtest(
+            computed_df, chosen, ticker=ticker, period=period, horizon_days=horizons,
+            initial_capital=initial_capital, cost_per_trade_pct=cost_pct,
+            engine=engine, precomputed=True,
+        )
+        table = multi.comparison()
+        table.index = [f"{h}d" for h in table.index]
+        st.dataframe(
+            table.style.format({
+                "sharpe_ratio": "{:.2f}", "cumulative_return": "{:+.1%}",
+                "max_drawdown": "{:.1%}", "win_rate": "{:.1%}",
+                "prediction_accuracy": "{:.1%}", "profit_factor": "{:.2f}",
+            }),
+            use_container_width=True,
+        )
+
+
+def _parse_values(text: str, cast) -> list:
+    """Parse a comma-separated list of numbers, skipping blanks."""
+    return [cast(v) for v in (part.strip() for part in text.split(",")) if v]
+
+
+def _render_sweep(df, chosen, ticker, period, horizon, initial_capital, cost_pct) -> None:
+    """Parameter sweep panel: backtest a grid of settings and rank the results."""
+    with st.expander("Parameter Sweep", expanded=False):
+        st.caption(
+            "Backtest every combination of the values below (comma-separated). "
+            "Settings left at a single value keep it for all runs."
+        )
+        grid = {}
+        horizons = st.multiselect(
+            "Horizons (days)", options=[1, 2, 3, 5, 10, 15, 20, 30],
+            default=[horizon] if horizon in (1, 2, 3, 5, 10, 15, 20, 30) else [5],
+            key="sweep_horizons",
+        )
+        grid["horizon_days"] = horizons or [horizon]
+
+        cols = st.columns(2)
+        for i, (setting_name, meta) in enumerate(TUNABLE_THRESHOLDS.items()):
+            cast = type(meta["min"])
+            text = cols[i % 2].text_input(
+                meta["label"], value=str(cast(get_setting(setting_name))),
+                key=f"sweep_{setting_name}",
+            )
+            try:
+                values = _parse_values(text, cast)
+            except ValueError:
+                st.error(f"{meta['label']}: enter numbers separated by commas.")
+                return
+            if values:
+                grid[setting_name] = values
+
+        weight_name = st.selectbox(
+            "Sweep an indicator weight", options=["(none)"] + [n for n in INDICATOR_WEIGHTS if n in chosen],
+            key="sweep_weight_indicator",
+        )
+        if weight_name != "(none)":
+            text = st.text_input(f"{weight_name} weights", value="0.5, 1.0, 1.5",
+                                 key="sweep_weight_values")
+            try:
+                weights = _parse_values(text, float)
+            except ValueError:
+                st.error("Weights: enter numbers separated by commas.")
+                return
+            if weights:
+                grid["INDICATOR_WEIGHTS"] = [{weight_name: w} for w in weights]
+
+        n_configs = 1
+        for values in grid.values():
+            n_configs *= len(values)
+        # Results are only shown for the inputs they were run on
+        inputs = (ticker, period, horizon, tuple(sorted(chosen)), initial_capital, cost_pct)
+        if st.button(f"Run Sweep ({n_configs} configurations)", key="sweep_run"):
+            try:
+                with st.spinner(f"Backtesting {n_configs} configurations..."):
+                    table = run_sweep(
+                        df, chosen, grid, ticker=ticker, period=period, horizon_days=horizon,
+                        initial_capital=initial_capital, cost_per_trade_pct=cost_pct,
+                    )
+            except ValueError as e:
+                st.error(str(e))
+                return
+            if "INDICATOR_WEIGHTS" in table.columns:
+                table["INDICATOR_WEIGHTS"] = table["INDICATOR_WEIGHTS"].map(
+                    lambda w: ", ".join(f"{k}={v:g}" for k, v in w.items())
+                )
+            st.session_state["sweep_results"] = (inputs, table)
+
+        stored = st.session_state.get("sweep_results")
+        if stored is not None and stored[0] == inputs:
+            table = stored[1]
+            st.dataframe(
+                table.style.format({
+                    "sharpe_ratio": "{:.2f}", "cumulative_return": "{:+.1%}",
+                    "max_drawdown": "{:.1%}", "win_rate": "{:.1%}",
+                    "prediction_accuracy": "{:.1%}", "profit_factor": "{:.2f}",
+                }),
+                use_container_width=True,
+            )
@@ -4,10 +4,17 @@ import numpy as np
 import streamlit as st
 
 from charts.plotly_fallback import create_comparison_chart
-from data.fetcher import compute_buy_and_hold, fetch_with_warmup, get_asset_info
+from config.settings import WARMUP_FETCH_PERIOD
+from data.fetcher import (
+    compute_buy_and_hold,
+    fetch_ohlcv_many,
+    fetch_with_warmup,
+    get_asset_info,
+)
+from indicators.pipeline import compute_indicators
 from indicators.registry import get_all_indicators
 from signals.base import SignalDirection
-from signals.combiner import combine_signals
+from signals.combiner import combine_signals_cached
 from ui.components import horizon_input, indicator_picker, period_select
 
 
@@ -56,6 +63,11 @@ def render():
         st.warning("Select at least one indicator.")
         return
 
+    # Fetch both tickers in one bulk request; the per-ticker fetches below
+    # then hit the cache (or report a proper error for a bad symbol).
+    with st.spinner(f"Fetching {ticker_a} and {ticker_b}..."):
+        fetch_ohlcv_many([ticker_a, ticker_b], period=WARMUP_FETCH_PERIOD.get(period, period))
+
     # Fetch data for both tickers with warmup
     try:
         with st.spinner(f"Fetching {ticker_a}..."):
@@ -115,15 +127,11 @@ def render():
 
     try:
         # Compute indicators and signals on full (warmup) data
-        computed_a = full_a.copy()
-        for indicator in chosen.values():
-            computed_a = indicator.compute(computed_a)
-        signal_a = combine_signals(chosen, computed_a, horizon_days=horizon, precomputed=True)
-
-        computed_b = full_b.copy()
-        for indicator in chosen.values():
-            computed_b = indicator.compute(computed_b)
-        signal_b = combine_signals(chosen, computed_b, horizon_days=horizon, precomputed=True)
+        computed_a = compute_indicators(full_a, chosen)
+        signal_a = combine_signals_cached(chosen, computed_a, horizon_days=horizon)
+
+        computed_b = compute_indicators(full_b, chosen)
+        signal_b = combine_signals_cached(chosen, computed_b, horizon_days=horizon)
     except Exception as e:
         st.error(f"Error computing signals: {e}")
         return
@@ -4,6 +4,7 @@ import streamlit as st
 
 from charts.factory import render_price_chart
 from data.fetcher import fetch_with_warmup, get_asset_info
+from indicators.pipeline import compute_cached
 from indicators.registry import get_all_indicators
 from ui.components import (
     check_data_sufficiency,
@@ -77,7 +78,7 @@ def render():
             if name not in all_indicators:
                 continue
             indicator = all_indicators[name]
-            computed_df = indicator.compute(computed_df)
+            computed_df = compute_cached(indicator, computed_df)
             chart_cfg = indicator.get_chart_config()
 
             if chart_cfg.get("overlay"):
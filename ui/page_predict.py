@@ -1,12 +1,17 @@
 """Predict page: signal generation and display."""
 
+import time
+
 import streamlit as st
 
 from charts.factory import render_price_chart
+from config.settings import LIVE_INTERVALS, LIVE_REFRESH_SECONDS, MULTI_TIMEFRAME_HORIZONS
 from data.fetcher import fetch_with_warmup
+from data.live import get_poller
+from indicators.pipeline import compute_indicators
 from indicators.registry import get_all_indicators
 from signals.base import SignalDirection
-from signals.combiner import combine_signals
+from signals.combiner import combine_signals_cached
 from ui.components import (
     advanced_settings,
     check_data_sufficiency,
@@ -35,72 +40,17 @@ def _signal_emoji(direction: SignalDirection) -> str:
     return "●"
 
 
-def render():
-    st.header("Predict")
-
-    # Sidebar controls
-    with st.sidebar:
-        ticker = ticker_input(key="predict_ticker")
-        render_recent_tickers("predict_ticker")
-        period = period_select(key="predict_period")
-        horizon = horizon_input(key="predict_horizon")
-        selected_indicators = indicator_picker(key="predict_indicators")
-        advanced_settings(key_prefix="predict_adv")
-
-    if not ticker:
-        st.info("Enter a ticker symbol in the sidebar to get started.")
-        return
-
-    if not selected_indicators:
-        st.warning("Select at least one indicator.")
-        return
-
-    record_recent_ticker(ticker)
-
-    # Fetch data with warmup for short periods
-    try:
-        with st.spinner("Fetching data..."):
-            full_df, display_df = fetch_with_warmup(ticker, period=period)
-    except ValueError as e:
-        st.error(str(e))
-        return
-    except Exception as e:
-        st.error(f"Unexpected error fetching data: {e}")
-        return
-
-    try:
-        # Check data sufficiency against full (warmup) data
-        data_warnings = check_data_sufficiency(len(full_df), selected_indicators)
-        if data_warnings:
-            st.warning(
-                f"Insufficient data for {len(data_warnings)} indicator(s) "
-                f"({len(full_df)} bars available):\n\n" + "\n".join(f"- {w}" for w in data_warnings)
-                + "\n\nThese will report HOLD. Use a longer period for full analysis."
-            )
-
-        # Build selected indicators
-        all_indicators = get_all_indicators()
-        chosen = {n: all_indicators[n] for n in selected_indicators if n in all_indicators}
-
-        # Compute indicators on full data (includes warmup)
-        computed_df = full_df.copy()
-        for name, indicator in chosen.items():
-            computed_df = indicator.compute(computed_df)
+def _render_signal_cards(chosen, computed_df, signal, horizon: int,
+                         interval: str | None = None) -> None:
+    """Multi-timeframe cards, the primary signal card, reasoning and scores.
 
-        # Generate combined signal from full data
-        signal = combine_signals(chosen, computed_df, horizon_days=horizon, precomputed=True)
-
-        # Trim computed data to display range for charting
-        computed_display = computed_df.iloc[-len(display_df):]
-    except Exception as e:
-        st.error(f"Error computing signals: {e}")
-        return
-
-    # Multi-timeframe signal cards (1d, 5d, 20d)
-    _MTF_HORIZONS = [("1d", 1), ("5d", 5), ("20d", 20)]
-    mtf_cols = st.columns(len(_MTF_HORIZONS))
-    for col, (label, h) in zip(mtf_cols, _MTF_HORIZONS):
-        mtf_signal = combine_signals(chosen, computed_df, horizon_days=h, precomputed=True)
+    Horizons count daily bars, or *interval* bars in live mode.
+    """
+    # Multi-timeframe signal cards (e.g. 1d, 5d, 20d; 5 bars (5m) when live)
+    mtf_cols = st.columns(len(MULTI_TIMEFRAME_HORIZONS))
+    for col, h in zip(mtf_cols, MULTI_TIMEFRAME_HORIZONS):
+        label = f"{h}d" if interval is None else f"{h} bar{'s' if h != 1 else ''} ({interval})"
+        mtf_signal = combine_signals_cached(chosen, computed_df, horizon_days=h)
         mtf_color = _signal_color(mtf_signal.direction)
         mtf_arrow = _signal_emoji(mtf_signal.direction)
         with col:
@@ -126,6 +76,7 @@ def render():
             )
 
     # Primary signal card
+    horizon_text = f"{horizon}-day" if interval is None else f"{horizon}-bar ({interval})"
     color = _signal_color(signal.direction)
     arrow = _signal_emoji(signal.direction)
 
@@ -146,7 +97,7 @@ def render():
                 Confidence: {signal.confidence:.0%}
             </p>
             <p style="font-size: 0.9em; color: #999; margin: 4px 0 0 0;">
-                {horizon}-day horizon &bull; {len(selected_indicators)} indicators
+                {horizon_text} horizon &bull; {len(chosen)} indicators
             </p>
         </div>
         """,
@@ -163,6 +114,134 @@ def render():
     col2.metric("SELL Score", f"{signal.scores.get('SELL', 0):.2f}")
     col3.metric("HOLD Score", f"{signal.scores.get('HOLD', 0):.2f}")
 
+
+def _render_breakdown(signal) -> None:
+    st.subheader("Indicator Breakdown")
+    rows = []
+    for sig in signal.individual_signals:
+        rows.append({
+            "Indicator": sig.indicator_name,
+            "Direction": sig.direction.value,
+            "Confidence": f"{sig.confidence:.0%}",
+            "Detail": sig.detail,
+        })
+
+    st.table(rows)
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def _live_signals(ticker: str, interval: str, selected_indicators: list[str], horizon: int) -> None:
+    """Signal cards from the ticker's shared live poller, redrawn on a timer.
+
+    Only this fragment reruns on each refresh; the indicators were updated
+    by the poller as bars closed, so a redraw just reads them.
+    """
+    all_indicators = get_all_indicators()
+    chosen = {n: all_indicators[n] for n in selected_indicators if n in all_indicators}
+
+    poller = get_poller(ticker, interval)
+    if not poller.ready.is_set():
+        with st.spinner(f"Fetching {interval} bars..."):
+            poller.ready.wait(timeout=30)
+    try:
+        snapshot = poller.snapshot(chosen)
+        if snapshot.frame is None:
+            if snapshot.error:
+                st.error(snapshot.error)
+            else:
+                st.info(f"Waiting for {interval} bars...")
+            return
+        signal = combine_signals_cached(chosen, snapshot.frame, horizon_days=horizon)
+    except Exception as e:
+        st.error(f"Error computing signals: {e}")
+        return
+
+    _render_signal_cards(chosen, snapshot.frame, signal, horizon, interval)
+
+    polled = f"{time.time() - snapshot.polled_at:.0f}s ago" if snapshot.polled_at else "never"
+    st.caption(
+        f"Live {interval} bars · last closed bar {snapshot.last_bar:%Y-%m-%d %H:%M} "
+        f"· polled {polled} · refreshes every {LIVE_REFRESH_SECONDS}s"
+    )
+    if snapshot.error:
+        st.warning(f"Latest poll failed, showing earlier bars: {snapshot.error}")
+
+    _render_breakdown(signal)
+
+
+def render():
+    st.header("Predict")
+
+    # Sidebar controls
+    with st.sidebar:
+        ticker = ticker_input(key="predict_ticker")
+        render_recent_tickers("predict_ticker")
+        live = st.toggle(
+            "Live intraday signals",
+            key="predict_live",
+            help="Poll intraday bars and refresh the signal cards as each bar closes",
+        )
+        if live:
+            live_interval = st.selectbox("Bar Interval", list(LIVE_INTERVALS), key="predict_live_interval")
+        else:
+            period = period_select(key="predict_period")
+        horizon = horizon_input(key="predict_horizon", unit="bars" if live else "days")
+        selected_indicators = indicator_picker(key="predict_indicators")
+        advanced_settings(key_prefix="predict_adv")
+
+    if not ticker:
+        st.info("Enter a ticker symbol in the sidebar to get started.")
+        return
+
+    if not selected_indicators:
+        st.warning("Select at least one indicator.")
+        return
+
+    record_recent_ticker(ticker)
+
+    if live:
+        _live_signals(ticker, live_interval, selected_indicators, horizon)
+        return
+
+    # Fetch data with warmup for short periods
+    try:
+        with st.spinner("Fetching data..."):
+            full_df, display_df = fetch_with_warmup(ticker, period=period)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    except Exception as e:
+        st.error(f"Unexpected error fetching data: {e}")
+        return
+
+    try:
+        # Check data sufficiency against full (warmup) data
+        data_warnings = check_data_sufficiency(len(full_df), selected_indicators)
+        if data_warnings:
+            st.warning(
+                f"Insufficient data for {len(data_warnings)} indicator(s) "
+                f"({len(full_df)} bars available):\n\n" + "\n".join(f"- {w}" for w in data_warnings)
+                + "\n\nThese will report HOLD. Use a longer period for full analysis."
+            )
+
+        # Build selected indicators
+        all_indicators = get_all_indicators()
+        chosen = {n: all_indicators[n] for n in selected_indicators if n in all_indicators}
+
+        # Compute indicators on full data (includes warmup)
+        computed_df = compute_indicators(full_df, chosen)
+
+        # Generate combined signal from full data
+        signal = combine_signals_cached(chosen, computed_df, horizon_days=horizon)
+
+        # Trim computed data to display range for charting
+        computed_display = computed_df.iloc[-len(display_df):]
+    except Exception as e:
+        st.error(f"Error computing signals: {e}")
+        return
+
+    _render_signal_cards(chosen, computed_df, signal, horizon)
+
     # Chart
     overlays = []
     subplot_configs = []
@@ -181,15 +260,4 @@ def render():
         height=700,
     )
 
-    # Indicator breakdown table
-    st.subheader("Indicator Breakdown")
-    rows = []
-    for sig in signal.individual_signals:
-        rows.append({
-            "Indicator": sig.indicator_name,
-            "Direction": sig.direction.value,
-            "Confidence": f"{sig.confidence:.0%}",
-            "Detail": sig.detail,
-        })
-
-    st.table(rows)
+    _render_breakdown(signal)
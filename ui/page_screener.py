@@ -1,13 +1,15 @@
 """Screener page: scan multiple tickers and rank by signal strength."""
 
+import time
+
+import pandas as pd
 import streamlit as st
 
 from config.settings import WATCHLIST_PRESETS
-from data.fetcher import fetch_ohlcv, get_asset_info
 from data.watchlists import delete_watchlist, load_watchlists, save_watchlist
 from indicators.registry import get_all_indicators
 from signals.base import SignalDirection
-from signals.combiner import combine_signals
+from signals.scanner import scan_tickers
 from ui.components import horizon_input, indicator_picker
 
 
@@ -94,54 +96,86 @@ def render():
         all_indicators = get_all_indicators()
         chosen = {n: all_indicators[n] for n in selected_indicators if n in all_indicators}
 
+        unique_tickers = list(dict.fromkeys(tickers))
         results = []
+        failures = []
         progress = st.progress(0, text="Scanning...")
-
-        for i, ticker in enumerate(tickers):
-            progress.progress((i + 1) / len(tickers), text=f"Scanning {ticker}...")
-            try:
-                df = fetch_ohlcv(ticker, period="6mo")
-                computed = df.copy()
-                for indicator in chosen.values():
-                    computed = indicator.compute(computed)
-                signal = combine_signals(chosen, computed, horizon_days=horizon, precomputed=True)
-
-                info = get_asset_info(ticker)
-                name = info["name"] if info else ticker
-                price = df["Close"].iloc[-1]
-                prev_close = df["Close"].iloc[-2] if len(df) > 1 else price
-                change_pct = (price - prev_close) / prev_close * 100
-
-                results.append({
-                    "ticker": ticker,
-                    "name": name,
-                    "price": price,
-                    "change_pct": change_pct,
-                    "direction": signal.direction,
-                    "confidence": signal.confidence,
-                    "reasoning": signal.reasoning,
-                    "scores": signal.scores,
+        live_table = st.empty()
+        scan_start = time.perf_counter()
+
+        for done, res in enumerate(
+            scan_tickers(unique_tickers, chosen, horizon_days=horizon), start=1
+        ):
+            progress.progress(
+                done / len(unique_tickers),
+                text=f"Scanned {res.ticker} ({done}/{len(unique_tickers)})",
+            )
+            if not res.ok:
+                failures.append({
+                    "Ticker": res.ticker,
+                    "Error": res.error,
+                    "Seconds": round(res.total_seconds, 2),
                 })
-            except Exception:
                 continue
 
-        progress.empty()
+            results.append({
+                "ticker": res.ticker,
+                "name": res.name,
+                "price": res.price,
+                "change_pct": res.change_pct,
+                "direction": res.signal.direction,
+                "confidence": res.signal.confidence,
+                "reasoning": res.signal.reasoning,
+                "scores": res.signal.scores,
+                "fetch_seconds": res.fetch_seconds,
+                "compute_seconds": res.compute_seconds,
+            })
+            live_table.dataframe(
+                pd.DataFrame([
+                    {
+                        "Ticker": r["ticker"],
+                        "Signal": r["direction"].value,
+                        "Confidence": f"{r['confidence']:.0%}",
+                        "Price": f"${r['price']:,.2f}",
+                    }
+                    for r in sorted(results, key=lambda r: r["confidence"], reverse=True)
+                ]),
+                use_container_width=True,
+                hide_index=True,
+            )
 
-        if not results:
-            st.warning("No results. All tickers failed to fetch or compute.")
-            return
+        progress.empty()
+        live_table.empty()
 
         # Sort by confidence descending
         results.sort(key=lambda r: r["confidence"], reverse=True)
         st.session_state["screener_results"] = results
+        st.session_state["screener_failures"] = failures
+        st.session_state["screener_elapsed"] = time.perf_counter() - scan_start
+
+        if not results:
+            st.warning("No results. All tickers failed to fetch or compute.")
+
+    failures = st.session_state.get("screener_failures") or []
+    if failures:
+        with st.expander(f"{len(failures)} ticker(s) failed", expanded=False):
+            st.dataframe(pd.DataFrame(failures), use_container_width=True, hide_index=True)
 
     # Display results
     results = st.session_state.get("screener_results")
     if not results:
-        st.info("Click **Scan Watchlist** to analyze tickers.")
+        if not scan_clicked:
+            st.info("Click **Scan Watchlist** to analyze tickers.")
         return
 
     st.markdown(f"**{len(results)} results** — sorted by confidence")
+    elapsed = st.session_state.get("screener_elapsed")
+    if elapsed is not None:
+        slowest = max(results, key=lambda r: r["fetch_seconds"] + r["compute_seconds"])
+        st.caption(
+            f"Scanned in {elapsed:.1f}s — slowest: {slowest['ticker']} "
+            f"(fetch {slowest['fetch_seconds']:.1f}s, compute {slowest['compute_seconds']:.1f}s)"
+        )
 
     for i, r in enumerate(results):
         color = _signal_color(r["direction"])
@@ -196,8 +230,6 @@ def render():
             st.divider()
 
     # CSV export for screener results
-    import pandas as pd
-
     csv_rows = []
     for r in results:
         csv_rows.append({